@@ -8,20 +8,58 @@ from plotly.subplots import make_subplots
 import matplotlib.pyplot as plt
 import seaborn as sns
 from datetime import datetime, timedelta
+import hashlib
+import os
+import time
 import warnings
+from contextlib import ExitStack, contextmanager
+from metrics_export import record_generation, requested_metrics
+from memory_accounting import render_memory_controls, render_memory_panel, requested_memory_accounting
+from rerun_profiler import render_profile_controls, render_profile_report, requested_profiler
+from shared_store import simulation_hash
+from shared_resources import dataset_key, get_live_feed, get_run_store, get_shared_store, load_observed_events
+from html_fragments import FragmentReport, fragment, style_block
+from figure_payload import PayloadReport, optimize_figure
+from calibration import apply_calibration, calibrate, model_specs
+from observed_ingest import merge_observed, to_year_grid
+from webgl_charts import WEBGL_POINT_THRESHOLD, apply_webgl, render_benchmark_page
+from missile_catalog import MissileCatalog
+from range_coverage import LAUNCH_SITES, REFERENCE_PLACES, CoverageIndex, coverage_by_year, max_range_by_year
+import defense_model
+import chart_builders
+import geopolitical_events
+from animation_frames import capabilities_animation, deployment_animation, frame_payload
+from country_profiles import PROFILES, generate_profiles, load_plugins, register_profile
+from composite_index import DEFAULT_METRICS, CompositeIndexEngine, normalize_metrics
+from chart_builders import attach_figure, build_charts
+from process_pool import default_workers, get_pool
+from sensitivity import DEFAULT_SPREAD, STATISTICS, parameter_ranges, sobol, tornado
+from sanctions_impact import PARAMETER_MINIMUMS, RESOLUTIONS, SANCTION_RESPONSES, sanctions_response
+from mobilization_queue import NETWORK, OBJECTIF, mobilization_distributions
+from threat_sensitivity import dominant_threat_plane, grid_weights, sample_weights, sweep, threat_features
 warnings.filterwarnings('ignore')
 
-# Configuration de la page
-st.set_page_config(
-    page_title="Analyse Stratégique Avancée - RPDC",
-    page_icon="⭐",
-    layout="wide",
-    initial_sidebar_state="expanded"
-)
+MAX_SCATTER_POINTS = 20000
+MAX_COVERAGE_SYSTEMS = 12  # au-delà : couverture par type d'ogive
 
-# CSS personnalisé avancé
-st.markdown("""
-<style>
+# Carte de métrique (fragment précompilé, rendus mis en cache par valeurs)
+METRIC_CARD_HTML = """
+<div class="{classe}">
+    <h4>{titre}</h4>
+    <h2>{valeur}</h2>
+    <p>{detail}</p>
+</div>"""
+
+# Configuration de la page (lancement autonome ; l'application multipage a la sienne, cf. app.py)
+PAGE_CONFIG = {
+    "page_title": "Analyse Stratégique Avancée - RPDC",
+    "page_icon": "⭐",
+    "layout": "wide",
+    "initial_sidebar_state": "expanded",
+}
+
+# CSS personnalisé avancé (minifié une fois par processus, cf. html_fragments)
+CSS = """
     .main-header {
         font-size: 2.8rem;
         background: linear-gradient(45deg, #024FA2, #ED1C27, #FFFFFF, #FFCC00);
@@ -84,8 +122,65 @@ st.markdown("""
         border-radius: 10px;
         margin: 0.5rem 0;
     }
-</style>
-""", unsafe_allow_html=True)
+"""
+STYLE_HTML, STYLE_OCTETS_ECONOMISES = style_block(CSS)
+
+@st.cache_resource(max_entries=8)
+def get_coverage_index(origines, n_points):
+    """Index de couverture : grille globale de `n_points`, ou lieux de référence si None"""
+    coordonnees = [LAUNCH_SITES[o] for o in origines]
+    if n_points is None:
+        return CoverageIndex(coordonnees, [p[2] for p in REFERENCE_PLACES], [p[3] for p in REFERENCE_PLACES])
+    return CoverageIndex.global_grid(coordonnees, n_points)
+
+@st.cache_data(max_entries=16)
+def run_threat_sweep(features, resolution, distribution, n_samples):
+    """Balayage des poids de risque (grille dense si `resolution`, sinon tirages)"""
+    if resolution:
+        poids = grid_weights(resolution)
+    else:
+        poids = sample_weights(n_samples, distribution)
+    return sweep(poids, features)
+
+@st.cache_data(max_entries=32)
+def run_tornado(config, annees, ecart, statistique):
+    """Tornado mis en cache par configuration"""
+    return tornado(config, list(annees), parameter_ranges(config, ecart), statistique)
+
+@st.cache_data(max_entries=16)
+def run_sobol(config, annees, ecart, statistique, n, workers):
+    """Indices de Sobol mis en cache par configuration"""
+    return sobol(config, list(annees), parameter_ranges(config, ecart), n, statistique, workers)
+
+@st.cache_data(max_entries=16)
+def run_sanctions_response(annees, series, scenarios, pas_par_an, horizon, n_tirages, reponses):
+    """Réponses aux sanctions mises en cache par séries, grille et noyaux"""
+    return sanctions_response(annees, series, scenarios, pas_par_an, horizon, n_tirages, reponses=reponses)
+
+@st.cache_data(max_entries=16)
+def run_sanctions_figure(annees, series, scenarios, pas_par_an, horizon, n_tirages, reponses, scenario,
+                         webgl_threshold, measure):
+    """Figure des sanctions construite et compactée une fois par sélection, scénarios, pas de temps,
+    tirages et noyaux ; retourne (dict de figure, titre, statistiques, légende du calcul)"""
+    resultat = run_sanctions_response(annees, series, scenarios, pas_par_an, horizon, n_tirages, reponses)
+    temps, metriques = resultat['temps'], resultat['metriques']
+    figure, titre, stats, _ = chart_builders.build_chart(chart_builders.sanctions_effects, dict(
+        temps=temps, metriques=metriques, base=resultat['base'], nominal=resultat['nominal'],
+        quantiles=resultat['quantiles'], scenarios=scenarios, scenario=scenario,
+        evenements=geopolitical_events.annotations(temps, ("sanction",))), webgl_threshold, measure)
+    legende = (f"{len(metriques)} métriques × {len(scenarios)} scénarios × {n_tirages + 1} tirages × "
+               f"{len(temps):,} pas convolués par FFT en {resultat['duree_ms']:.0f} ms")
+    return figure, titre, stats, legende
+
+@st.cache_data(max_entries=16)
+def run_mobilization_queue(etats_modele, n_unites, n_replications, workers):
+    """Distributions de mobilisation mises en cache par états du modèle et taille de simulation"""
+    return mobilization_distributions(etats_modele, n_unites, n_replications, workers)
+
+@st.cache_resource(max_entries=4)
+def load_missile_catalog(chemin, mtime):
+    """Catalogue missilier indexé, rechargé quand le fichier change"""
+    return MissileCatalog.from_file(chemin)
 
 class DefenseCoreeNordDashboardAvance:
     def __init__(self):
@@ -93,6 +188,20 @@ class DefenseCoreeNordDashboardAvance:
         self.programmes_options = self.define_programmes_options()
         self.missile_types = self.define_missile_types()
         self.nuclear_facilities = self.define_nuclear_facilities()
+        self.scenarios_options = self.define_scenarios_options()
+        register_profile("RPDC", self.get_advanced_config("Armée Populaire de Corée"),
+                         description="Profil de référence du dashboard (Armée Populaire de Corée)")
+        self._default_catalog = None
+        self.shared_store = get_shared_store()
+        self.code_version = simulation_hash(type(self), defense_model, geopolitical_events)
+        self.payload_report = PayloadReport()
+        self.fragment_report = FragmentReport()
+        self.measure_payload = False
+        self.webgl_threshold = WEBGL_POINT_THRESHOLD
+        self.profiler = None
+        self.memory = None
+        self.metrics = None
+        self.parallel_charts = False
         
     def define_branches_options(self):
         return [
@@ -107,6 +216,9 @@ class DefenseCoreeNordDashboardAvance:
             "Guerre Électronique", "Reconnaissance Spatiale", "Drones de Combat"
         ]
     
+    def define_scenarios_options(self):
+        return ["Statut Quo", "Escalation Modérée", "Modernisation Accélérée", "Crise Majeure"]
+    
     def define_missile_types(self):
         return {
             "Missiles Balistiques à Courte Portée": {"portee": 1000, "precision": 50, "deploiement": 2010},
@@ -173,6 +285,22 @@ class DefenseCoreeNordDashboardAvance:
         
         return pd.DataFrame(data), config
     
+    def load_advanced_data(self, selection):
+        """Données avancées lues depuis le store partagé (générées une seule fois par hôte)"""
+        config = self.get_advanced_config(selection)
+        df = self.shared_store.get_or_publish(dataset_key("avance", selection),
+                                              lambda: self.timed_generation(selection), self.code_version)
+        return df, config
+    
+    def timed_generation(self, selection):
+        """Génère le jeu de données d'une sélection (durée exportée dans les métriques si actives)"""
+        debut = time.perf_counter()
+        df, config = self.generate_advanced_data(selection)
+        if self.metrics is not None:
+            record_generation("dash", selection, time.perf_counter() - debut)
+        get_run_store().record("dash", selection, "", self.code_version, {"config": config}, df)
+        return df
+    
     def get_advanced_config(self, selection):
         """Configuration avancée avec plus de détails"""
         configs = {
@@ -217,164 +345,105 @@ class DefenseCoreeNordDashboardAvance:
             "priorites": ["defense_generique"]
         })
     
+    def model_coefficients(self, config=None):
+        """Coefficients du modèle vectorisé (bases issues de la configuration)"""
+        return defense_model.coefficients(config)
+    
     def simulate_advanced_budget(self, annees, config):
         """Simulation avancée du budget avec variations géopolitiques"""
-        budget_base = config.get('budget_base', 2.0)
-        budgets = []
-        for annee in annees:
-            base = budget_base * (1 + 0.035 * (annee - 2000))
-            # Variations selon événements géopolitiques
-            if 2006 <= annee <= 2009:  # Période de tensions
-                base *= 1.1
-            elif 2013 <= annee <= 2017:  # Accélération programme nucléaire
-                base *= 1.15
-            elif annee >= 2022:  # Modernisation avancée
-                base *= 1.2
-            budgets.append(base)
-        return budgets
+        return defense_model.budget(annees, self.model_coefficients(config))
     
     def simulate_advanced_personnel(self, annees, config):
         """Simulation avancée des effectifs"""
-        personnel_base = config.get('personnel_base', 100)
-        return [personnel_base * (1 + 0.008 * (annee - 2000)) for annee in annees]
+        return defense_model.personnel(annees, self.model_coefficients(config))
     
     def simulate_military_gdp_percentage(self, annees):
         """Pourcentage du PIB consacré à la défense"""
-        return [22 + 0.2 * (annee - 2000) for annee in annees]  # Estimation élevée
+        return defense_model.military_gdp(annees, self.model_coefficients())
     
     def simulate_advanced_exercises(self, annees, config):
         """Exercices militaires avec saisonnalité"""
-        base = config.get('exercices_base', 30)
-        return [base + 3 * (annee - 2000) + 5 * np.sin(2 * np.pi * (annee - 2000)/4) for annee in annees]
+        return defense_model.exercises(annees, self.model_coefficients(config))
     
     def simulate_advanced_readiness(self, annees):
         """Préparation opérationnelle avancée"""
-        readiness = []
-        for annee in annees:
-            base = 65 + 1.5 * (annee - 2000)
-            if annee >= 2010:
-                base += 5  # Amélioration après modernisation
-            if annee >= 2020:
-                base += 8  # Nouvelles doctrines
-            readiness.append(min(base, 95))
-        return readiness
+        return defense_model.readiness(annees, self.model_coefficients())
     
     def simulate_advanced_deterrence(self, annees):
         """Capacité de dissuasion avancée"""
-        deterrence = []
-        for annee in annees:
-            if annee < 2006:
-                base = 30  # Conventionnel uniquement
-            elif annee < 2013:
-                base = 45  # Début nucléaire
-            elif annee < 2017:
-                base = 65  # ICBM testés
-            else:
-                base = 80 + 2 * (annee - 2017)  # Capacité mature
-            deterrence.append(min(base, 95))
-        return deterrence
+        return defense_model.deterrence(annees, self.model_coefficients())
     
     def simulate_advanced_mobilization(self, annees):
         """Temps de mobilisation avancé"""
-        return [max(72 - 2 * (annee - 2000), 12) for annee in annees]
+        return defense_model.mobilization(annees, self.model_coefficients())
     
     def simulate_detailed_missile_tests(self, annees):
         """Tests de missiles détaillés"""
-        tests = []
-        for annee in annees:
-            if annee < 2006:
-                tests.append(1)
-            elif annee < 2012:
-                tests.append(2 + (annee - 2006))
-            elif annee < 2017:
-                tests.append(8 + 2 * (annee - 2012))
-            else:
-                tests.append(20 + 4 * (annee - 2017))
-        return tests
+        return defense_model.missile_tests(annees, self.model_coefficients())
     
     def simulate_tech_development(self, annees):
         """Développement technologique global"""
-        return [min(30 + 3 * (annee - 2000), 85) for annee in annees]
+        return defense_model.tech_development(annees, self.model_coefficients())
     
     def simulate_artillery_capacity(self, annees):
         """Capacité d'artillerie"""
-        return [min(70 + 2 * (annee - 2000), 95) for annee in annees]
+        return defense_model.artillery(annees, self.model_coefficients())
     
     def simulate_air_defense_coverage(self, annees):
         """Couverture de défense anti-aérienne"""
-        return [min(40 + 3 * (annee - 2000), 85) for annee in annees]
+        return defense_model.air_defense(annees, self.model_coefficients())
     
     def simulate_logistical_resilience(self, annees):
         """Résilience logistique"""
-        return [min(50 + 2.5 * (annee - 2000), 90) for annee in annees]
+        return defense_model.logistics(annees, self.model_coefficients())
     
     def simulate_cyber_capabilities(self, annees):
         """Capacités cybernétiques"""
-        return [min(30 + 4 * (annee - 2000), 88) for annee in annees]
+        return defense_model.cyber(annees, self.model_coefficients())
     
     def simulate_ammunition_production(self, annees):
         """Production de munitions (indice)"""
-        return [min(60 + 2 * (annee - 2000), 95) for annee in annees]
+        return defense_model.ammunition(annees, self.model_coefficients())
     
     def simulate_nuclear_arsenal(self, annees):
         """Évolution du stock d'ogives nucléaires"""
-        stock = []
-        for annee in annees:
-            if annee < 2006:
-                stock.append(0)
-            elif annee < 2013:
-                stock.append(max(5 + (annee - 2006), 10))
-            elif annee < 2017:
-                stock.append(15 + 3 * (annee - 2013))
-            else:
-                stock.append(30 + 4 * (annee - 2017))
-        return stock
+        return defense_model.nuclear_arsenal(annees, self.model_coefficients())
     
     def simulate_missile_range_evolution(self, annees):
         """Évolution de la portée maximale des missiles"""
-        portee = []
-        for annee in annees:
-            if annee < 2006:
-                portee.append(500)
-            elif annee < 2012:
-                portee.append(1000 + 200 * (annee - 2006))
-            elif annee < 2017:
-                portee.append(3000 + 1000 * (annee - 2012))
-            else:
-                portee.append(15000)  # ICBM opérationnels
-        return portee
+        return defense_model.missile_range(annees, self.model_coefficients())
     
     def simulate_mirv_development(self, annees):
         """Développement des têtes multiples"""
-        return [max(0, min(0 + 3 * (annee - 2017), 8)) for annee in annees]
+        return defense_model.mirv(annees, self.model_coefficients())
     
     def simulate_underground_tests(self, annees):
         """Essais souterrains et préparation"""
-        return [min(20 + 2 * (annee - 2000), 80) for annee in annees]
+        return defense_model.underground_tests(annees, self.model_coefficients())
     
     def simulate_missile_accuracy(self, annees):
         """Amélioration de la précision des missiles"""
-        return [max(2000 - 80 * (annee - 2000), 50) for annee in annees]
+        return defense_model.missile_accuracy(annees, self.model_coefficients())
     
     def simulate_launch_success_rate(self, annees):
         """Taux de succès des lancements"""
-        return [min(40 + 3 * (annee - 2000), 92) for annee in annees]
+        return defense_model.launch_success(annees, self.model_coefficients())
     
     def simulate_platform_diversification(self, annees):
         """Diversification des plateformes de lancement"""
-        return [min(20 + 4 * (annee - 2000), 85) for annee in annees]
+        return defense_model.platforms(annees, self.model_coefficients())
     
     def simulate_cyber_attacks(self, annees):
         """Attaques cyber réussies (estimation)"""
-        return [max(5 + 2 * (annee - 2010), 0) for annee in annees]
+        return defense_model.cyber_attacks(annees, self.model_coefficients())
     
     def simulate_cyber_command(self, annees):
         """Réseau de commandement cyber"""
-        return [min(25 + 5 * (annee - 2010), 90) for annee in annees]
+        return defense_model.cyber_command(annees, self.model_coefficients())
     
     def simulate_cyber_defense(self, annees):
         """Capacités de cyber défense"""
-        return [min(35 + 4 * (annee - 2010), 85) for annee in annees]
+        return defense_model.cyber_defense(annees, self.model_coefficients())
     
     def display_advanced_header(self):
         """En-tête avancé avec plus d'informations"""
@@ -416,10 +485,41 @@ class DefenseCoreeNordDashboardAvance:
         show_doctrinal = st.sidebar.checkbox("Analyse doctrinale", value=True)
         show_technical = st.sidebar.checkbox("Détails techniques", value=True)
         threat_assessment = st.sidebar.checkbox("Évaluation des menaces", value=True)
+        animation = st.sidebar.checkbox("Animation temporelle (curseur d'années)", value=False)
         
         # Paramètres de simulation
         st.sidebar.markdown("### ⚙️ PARAMÈTRES DE SIMULATION")
-        scenario = st.sidebar.selectbox("Scénario:", ["Statut Quo", "Escalation Modérée", "Modernisation Accélérée", "Crise Majeure"])
+        scenario = st.sidebar.selectbox("Scénario:", self.scenarios_options)
+        
+        # Calibration sur données observées
+        st.sidebar.markdown("### 📐 CALIBRATION")
+        observations = st.sidebar.file_uploader("Données observées (CSV):", type=["csv"])
+        courbes = st.sidebar.radio("Courbes:", ["Ajustées à la main", "Calibrées"], horizontal=True,
+                                   disabled=observations is None)
+        
+        # Journal d'événements observés (CSV, Parquet ou JSONL, lu par blocs)
+        st.sidebar.markdown("### 📥 DONNÉES OBSERVÉES")
+        journal_observe = st.sidebar.text_input("Journal d'événements (chemin local):",
+                                                value=os.environ.get("RPDC_OBSERVED_EVENTS", ""))
+        
+        # Suivi en continu d'un journal JSONL
+        st.sidebar.markdown("### 📡 MODE OPS")
+        mode_ops = st.sidebar.checkbox("Flux temps réel", value=bool(os.environ.get("RPDC_LIVE_FEED")))
+        flux_ops = st.sidebar.text_input("Journal JSONL suivi:", value=os.environ.get("RPDC_LIVE_FEED", ""),
+                                         disabled=not mode_ops)
+        intervalle_ops = st.sidebar.slider("Rafraîchissement (s):", 1, 60, 5, disabled=not mode_ops)
+        
+        # Outils de performance
+        st.sidebar.markdown("### 🛠️ OUTILS PERFORMANCE")
+        payload_report = st.sidebar.checkbox("Taille des figures (octets)", value=False)
+        webgl_threshold = st.sidebar.number_input("Seuil WebGL (points par figure):", min_value=100,
+                                                  value=WEBGL_POINT_THRESHOLD, step=1000)
+        webgl_benchmark = st.sidebar.checkbox("Page benchmark WebGL", value=False)
+        # Désactivée par défaut : pour deux figures de la taille du dashboard, le pool ne fait pas mieux
+        # que la construction dans le script (aller-retour de sérialisation)
+        parallel_charts = st.sidebar.checkbox("Construction parallèle des figures", value=False)
+        render_profile_controls()
+        render_memory_controls()
         
         return {
             'selection': selection,
@@ -428,9 +528,188 @@ class DefenseCoreeNordDashboardAvance:
             'show_doctrinal': show_doctrinal,
             'show_technical': show_technical,
             'threat_assessment': threat_assessment,
+            'animation': animation,
+            'observations': observations.getvalue() if observations is not None else None,
+            'courbes_calibrees': courbes == "Calibrées" and observations is not None,
+            'journal_observe': journal_observe.strip(),
+            'mode_ops': mode_ops,
+            'flux_ops': flux_ops.strip(),
+            'intervalle_ops': intervalle_ops,
+            'payload_report': payload_report,
+            'webgl_threshold': webgl_threshold,
+            'webgl_benchmark': webgl_benchmark,
+            'parallel_charts': parallel_charts,
             'scenario': scenario
         }
     
+    def apply_observed_calibration(self, df, controls):
+        """Remplace les courbes ajustées à la main par les courbes calibrées si demandé"""
+        if not controls['courbes_calibrees']:
+            return df
+        try:
+            parametres = calibrate(controls['observations'], model_specs(df))
+        except (ValueError, KeyError) as e:
+            st.sidebar.error(f"Calibration impossible: {e}")
+            return df
+        df, ajustees = apply_calibration(df, parametres, controls['selection'])
+        if ajustees:
+            with st.sidebar.expander(f"Qualité d'ajustement ({len(ajustees)} métriques)"):
+                st.dataframe(pd.DataFrame([{'Métrique': m, 'RMSE': p['rmse'], 'Points': p['n']}
+                                           for m, p in ajustees.items()]),
+                             hide_index=True, use_container_width=True)
+        else:
+            st.sidebar.warning("Aucune métrique observée pour cette sélection.")
+        return df
+    
+    def create_observed_comparison(self, df, controls):
+        """Métriques simulées et observées (journal d'événements ingéré par blocs)"""
+        chemin = controls['journal_observe']
+        if not chemin:
+            return
+        st.markdown('<h3 class="section-header">📥 DONNÉES OBSERVÉES vs SIMULÉES</h3>', 
+                   unsafe_allow_html=True)
+        try:
+            agrege, rapport = load_observed_events(chemin, os.path.getmtime(chemin))
+        except (OSError, ValueError) as e:
+            st.error(f"Ingestion impossible: {e}")
+            return
+        fusion, communes = merge_observed(df, to_year_grid(agrege, df['Annee'], controls['selection']))
+        
+        col1, col2, col3 = st.columns(3)
+        col1.metric("Événements lus", f"{rapport['lignes']:,}")
+        col2.metric("Événements valides", f"{rapport['valides']:,}")
+        col3.metric("Rejets", f"{rapport['lignes'] - rapport['valides']:,}",
+                    ", ".join(f"{motif}: {n:,}" for motif, n in rapport['rejets'].items() if n) or None,
+                    delta_color="off")
+        if not communes:
+            st.info("Aucune métrique observée ne correspond aux métriques simulées.")
+            return
+        
+        colonnes = st.columns(len(communes))
+        for col, metrique in zip(colonnes, communes):
+            with col:
+                fig = go.Figure()
+                fig.add_trace(go.Scatter(x=fusion['Annee'], y=fusion[metrique], mode='lines',
+                                         name='Simulé', line=dict(color='#024FA2', width=3)))
+                fig.add_trace(go.Scatter(x=fusion['Annee'], y=fusion[f"{metrique}_Observe"], mode='markers',
+                                         name='Observé', marker=dict(color='#ED1C27', size=8)))
+                fig.update_layout(title=metrique.replace('_', ' '), height=350)
+                self.render_chart(fig)
+    
+    def create_live_feed_panel(self, df, controls):
+        """Mode ops : suivi du journal JSONL avec réexécution partielle périodique"""
+        st.markdown('<h3 class="section-header">📡 FLUX TEMPS RÉEL</h3>', 
+                   unsafe_allow_html=True)
+        chemin = controls['flux_ops']
+        if not chemin:
+            st.info("Indiquez le chemin du journal JSONL à suivre.")
+            return
+        feed = get_live_feed(chemin)
+        selection = controls['selection']
+        annees = df['Annee'].to_numpy()
+        metriques = [m for m in feed.versions if m in df.columns]
+        empreintes = {m: hashlib.sha1(np.ascontiguousarray(df[m].to_numpy()).tobytes()).hexdigest()
+                      for m in metriques}
+        
+        @st.fragment(run_every=controls['intervalle_ops'])
+        def panneau():
+            feed.poll()
+            annee_courante = datetime.now().year
+            kpis = st.columns(len(metriques) + 1)
+            for col, metrique in zip(kpis, metriques):
+                valeur = feed.value(metrique, annee_courante, selection)
+                col.metric(f"{metrique.replace('_', ' ')} ({annee_courante})",
+                           "—" if valeur is None else f"{valeur:,.1f}")
+            kpis[-1].metric("Événements suivis", f"{feed.stats['evenements']:,}",
+                            f"relevé {feed.stats['dernier_releve_ms']:.1f} ms", delta_color="off")
+            
+            # Seules les métriques dont la version du flux ou la série simulée (calibration, journal
+            # observé) a changé sont reconstruites et recompactées ; une figure inchangée est réémise
+            # telle quelle et Streamlit n'en renvoie qu'une référence (cache des messages ≥ 10 Ko).
+            # Session commune aux pages de l'application : cache propre au profil de la vue
+            figures = st.session_state.setdefault('ops_figures_avance', {})
+            colonnes = st.columns(len(metriques))
+            for col, metrique in zip(colonnes, metriques):
+                cle = (chemin, selection, feed.versions[metrique], empreintes[metrique])
+                if figures.get(metrique, (None,))[0] != cle:
+                    fig = go.Figure()
+                    fig.add_trace(go.Scatter(x=annees, y=df[metrique], mode='lines', name='Simulé',
+                                             line=dict(color='#024FA2', width=3)))
+                    fig.add_trace(go.Scatter(x=annees, y=feed.series(metrique, annees, selection),
+                                             mode='markers', name='Flux', marker=dict(color='#ED1C27', size=9)))
+                    fig.update_layout(title=f"{metrique.replace('_', ' ')} - flux", height=350)
+                    with col:
+                        self.render_chart(fig)
+                    figures[metrique] = (cle, fig)
+                else:
+                    col.plotly_chart(figures[metrique][1], use_container_width=True)
+            
+            if feed.recents:
+                with st.expander(f"Derniers événements ({len(feed.recents)})"):
+                    st.dataframe(pd.DataFrame(list(feed.recents)[-20:][::-1],
+                                              columns=['Sélection', 'Métrique', 'Année', 'Valeur']),
+                                 hide_index=True, use_container_width=True)
+        
+        panneau()
+    
+    def render_chart(self, fig):
+        """Bascule en WebGL si besoin, compacte la charge utile puis affiche la figure"""
+        apply_webgl(fig, self.webgl_threshold)
+        stats = optimize_figure(fig, measure=self.measure_payload)
+        self.payload_report.add(fig.layout.title.text, stats)
+        st.plotly_chart(fig, use_container_width=True)
+    
+    def render_charts(self, taches):
+        """Construit les figures indépendantes d'une section dans le pool de processus et les affiche
+        dans leurs emplacements au fil de l'achèvement ; `taches` = [(conteneur, constructeur, kwargs)]"""
+        if not self.parallel_charts or len(taches) < 2:
+            for conteneur, builder, kwargs in taches:
+                with conteneur:
+                    self.render_chart(builder(**kwargs))
+            return
+        emplacements = [conteneur.empty() for conteneur, _, _ in taches]
+        restantes = set(range(len(taches)))
+        try:
+            for i, (figure, titre, stats, _) in build_charts([(b, k) for _, b, k in taches], get_pool(),
+                                                             self.webgl_threshold, self.measure_payload):
+                self.payload_report.add(titre, stats)
+                emplacements[i].plotly_chart(attach_figure(figure), use_container_width=True)
+                restantes.discard(i)
+        except Exception:
+            # Pool indisponible ou construction échouée dans un worker (sérialisation, validation) :
+            # les figures restantes sont construites dans le script
+            for i in sorted(restantes):
+                with emplacements[i].container():
+                    self.render_chart(taches[i][1](**taches[i][2]))
+    
+    def render_html(self, nom, source, **valeurs):
+        """Affiche un fragment HTML précompilé (rendu mis en cache par valeurs d'entrée)"""
+        frag = fragment(nom, source)
+        html, succes, ms = frag.render(valeurs)
+        self.fragment_report.add(frag, succes, ms)
+        st.markdown(html, unsafe_allow_html=True)
+    
+    def display_fragment_report(self):
+        """Octets et millisecondes économisés par les fragments HTML précompilés"""
+        octets, ms_rendu, ms_economisees = self.fragment_report.totals()
+        with st.sidebar.expander("🧩 FRAGMENTS HTML", expanded=True):
+            st.metric("Octets économisés / réexécution", f"{octets / 1024:.1f} Ko")
+            st.metric("Rendu / économisé", f"{ms_rendu:.3f} ms", f"-{ms_economisees:.3f} ms", delta_color="off")
+            st.dataframe(pd.DataFrame(list(self.fragment_report.lignes.values())), hide_index=True,
+                         use_container_width=True)
+    
+    def display_payload_report(self):
+        """Octets transmis par figure, avant et après optimisation"""
+        if not self.payload_report.lignes:
+            return
+        avant, apres = self.payload_report.totals()
+        with st.sidebar.expander("📦 CHARGE UTILE DES FIGURES", expanded=True):
+            st.metric("Total transmis", f"{apres / 1024:.1f} Ko",
+                      f"{(apres - avant) / 1024:+.1f} Ko", delta_color="inverse")
+            rapport = pd.DataFrame(self.payload_report.lignes)
+            rapport['Gain (%)'] = (1 - rapport['octets_apres'] / rapport['octets_avant']) * 100
+            st.dataframe(rapport, hide_index=True, use_container_width=True)
+    
     def display_strategic_metrics(self, df, config):
         """Métriques stratégiques avancées"""
         st.markdown('<h3 class="section-header">🎯 TABLEAU DE BORD STRATÉGIQUE</h3>', 
@@ -444,47 +723,30 @@ class DefenseCoreeNordDashboardAvance:
         col1, col2, col3, col4 = st.columns(4)
         
         with col1:
-            st.markdown("""
-            <div class="metric-card">
-                <h4>💰 BUDGET DÉFENSE 2027</h4>
-                <h2>{:.1f} Md$</h2>
-                <p>📈 {:.1f}% du PIB</p>
-            </div>
-            """.format(data_actuelle['Budget_Defense_Mds'], data_actuelle['PIB_Militaire_Pourcent']), 
-            unsafe_allow_html=True)
+            self.render_html("carte_metrique", METRIC_CARD_HTML, classe="metric-card",
+                             titre="💰 BUDGET DÉFENSE 2027",
+                             valeur=f"{data_actuelle['Budget_Defense_Mds']:.1f} Md$",
+                             detail=f"📈 {data_actuelle['PIB_Militaire_Pourcent']:.1f}% du PIB")
         
         with col2:
-            st.markdown("""
-            <div class="metric-card">
-                <h4>👥 EFFECTIFS TOTAUX</h4>
-                <h2>{:,.0f}K</h2>
-                <p>⚔️ +{:.1f}% depuis 2000</p>
-            </div>
-            """.format(data_actuelle['Personnel_Milliers'], 
-                     ((data_actuelle['Personnel_Milliers'] - data_2000['Personnel_Milliers']) / data_2000['Personnel_Milliers']) * 100), 
-            unsafe_allow_html=True)
+            croissance_effectifs = ((data_actuelle['Personnel_Milliers'] - data_2000['Personnel_Milliers']) /
+                                    data_2000['Personnel_Milliers']) * 100
+            self.render_html("carte_metrique", METRIC_CARD_HTML, classe="metric-card",
+                             titre="👥 EFFECTIFS TOTAUX",
+                             valeur=f"{data_actuelle['Personnel_Milliers']:,.0f}K",
+                             detail=f"⚔️ +{croissance_effectifs:.1f}% depuis 2000")
         
         with col3:
-            st.markdown("""
-            <div class="nuclear-card">
-                <h4>☢️ CAPACITÉ NUCLÉAIRE</h4>
-                <h2>{:.0f}%</h2>
-                <p>🚀 Stock: {} ogives</p>
-            </div>
-            """.format(data_actuelle['Capacite_Dissuasion'], 
-                     int(data_actuelle.get('Stock_Ogives_Nucleaires', 0))), 
-            unsafe_allow_html=True)
+            self.render_html("carte_metrique", METRIC_CARD_HTML, classe="nuclear-card",
+                             titre="☢️ CAPACITÉ NUCLÉAIRE",
+                             valeur=f"{data_actuelle['Capacite_Dissuasion']:.0f}%",
+                             detail=f"🚀 Stock: {int(data_actuelle.get('Stock_Ogives_Nucleaires', 0))} ogives")
         
         with col4:
-            st.markdown("""
-            <div class="cyber-card">
-                <h4>💻 CAPACITÉS CYBER</h4>
-                <h2>{:.0f}%</h2>
-                <p>🔓 {} attaques/an</p>
-            </div>
-            """.format(data_actuelle['Cyber_Capabilities'], 
-                     int(data_actuelle.get('Attaques_Cyber_Reussies', 0))), 
-            unsafe_allow_html=True)
+            self.render_html("carte_metrique", METRIC_CARD_HTML, classe="cyber-card",
+                             titre="💻 CAPACITÉS CYBER",
+                             valeur=f"{data_actuelle['Cyber_Capabilities']:.0f}%",
+                             detail=f"🔓 {int(data_actuelle.get('Attaques_Cyber_Reussies', 0))} attaques/an")
         
         # Deuxième ligne de métriques
         col5, col6, col7, col8 = st.columns(4)
@@ -524,74 +786,71 @@ class DefenseCoreeNordDashboardAvance:
                 f"+{(data_actuelle['Readiness_Operative'] - data_2000['Readiness_Operative']):.1f}%"
             )
     
-    def create_comprehensive_analysis(self, df, config):
+    def create_comprehensive_analysis(self, df, config, animation=False):
         """Analyse complète multidimensionnelle"""
         st.markdown('<h3 class="section-header">📊 ANALYSE MULTIDIMENSIONNELLE</h3>', 
                    unsafe_allow_html=True)
         
-        # Graphiques principaux
+        # Graphiques principaux (construits en parallèle)
         col1, col2 = st.columns(2)
         
-        with col1:
-            # Évolution des capacités principales
-            fig = go.Figure()
-            
-            capacites = ['Readiness_Operative', 'Capacite_Dissuasion', 'Cyber_Capabilities', 'Couverture_AD']
-            noms = ['Préparation Opér.', 'Dissuasion Strat.', 'Capacités Cyber', 'Défense Anti-Aérienne']
-            couleurs = ['#024FA2', '#ED1C27', '#2d3436', '#00b894']
-            
-            for i, (cap, nom, couleur) in enumerate(zip(capacites, noms, couleurs)):
-                if cap in df.columns:
-                    fig.add_trace(go.Scatter(
-                        x=df['Annee'], y=df[cap],
-                        mode='lines', name=nom,
-                        line=dict(color=couleur, width=4),
-                        hovertemplate=f"{nom}: %{{y:.1f}}%<extra></extra>"
-                    ))
-            
-            fig.update_layout(
-                title="📈 ÉVOLUTION DES CAPACITÉS STRATÉGIQUES (2000-2027)",
-                xaxis_title="Année",
-                yaxis_title="Niveau de Capacité (%)",
-                height=500,
-                template="plotly_white",
-                legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1)
-            )
-            st.plotly_chart(fig, use_container_width=True)
+        # Évolution des capacités principales
+        capacites = ['Readiness_Operative', 'Capacite_Dissuasion', 'Cyber_Capabilities', 'Couverture_AD']
+        noms = ['Préparation Opér.', 'Dissuasion Strat.', 'Capacités Cyber', 'Défense Anti-Aérienne']
+        couleurs = ['#024FA2', '#ED1C27', '#2d3436', '#00b894']
+        annees = df['Annee'].to_numpy()
+        if animation:
+            with col1:
+                self.render_animation(capabilities_animation(
+                    annees,
+                    {nom: (df[cap].to_numpy(), couleur)
+                     for cap, nom, couleur in zip(capacites, noms, couleurs) if cap in df.columns},
+                    self.cumulative_indicators(df)))
+        taches = [] if animation else [(col1, chart_builders.capabilities_evolution, {
+            'annees': annees,
+            'capacites': {nom: (df[cap].to_numpy(), couleur)
+                          for cap, nom, couleur in zip(capacites, noms, couleurs) if cap in df.columns},
+            'evenements': geopolitical_events.annotations(annees, ("regime",)),
+        })]
         
-        with col2:
-            # Analyse des programmes stratégiques
-            strategic_data = []
-            strategic_names = []
-            
-            if 'Stock_Ogives_Nucleaires' in df.columns:
-                strategic_data.append(df['Stock_Ogives_Nucleaires'])
-                strategic_names.append('Stock Ogives Nucléaires')
-            
-            if 'Tests_Missiles' in df.columns:
-                strategic_data.append(df['Tests_Missiles'])
-                strategic_names.append('Tests de Missiles')
-            
-            if 'Portee_Max_Missiles_Km' in df.columns:
-                strategic_data.append(df['Portee_Max_Missiles_Km'] / 100)  # Normalisation
-                strategic_names.append('Portée Missiles (km/100)')
-            
-            if strategic_data:
-                fig = make_subplots(specs=[[{"secondary_y": True}]])
-                
-                for i, (data, nom) in enumerate(zip(strategic_data, strategic_names)):
-                    fig.add_trace(
-                        go.Scatter(x=df['Annee'], y=data, name=nom,
-                                 line=dict(width=4)),
-                        secondary_y=(i > 0)
-                    )
-                
-                fig.update_layout(
-                    title="🚀 PROGRAMMES STRATÉGIQUES - ÉVOLUTION COMPARÉE",
-                    height=500,
-                    template="plotly_white"
-                )
-                st.plotly_chart(fig, use_container_width=True)
+        # Analyse des programmes stratégiques
+        strategic_series = {}
+        if 'Stock_Ogives_Nucleaires' in df.columns:
+            strategic_series['Stock Ogives Nucléaires'] = df['Stock_Ogives_Nucleaires'].to_numpy()
+        
+        if 'Tests_Missiles' in df.columns:
+            strategic_series['Tests de Missiles'] = df['Tests_Missiles'].to_numpy()
+        
+        if 'Portee_Max_Missiles_Km' in df.columns:
+            strategic_series['Portée Missiles (km/100)'] = df['Portee_Max_Missiles_Km'].to_numpy() / 100  # Normalisation
+        
+        if strategic_series:
+            taches.append((col2, chart_builders.strategic_programs, {
+                'annees': annees, 'series': strategic_series,
+                'evenements': geopolitical_events.annotations(annees, ("periode", "sanction")),
+            }))
+        self.render_charts(taches)
+    
+    def cumulative_indicators(self, df):
+        """Indicateurs clés cumulés par année (encart des animations)"""
+        indicateurs = {}
+        if 'Portee_Max_Missiles_Km' in df.columns:
+            indicateurs['Portée maximale atteinte'] = (np.maximum.accumulate(df['Portee_Max_Missiles_Km'].to_numpy()),
+                                                       "{:,.0f} km")
+        indicateurs['Tests de missiles cumulés'] = (np.cumsum(df['Tests_Missiles'].to_numpy()), "{:,.0f}")
+        indicateurs['Budget défense cumulé'] = (np.cumsum(df['Budget_Defense_Mds'].to_numpy()), "{:,.1f} Mds $")
+        if 'Stock_Ogives_Nucleaires' in df.columns:
+            indicateurs['Stock d\'ogives'] = (df['Stock_Ogives_Nucleaires'].to_numpy(), "{:,.0f}")
+        indicateurs['Dissuasion maximale'] = (np.maximum.accumulate(df['Capacite_Dissuasion'].to_numpy()), "{:.0f}%")
+        return indicateurs
+    
+    def render_animation(self, fig):
+        """Affiche une figure animée (images en deltas, lecture côté navigateur) et sa charge utile"""
+        octets_images, octets_base = frame_payload(fig)
+        self.render_chart(fig)
+        st.caption(f"{len(fig.frames)} images : {octets_images / 1024:.1f} Ko en deltas "
+                   f"(≈ {len(fig.frames) * octets_base / 1024:,.0f} Ko en figures complètes) • "
+                   f"curseur et lecture sans réexécution")
     
     def create_geopolitical_analysis(self, df, config):
         """Analyse géopolitique avancée"""
@@ -624,22 +883,16 @@ class DefenseCoreeNordDashboardAvance:
             """, unsafe_allow_html=True)
         
         with col2:
-            # Analyse des sanctions
-            sanctions_data = {
-                'Année': [2006, 2009, 2013, 2016, 2017, 2022],
-                'Sanctions': ['Résolution 1718', 'Résolution 1874', 'Résolution 2094', 
-                            'Résolution 2270', 'Résolution 2371', 'Nouvelles sanctions'],
-                'Impact': [3, 5, 6, 7, 8, 8]  # sur 10
-            }
-            sanctions_df = pd.DataFrame(sanctions_data)
+            # Analyse des sanctions (table d'événements, impact sur 10)
+            sanctions_df = geopolitical_events.sanctions()
             
-            fig = px.bar(sanctions_df, x='Année', y='Impact', 
+            fig = px.bar(sanctions_df, x='Année', y='Impact', hover_name='Sanctions',
                         title="📉 IMPACT DES SANCTIONS INTERNATIONALES",
                         labels={'Impact': 'Niveau d\'Impact'},
                         color='Impact',
                         color_continuous_scale='reds')
             fig.update_layout(height=400)
-            st.plotly_chart(fig, use_container_width=True)
+            self.render_chart(fig)
             
             # Indice d'autosuffisance
             autosuffisance = [min(55 + 2 * (annee - 2000), 85) for annee in df['Annee']]
@@ -648,7 +901,118 @@ class DefenseCoreeNordDashboardAvance:
                          labels={'x': 'Année', 'y': 'Niveau d\'Autosuffisance (%)'})
             fig.update_traces(fillcolor='rgba(237, 28, 39, 0.3)', line_color='#ED1C27')
             fig.update_layout(height=300)
-            st.plotly_chart(fig, use_container_width=True)
+            chart_builders.annotate_events(fig, geopolitical_events.annotations(df['Annee'], ("sanction",)))
+            self.render_chart(fig)
+        
+        self.create_range_coverage(df)
+    
+    def create_sanctions_impact(self, df, controls):
+        """Effet des sanctions propagé par noyaux de retard (convolution FFT, scénarios × tirages)"""
+        st.markdown('<h3 class="section-header">📉 IMPACT DIFFÉRÉ DES SANCTIONS</h3>', 
+                   unsafe_allow_html=True)
+        
+        annees = df['Annee'].to_numpy()
+        col_a, col_b, col_c = st.columns(3)
+        with col_a:
+            resolution = st.selectbox("Pas de temps:", list(RESOLUTIONS), index=2)
+        with col_b:
+            horizon = st.slider("Horizon:", int(annees[-1]), 2100, int(annees[-1]))
+        with col_c:
+            n_tirages = st.select_slider("Tirages Monte Carlo:", [0, 200, 500, 1000, 2000], value=500)
+        with st.expander("⚙️ Noyaux de retard (réponse à une sanction d'impact 10)"):
+            noyaux = st.data_editor(pd.DataFrame(SANCTION_RESPONSES).T, key="noyaux_sanctions", column_config={
+                nom: st.column_config.NumberColumn(min_value=minimum, required=True)
+                for nom, minimum in PARAMETER_MINIMUMS.items()})
+        reponses = {m: {k: float(v) for k, v in ligne.items()} for m, ligne in noyaux.iterrows()}
+        series = {m: np.asarray(df[m], dtype=np.float64) for m in reponses if m in df.columns}
+        if not series:
+            st.info("Aucune métrique sanctionnable dans cette sélection.")
+            return
+        
+        try:
+            figure, titre, stats, legende = run_sanctions_figure(
+                annees, series, self.scenarios_options, RESOLUTIONS[resolution], horizon, n_tirages, reponses,
+                controls['scenario'], self.webgl_threshold, self.measure_payload)
+        except ValueError as e:
+            st.error(f"Noyaux de retard invalides : {e}")
+            return
+        st.caption(legende)
+        self.payload_report.add(titre, stats)
+        st.plotly_chart(attach_figure(figure), use_container_width=True)
+    
+    def create_range_coverage(self, df):
+        """Couverture géographique des portées (grille hors ligne et lieux de référence)"""
+        st.markdown('<h3 class="section-header">🛰️ COUVERTURE GÉOGRAPHIQUE DES PORTÉES</h3>', 
+                   unsafe_allow_html=True)
+        
+        col_a, col_b, col_c = st.columns(3)
+        with col_a:
+            origines = st.multiselect("Sites de lancement:", list(LAUNCH_SITES), default=list(LAUNCH_SITES))
+        with col_b:
+            n_points = st.selectbox("Résolution de la grille:", [10_000, 100_000, 1_000_000], index=1,
+                                    format_func=lambda n: f"{n:,} points")
+        with col_c:
+            annee = st.slider("Année de référence:", int(df['Annee'].min()), int(df['Annee'].max()),
+                              int(df['Annee'].max()))
+        if not origines:
+            st.info("Sélectionnez au moins un site de lancement.")
+            return
+        
+        debut = time.perf_counter()
+        grille = get_coverage_index(tuple(origines), n_points)
+        lieux = get_coverage_index(tuple(origines), None)
+        # Systèmes du catalogue de la base missilière (fichier local ou systèmes de référence) ; au-delà
+        # de MAX_COVERAGE_SYSTEMS, une courbe par type d'ogive (portée maximale déployée du type)
+        try:
+            catalog = self.get_missile_catalog(self.missile_catalog_path())
+        except (OSError, ValueError):
+            catalog = self.get_missile_catalog("")
+        portees = catalog.columns['portee']
+        deploiements = catalog.columns['deploiement']
+        annees = df['Annee'].to_numpy()
+        if catalog.size <= MAX_COVERAGE_SYSTEMS:
+            noms = list(catalog.systeme)
+            couverture = coverage_by_year(grille, portees, deploiements, annees) * 100
+        else:
+            noms = [f"Ogive {o}" for o in catalog.categories['ogive']]
+            couverture = grille.fraction(max_range_by_year(portees, deploiements, catalog.codes['ogive'],
+                                                           len(noms), annees)) * 100
+        deployes = deploiements <= annee
+        portee_annee = portees[deployes].max() if deployes.any() else 0.0
+        if 'Portee_Max_Missiles_Km' in df.columns:
+            portee_annee = max(portee_annee, float(df.loc[df['Annee'] == annee, 'Portee_Max_Missiles_Km'].iloc[0]))
+        duree_ms = (time.perf_counter() - debut) * 1000
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            fig = go.Figure()
+            for nom, serie in zip(noms, couverture):
+                fig.add_trace(go.Scatter(x=annees, y=serie, mode='lines', name=nom,
+                                         hovertemplate=f"{nom}: %{{y:.1f}}%<extra></extra>"))
+            if 'Portee_Max_Missiles_Km' in df.columns:
+                fig.add_trace(go.Scatter(x=annees, y=grille.fraction(df['Portee_Max_Missiles_Km'].to_numpy()) * 100,
+                                         mode='lines', name='Portée maximale',
+                                         line=dict(color='#ED1C27', width=4, dash='dot')))
+            fig.add_vline(x=annee, line_dash="dash", line_color="#024FA2")
+            fig.update_layout(title="🌐 SURFACE TERRESTRE À PORTÉE (%)",
+                              xaxis_title="Année", yaxis_title="Surface couverte (%)",
+                              height=450, template="plotly_white",
+                              legend=dict(orientation="h", yanchor="top", y=-0.15))
+            self.render_chart(fig)
+        
+        with col2:
+            st.metric(f"🎯 Portée maximale {annee}", f"{portee_annee:,.0f} km",
+                      f"{grille.fraction(portee_annee) * 100:.1f}% du globe • calcul {duree_ms:.1f} ms",
+                      delta_color="off")
+            a_portee = lieux.within(portee_annee)
+            lieux_df = pd.DataFrame({
+                'Lieu': [p[0] for p in REFERENCE_PLACES],
+                'Zone': [p[1] for p in REFERENCE_PLACES],
+                'Distance (km)': lieux.distances.round(0),
+                'À portée': np.where(a_portee, '✅', '—')
+            }).sort_values('Distance (km)')
+            st.dataframe(lieux_df, hide_index=True, use_container_width=True, height=330)
     
     def create_technical_analysis(self, df, config):
         """Analyse technique détaillée"""
@@ -657,45 +1021,28 @@ class DefenseCoreeNordDashboardAvance:
         
         col1, col2 = st.columns(2)
         
-        with col1:
-            # Analyse des systèmes d'armes
-            systems_data = {
-                'Système': ['Artillerie K9', 'MLRS 240mm', 'Missiles KN-23', 'ICBM Hwasong-17', 
-                           'Sous-marins Classe Sinpo', 'Drones de Reconnaissance'],
-                'Portée (km)': [40, 60, 450, 15000, 2000, 500],
-                'Précision (m)': [50, 100, 50, 500, 1000, 10],
-                'Statut': ['Déployé', 'Déployé', 'Déployé', 'Testé', 'Développement', 'Opérationnel']
-            }
-            systems_df = pd.DataFrame(systems_data)
-            
-            fig = px.scatter(systems_df, x='Portée (km)', y='Précision (m)', 
-                           size='Portée (km)', color='Statut',
-                           hover_name='Système', log_x=True,
-                           title="🎯 CARACTÉRISTIQUES DES SYSTÈMES D'ARMES",
-                           size_max=30)
-            fig.update_layout(height=500)
-            st.plotly_chart(fig, use_container_width=True)
+        # Analyse des systèmes d'armes
+        systems_data = {
+            'Système': ['Artillerie K9', 'MLRS 240mm', 'Missiles KN-23', 'ICBM Hwasong-17', 
+                       'Sous-marins Classe Sinpo', 'Drones de Reconnaissance'],
+            'Portée (km)': [40, 60, 450, 15000, 2000, 500],
+            'Précision (m)': [50, 100, 50, 500, 1000, 10],
+            'Statut': ['Déployé', 'Déployé', 'Déployé', 'Testé', 'Développement', 'Opérationnel']
+        }
+        
+        # Analyse de la modernisation
+        modernization_data = {
+            'Domaine': ['Forces Conventionnelles', 'Missiles Stratégiques', 
+                      'Défense Anti-Aérienne', 'Capacités Cyber', 'Forces Spéciales'],
+            'Niveau 2000': [40, 20, 30, 10, 60],
+            'Niveau 2027': [75, 85, 70, 80, 90]
+        }
+        self.render_charts([
+            (col1, chart_builders.weapon_systems, {'systems_data': systems_data}),
+            (col2, chart_builders.modernization, {'modernization_data': modernization_data}),
+        ])
         
         with col2:
-            # Analyse de la modernisation
-            modernization_data = {
-                'Domaine': ['Forces Conventionnelles', 'Missiles Stratégiques', 
-                          'Défense Anti-Aérienne', 'Capacités Cyber', 'Forces Spéciales'],
-                'Niveau 2000': [40, 20, 30, 10, 60],
-                'Niveau 2027': [75, 85, 70, 80, 90]
-            }
-            modern_df = pd.DataFrame(modernization_data)
-            
-            fig = go.Figure()
-            fig.add_trace(go.Bar(name='2000', x=modern_df['Domaine'], y=modern_df['Niveau 2000'],
-                                marker_color='#024FA2'))
-            fig.add_trace(go.Bar(name='2027', x=modern_df['Domaine'], y=modern_df['Niveau 2027'],
-                                marker_color='#ED1C27'))
-            
-            fig.update_layout(title="📈 MODERNISATION DES CAPACITÉS MILITAIRES",
-                             barmode='group', height=500)
-            st.plotly_chart(fig, use_container_width=True)
-            
             # Cartographie des installations
             st.markdown("""
             <div class="nuclear-card">
@@ -715,7 +1062,7 @@ class DefenseCoreeNordDashboardAvance:
         col1, col2, col3 = st.columns(3)
         
         with col1:
-            st.markdown("""
+            self.render_html("doctrine_juche", """
             <div class="juche-card">
                 <h4>🎯 PRINCIPE JUCHE</h4>
                 <p><strong>Autosuffisance:</strong> Développement autonome</p>
@@ -723,10 +1070,10 @@ class DefenseCoreeNordDashboardAvance:
                 <p><strong>Conscience:</strong> Rôle des masses</p>
                 <p><strong>Créativité:</strong> Adaptation continue</p>
             </div>
-            """, unsafe_allow_html=True)
+            """)
         
         with col2:
-            st.markdown("""
+            self.render_html("doctrine_songun", """
             <div class="juche-card">
                 <h4>⚔️ DOCTRINE SONGUN</h4>
                 <p><strong>Primauté militaire:</strong> Armée d'abord</p>
@@ -734,10 +1081,10 @@ class DefenseCoreeNordDashboardAvance:
                 <p><strong>Dissuasion asymétrique:</strong> Faible vs Fort</p>
                 <p><strong>Riposte massive:</strong> Réponse écrasante</p>
             </div>
-            """, unsafe_allow_html=True)
+            """)
         
         with col3:
-            st.markdown("""
+            self.render_html("strategie_defensive", """
             <div class="juche-card">
                 <h4>🛡️ STRATÉGIE DÉFENSIVE</h4>
                 <p><strong>Défense proactive:</strong> Prévention active</p>
@@ -745,10 +1092,10 @@ class DefenseCoreeNordDashboardAvance:
                 <p><strong>Forces spéciales:</strong> Opérations derrière lignes</p>
                 <p><strong>Artillerie massive:</strong> Frappe préemptive</p>
             </div>
-            """, unsafe_allow_html=True)
+            """)
         
         # Principes opérationnels
-        st.markdown("""
+        self.render_html("principes_operationnels", """
         <div class="success-card">
             <h4>🎖️ PRINCIPES OPÉRATIONNELS DE L'ARMÉE POPULAIRE</h4>
             <div style="display: grid; grid-template-columns: repeat(2, 1fr); gap: 1rem; margin-top: 1rem;">
@@ -760,7 +1107,7 @@ class DefenseCoreeNordDashboardAvance:
                 <div><strong>• Préparation logistique:</strong> Autosuffisance en munitions</div>
             </div>
         </div>
-        """, unsafe_allow_html=True)
+        """)
     
     def create_threat_assessment(self, df, config):
         """Évaluation avancée des menaces"""
@@ -785,7 +1132,7 @@ class DefenseCoreeNordDashboardAvance:
                            title="🎯 MATRICE RISQUES - PROBABILITÉ VS IMPACT",
                            size_max=30)
             fig.update_layout(height=500)
-            st.plotly_chart(fig, use_container_width=True)
+            self.render_chart(fig)
         
         with col2:
             # Capacités de réponse
@@ -805,7 +1152,10 @@ class DefenseCoreeNordDashboardAvance:
             ])
             fig.update_layout(title="🛡️ CAPACITÉS DE RÉPONSE PAR SCÉNARIO",
                              barmode='group', height=500)
-            st.plotly_chart(fig, use_container_width=True)
+            self.render_chart(fig)
+        
+        if st.checkbox("🔬 Mode sensibilité (balayage des poids)", value=False):
+            self.create_threat_sensitivity(threats_df)
         
         # Recommandations stratégiques
         st.markdown("""
@@ -822,100 +1172,706 @@ class DefenseCoreeNordDashboardAvance:
         </div>
         """, unsafe_allow_html=True)
     
-    def create_missile_database(self):
-        """Base de données des systèmes missiliers"""
+    def create_threat_sensitivity(self, threats_df):
+        """Stabilité du classement des menaces sous balayage des poids du score de risque"""
+        st.markdown("#### 🔬 SENSIBILITÉ DU CLASSEMENT DES MENACES")
+        col_a, col_b, col_c = st.columns(3)
+        with col_a:
+            mode = st.radio("Poids:", ["Grille dense", "Échantillonnage"], horizontal=True)
+        with col_b:
+            if mode == "Grille dense":
+                resolution = st.slider("Points par axe (combinaisons = n³):", 10, 100, 100)
+                distribution, n_samples = None, 0
+            else:
+                distribution = st.selectbox("Loi des poids:", ["dirichlet", "uniforme", "normale"])
+                resolution = 0
+        with col_c:
+            if mode == "Grille dense":
+                poids_vulnerabilite = st.slider("Poids vulnérabilité (plan de dominance):", 0.0, 1.0, 0.5)
+            else:
+                n_samples = st.select_slider("Tirages:", [10_000, 100_000, 1_000_000], value=1_000_000)
+                poids_vulnerabilite = 0.5
+        
+        features = threat_features(threats_df['Probabilité'], threats_df['Impact'],
+                                   threats_df['Niveau Préparation'])
+        debut = time.perf_counter()
+        resultat = run_threat_sweep(features, resolution, distribution, n_samples)
+        duree = time.perf_counter() - debut
+        menaces = threats_df['Type de Menace'].tolist()
+        n_combinaisons = resolution ** 3 if mode == "Grille dense" else n_samples
+        
+        col1, col2, col3 = st.columns(3)
+        col1.metric("Combinaisons évaluées", f"{n_combinaisons:,}", f"{duree * 1000:.0f} ms", delta_color="off")
+        col2.metric("Classement modifié", f"{resultat['part_modifiee'] * 100:.1f}%")
+        col3.metric(f"« {menaces[int(np.argmin(resultat['rang_reference']))]} » reste n°1",
+                    f"{resultat['part_top_stable'] * 100:.1f}%")
+        
+        col1, col2 = st.columns(2)
+        with col1:
+            fig = px.imshow(resultat['frequence'] * 100, x=[f"Rang {r + 1}" for r in range(len(menaces))],
+                            y=menaces, color_continuous_scale='reds', text_auto='.0f', aspect='auto',
+                            title="📊 STABILITÉ DES RANGS (% DES COMBINAISONS)")
+            fig.update_layout(height=450)
+            self.render_chart(fig)
+        with col2:
+            axe, dominante = dominant_threat_plane(features, 101, poids_vulnerabilite)
+            fig = go.Figure(go.Heatmap(
+                x=axe, y=axe, z=dominante.T, colorscale='Turbo', zmin=0, zmax=len(menaces) - 1,
+                customdata=np.array(menaces, dtype=object)[dominante.T],
+                hovertemplate="w_p=%{x:.2f} • w_i=%{y:.2f}<br>%{customdata}<extra></extra>",
+                colorbar=dict(tickvals=list(range(len(menaces))), ticktext=menaces)))
+            fig.update_layout(title="🎯 MENACE DOMINANTE - PLAN (PROBABILITÉ, IMPACT)",
+                              xaxis_title="Poids probabilité", yaxis_title="Poids impact", height=450)
+            self.render_chart(fig)
+        
+        decalages = pd.DataFrame({
+            'Type de Menace': menaces,
+            'Rang de référence': resultat['rang_reference'] + 1,
+            'Décalage moyen de rang': resultat['decalage_moyen'].round(2)
+        }).sort_values('Rang de référence')
+        st.dataframe(decalages, hide_index=True, use_container_width=True)
+    
+    def create_missile_database(self, animation=False):
+        """Base de données des systèmes missiliers (catalogue indexé, table virtualisée)"""
         st.markdown('<h3 class="section-header">🚀 BASE DE DONNÉES DES SYSTÈMES MISSILIERS</h3>', 
                    unsafe_allow_html=True)
         
-        missile_data = []
-        for nom, specs in self.missile_types.items():
-            missile_data.append({
-                'Système': nom,
-                'Portée (km)': specs['portee'],
-                'Précision CEP (m)': specs['precision'],
-                'Année Déploiement': specs['deploiement'],
-                'Statut': 'Opérationnel' if specs['deploiement'] < 2020 else 'Développement',
-                'Type Ogive': 'Conventionnelle/Nucléaire' if specs['portee'] > 1000 else 'Conventionnelle'
-            })
+        chemin = st.text_input("Catalogue local (CSV/Parquet):",
+                               value=os.environ.get("RPDC_MISSILE_CATALOG", ""), key="catalogue_missilier",
+                               placeholder="Vide : systèmes de référence du dashboard")
+        try:
+            catalog = self.get_missile_catalog(chemin.strip())
+        except (OSError, ValueError) as e:
+            st.error(f"Catalogue illisible: {e}")
+            catalog = self.get_missile_catalog("")
+        if not catalog.size:
+            st.info("Catalogue vide : aucun système à afficher.")
+            return
+        
+        # Filtres indexés
+        col_f1, col_f2, col_f3 = st.columns(3)
+        with col_f1:
+            portee = self.range_filter("Portée (km):", catalog.bounds('portee'))
+            statuts = st.multiselect("Statut:", catalog.categories['statut'],
+                                     default=catalog.categories['statut'])
+        with col_f2:
+            precision = self.range_filter("Précision CEP (m):", catalog.bounds('precision'))
+            ogives = st.multiselect("Type d'ogive:", catalog.categories['ogive'],
+                                    default=catalog.categories['ogive'])
+        with col_f3:
+            deploiement = self.range_filter("Année de déploiement:", catalog.bounds('deploiement'), int)
+            tri = st.selectbox("Tri:", ["Portée (km)", "Précision CEP (m)", "Année Déploiement"])
+        if not statuts or not ogives:
+            st.info("Sélectionnez au moins un statut et un type d'ogive.")
+            return
         
-        missiles_df = pd.DataFrame(missile_data)
+        debut = time.perf_counter()
+        lignes = catalog.query(
+            ranges={'portee': portee, 'precision': precision, 'deploiement': deploiement},
+            categories={'statut': statuts, 'ogive': ogives},
+            sort_by={'Portée (km)': 'portee', 'Précision CEP (m)': 'precision',
+                     'Année Déploiement': 'deploiement'}[tri],
+            descending=True
+        )
+        duree_ms = (time.perf_counter() - debut) * 1000
         
         # Affichage interactif
         col1, col2 = st.columns([2, 1])
         
         with col1:
-            fig = px.scatter(missiles_df, x='Portée (km)', y='Précision CEP (m)',
-                           size='Portée (km)', color='Type Ogive',
-                           hover_name='Système', log_x=True, log_y=True,
-                           title="🎯 CARACTÉRISTIQUES DES SYSTÈMES MISSILIERS",
-                           size_max=30)
-            fig.update_layout(height=500)
-            st.plotly_chart(fig, use_container_width=True)
+            # Échantillon régulier au-delà de MAX_SCATTER_POINTS pour borner la charge utile
+            pas = max(1, len(lignes) // MAX_SCATTER_POINTS)
+            missiles_df = catalog.frame(np.sort(lignes[::pas]))
+            if animation and len(missiles_df):
+                couleurs = dict(zip(catalog.categories['ogive'], px.colors.qualitative.Plotly * 10))
+                deploiements = missiles_df['Année Déploiement'].to_numpy()
+                self.render_animation(deployment_animation(
+                    np.arange(deploiements.min(), deploiements.max() + 1), missiles_df['Système'],
+                    missiles_df['Portée (km)'], missiles_df['Précision CEP (m)'], deploiements,
+                    missiles_df['Type Ogive'], couleurs))
+            else:
+                fig = px.scatter(missiles_df, x='Portée (km)', y='Précision CEP (m)',
+                               size='Portée (km)', color='Type Ogive',
+                               hover_name='Système', log_x=True, log_y=True,
+                               title="🎯 CARACTÉRISTIQUES DES SYSTÈMES MISSILIERS",
+                               size_max=30)
+                fig.update_layout(height=500)
+                self.render_chart(fig)
         
         with col2:
-            st.markdown("""
+            self.render_html("inventaire_missilier", """
             <div class="nuclear-card">
                 <h4>📋 INVENTAIRE MISSILISTIQUE</h4>
-            """, unsafe_allow_html=True)
-            
-            for missile in missile_data:
-                st.markdown(f"""
-                <div style="background: rgba(255,255,255,0.1); padding: 0.5rem; margin: 0.2rem 0; border-radius: 5px;">
-                    <strong>{missile['Système']}</strong><br>
-                    📏 {missile['Portée (km)']:,} km • 🎯 {missile['Précision CEP (m)']} m<br>
-                    📅 {missile['Année Déploiement']} • {missile['Statut']}
-                </div>
-                """, unsafe_allow_html=True)
+                <p>{selection:,} / {total:,} systèmes • filtrage {duree_ms:.1f} ms</p>
+            </div>
+            """, selection=len(lignes), total=catalog.size, duree_ms=round(duree_ms, 1))
             
-            st.markdown("</div>", unsafe_allow_html=True)
+            taille_page = st.selectbox("Lignes par page:", [25, 100, 500, 1000], index=1)
+            nb_pages = max(1, -(-len(lignes) // taille_page))
+            page = st.number_input(f"Page (1-{nb_pages}):", min_value=1, max_value=nb_pages, value=1)
+            st.dataframe(catalog.page(lignes, page - 1, taille_page), hide_index=True,
+                         use_container_width=True, height=420)
+    
+    def range_filter(self, libelle, bornes, type_=float):
+        """Curseur d'intervalle sur les bornes d'une colonne ; sans filtre si toutes les valeurs sont égales"""
+        bas, haut = type_(bornes[0]), type_(bornes[1])
+        if bas >= haut:
+            st.caption(f"{libelle} {bas} (valeur unique)")
+            return None
+        return st.slider(libelle, bas, haut, (bas, haut))
+    
+    def missile_catalog_path(self):
+        """Chemin du catalogue saisi dans la base missilière (à défaut RPDC_MISSILE_CATALOG)"""
+        return st.session_state.get("catalogue_missilier", os.environ.get("RPDC_MISSILE_CATALOG", "")).strip()
+    
+    def get_missile_catalog(self, chemin):
+        """Catalogue indexé : fichier local si fourni, sinon `define_missile_types`"""
+        if chemin:
+            return load_missile_catalog(chemin, os.path.getmtime(chemin))
+        if self._default_catalog is None:
+            self._default_catalog = MissileCatalog.from_missile_types(self.missile_types)
+        return self._default_catalog
     
     def run_advanced_dashboard(self):
-        """Exécute le dashboard avancé complet"""
+        """Exécute le dashboard avancé complet (profilé / mesuré si demandé pour cette session)"""
+        self.profiler = requested_profiler()
+        self.memory = requested_memory_accounting()
+        self.metrics = requested_metrics("dash", self.shared_store, "avance")
+        st.markdown(STYLE_HTML, unsafe_allow_html=True)
+        with ExitStack() as pile:
+            for observateur in (self.profiler, self.memory, self.metrics):
+                if observateur is not None:
+                    pile.enter_context(observateur)
+            self.render_advanced_dashboard()
+            if self.memory is not None:
+                self.account_memory()
+        if self.profiler is not None:
+            render_profile_report(self.profiler)
+        if self.memory is not None:
+            render_memory_panel(self.memory)
+    
+    @contextmanager
+    def section(self, nom):
+        """Section instrumentée de la réexécution (attribution du profil, de la mémoire et des latences)"""
+        with ExitStack() as pile:
+            for observateur in (self.profiler, self.memory, self.metrics):
+                if observateur is not None:
+                    pile.enter_context(observateur.section(nom))
+            yield
+    
+    def account_memory(self):
+        """Tailles profondes des DataFrames générés et des figures en cache"""
+        for cle, df in self.shared_store.attached_frames().items():
+            self.memory.account(f"DataFrame {cle}", df)
+        self.memory.account("Rapport de charge utile", self.payload_report)
+        if self._default_catalog is not None:
+            self.memory.account("Catalogue missilier", self._default_catalog)
+    
+    def render_advanced_dashboard(self):
+        """Corps de la réexécution"""
         # Sidebar avancé
-        controls = self.create_advanced_sidebar()
+        with self.section("Sidebar"):
+            controls = self.create_advanced_sidebar()
+        if self.metrics is not None:
+            self.metrics.selection = controls['selection']
+        self.payload_report = PayloadReport()
+        self.fragment_report = FragmentReport()
+        self.fragment_report.add_style(STYLE_OCTETS_ECONOMISES)
+        self.measure_payload = controls['payload_report']
+        self.webgl_threshold = controls['webgl_threshold']
+        self.parallel_charts = controls['parallel_charts']
+        
+        if controls['webgl_benchmark']:
+            render_benchmark_page()
+            return
         
         # Header avancé
         self.display_advanced_header()
         
         # Génération des données avancées
-        df, config = self.generate_advanced_data(controls['selection'])
+        with self.section("Données"):
+            df, config = self.load_advanced_data(controls['selection'])
+            df = self.apply_observed_calibration(df, controls)
         
         # Navigation par onglets avancés
-        tab1, tab2, tab3, tab4, tab5, tab6, tab7 = st.tabs([
+        tab1, tab2, tab3, tab4, tab5, tab6, tab7, tab8, tab9, tab10, tab11, tab12 = st.tabs([
             "📊 Tableau de Bord", 
             "🔬 Analyse Technique", 
             "🌍 Contexte Géopolitique", 
             "📚 Doctrine Militaire",
             "⚠️ Évaluation Menaces",
             "🚀 Systèmes d'Armes",
-            "💎 Synthèse Stratégique"
+            "💎 Synthèse Stratégique",
+            "🎚️ Sensibilité",
+            "⚖️ Scénarios",
+            "🧮 Indice Composite",
+            "🗄️ Historique",
+            "🌐 Comparaison Pays"
         ])
         
-        with tab1:
+        with tab1, self.section("Tableau de Bord"):
+            if controls['mode_ops']:
+                self.create_live_feed_panel(df, controls)
             self.display_strategic_metrics(df, config)
-            self.create_comprehensive_analysis(df, config)
+            self.create_comprehensive_analysis(df, config, controls['animation'])
+            self.create_observed_comparison(df, controls)
         
-        with tab2:
+        with tab2, self.section("Analyse Technique"):
             self.create_technical_analysis(df, config)
         
-        with tab3:
+        with tab3, self.section("Contexte Géopolitique"):
             if controls['show_geopolitical']:
                 self.create_geopolitical_analysis(df, config)
+                self.create_sanctions_impact(df, controls)
         
-        with tab4:
+        with tab4, self.section("Doctrine Militaire"):
             if controls['show_doctrinal']:
                 self.create_doctrinal_analysis(config)
         
-        with tab5:
+        with tab5, self.section("Évaluation Menaces"):
             if controls['threat_assessment']:
                 self.create_threat_assessment(df, config)
         
-        with tab6:
+        with tab6, self.section("Systèmes d'Armes"):
             if controls['show_technical']:
-                self.create_missile_database()
+                self.create_missile_database(controls['animation'])
         
-        with tab7:
+        with tab7, self.section("Synthèse Stratégique"):
             self.create_strategic_synthesis(df, config, controls)
+        
+        with tab8, self.section("Sensibilité"):
+            self.create_sensitivity_analysis(df, config)
+        
+        with tab9, self.section("Scénarios"):
+            self.create_scenario_comparison(df, config, controls)
+            self.create_mobilization_queue(df, config, controls)
+        
+        with tab10, self.section("Indice Composite"):
+            self.create_composite_index(controls)
+        
+        with tab11, self.section("Historique"):
+            self.create_run_history(df, config, controls)
+        
+        with tab12, self.section("Comparaison Pays"):
+            self.create_country_comparison(df)
+        
+        self.display_payload_report()
+        if self.measure_payload:
+            self.display_fragment_report()
+    
+    def create_sensitivity_analysis(self, df, config):
+        """Tornado et indices de Sobol des coefficients du modèle"""
+        st.markdown('<h3 class="section-header">🎚️ SENSIBILITÉ AUX COEFFICIENTS DU MODÈLE</h3>', 
+                   unsafe_allow_html=True)
+        
+        col_a, col_b, col_c = st.columns(3)
+        with col_a:
+            metrique = st.selectbox("Métrique:", [c for c in df.columns if c != 'Annee'])
+            statistique = st.radio("Sortie:", list(STATISTICS), format_func=STATISTICS.get, horizontal=True)
+        with col_b:
+            ecart = st.slider("Variation des coefficients (±%):", 5, 50, int(DEFAULT_SPREAD * 100)) / 100
+            n_sobol = st.select_slider("Échantillons Sobol (n):", [256, 1024, 4096, 16384], value=1024)
+        with col_c:
+            calcul_sobol = st.toggle("Indices de Sobol", value=False)
+            workers = st.number_input("Processus (1 = séquentiel):", min_value=1, max_value=default_workers(),
+                                      value=1)
+        
+        annees = tuple(int(a) for a in df['Annee'])
+        tornado_df = run_tornado(config, annees, ecart, statistique)
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            donnees = tornado_df[(tornado_df['Métrique'] == metrique) & (tornado_df['Amplitude'] > 0)]
+            donnees = donnees.nlargest(12, 'Amplitude').iloc[::-1]
+            fig = go.Figure()
+            fig.add_trace(go.Bar(y=donnees['Paramètre'], x=donnees['Bas'], orientation='h',
+                                 name=f'-{ecart:.0%}', marker_color='#024FA2'))
+            fig.add_trace(go.Bar(y=donnees['Paramètre'], x=donnees['Haut'], orientation='h',
+                                 name=f'+{ecart:.0%}', marker_color='#ED1C27'))
+            fig.update_layout(title=f"🌪️ TORNADO - {metrique}", barmode='overlay', height=500,
+                              xaxis_title=f"Écart vs base ({donnees['Base'].iloc[0]:.1f})" if len(donnees) else "")
+            self.render_chart(fig)
+        
+        with col2:
+            if not calcul_sobol:
+                st.info("Activez « Indices de Sobol » pour l'analyse de variance globale "
+                        f"({n_sobol * (len(parameter_ranges(config, ecart)) + 2):,} évaluations du modèle).")
+                return
+            debut = time.perf_counter()
+            premier, total = run_sobol(config, annees, ecart, statistique, n_sobol, workers)
+            duree = time.perf_counter() - debut
+            indices = pd.DataFrame({'S1': premier.loc[metrique], 'ST': total.loc[metrique]})
+            indices = indices[indices['ST'] > 0.005].sort_values('ST').tail(12)
+            fig = go.Figure()
+            fig.add_trace(go.Bar(y=indices.index, x=indices['S1'], orientation='h', name='Premier ordre (S1)',
+                                 marker_color='#024FA2'))
+            fig.add_trace(go.Bar(y=indices.index, x=indices['ST'], orientation='h', name='Total (ST)',
+                                 marker_color='#ED1C27'))
+            fig.update_layout(title=f"📐 INDICES DE SOBOL - {metrique} ({duree:.1f} s)", barmode='group',
+                              height=500)
+            self.render_chart(fig)
+        
+        influents = total.columns[(total > 0.05).any(axis=0)]
+        fig = px.imshow(total[influents], color_continuous_scale='reds', aspect='auto', zmin=0, zmax=1,
+                        title="🗺️ INDICES DE SOBOL TOTAUX - MÉTRIQUES × COEFFICIENTS")
+        fig.update_layout(height=600)
+        self.render_chart(fig)
+    
+    def create_scenario_comparison(self, df, config, controls):
+        """Comparaison des scénarios : séries superposées et écarts à la référence, calculées en un lot"""
+        st.markdown('<h3 class="section-header">⚖️ COMPARAISON DES SCÉNARIOS</h3>', 
+                   unsafe_allow_html=True)
+        
+        annees = df['Annee'].to_numpy()
+        scenarios = self.scenarios_options
+        debut = time.perf_counter()
+        metriques, cube, ecarts, pourcents = defense_model.compare_scenarios(annees, config, scenarios)
+        duree_lot = (time.perf_counter() - debut) * 1000
+        debut = time.perf_counter()
+        defense_model.generate(annees, config)
+        duree_unique = (time.perf_counter() - debut) * 1000
+        
+        col_a, col_b = st.columns([3, 1])
+        with col_a:
+            choix = st.multiselect("Métriques comparées:", metriques,
+                                   default=[m for m in ('Budget_Defense_Mds', 'Capacite_Dissuasion',
+                                                        'Developpement_Technologique', 'Production_Munitions')
+                                            if m in metriques])
+        with col_b:
+            relatif = st.toggle("Écarts en %", value=True)
+        st.caption(f"{len(scenarios)} scénarios × {len(metriques)} métriques en {duree_lot:.2f} ms "
+                   f"(un scénario seul : {duree_unique:.2f} ms) • référence : {scenarios[0]}")
+        
+        couleurs = ['#024FA2', '#ffa502', '#00b894', '#ED1C27']
+        if choix:
+            indices = [metriques.index(m) for m in choix]
+            deltas = pourcents if relatif else ecarts
+            fig = make_subplots(rows=len(choix), cols=2, shared_xaxes=True, vertical_spacing=0.06,
+                                subplot_titles=[t for m in choix for t in (m.replace('_', ' '),
+                                                                           f"Écart à « {scenarios[0]} »")])
+            for ligne, i in enumerate(indices, start=1):
+                for s, scenario in enumerate(scenarios):
+                    largeur = 4 if scenario == controls['scenario'] else 2
+                    style = dict(color=couleurs[s % len(couleurs)], width=largeur)
+                    fig.add_trace(go.Scatter(x=annees, y=cube[i, s], name=scenario, legendgroup=scenario,
+                                             showlegend=ligne == 1, line=style), row=ligne, col=1)
+                    if s > 0:
+                        fig.add_trace(go.Scatter(x=annees, y=deltas[i, s], name=scenario, legendgroup=scenario,
+                                                 showlegend=False, line=style), row=ligne, col=2)
+                fig.add_hline(y=0, line_dash="dot", line_color="gray", row=ligne, col=2)
+            fig.update_layout(title="⚖️ SCÉNARIOS SUPERPOSÉS ET ÉCARTS À LA RÉFÉRENCE",
+                              height=280 * len(choix) + 120, template="plotly_white",
+                              legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1))
+            self.render_chart(fig)
+        
+        # Écart de la dernière année pour toutes les métriques
+        finale = pd.DataFrame(pourcents[:, 1:, -1], index=metriques, columns=scenarios[1:])
+        finale = finale[(finale.abs() > 0.05).any(axis=1)]
+        fig = px.imshow(finale, color_continuous_scale='RdBu_r', color_continuous_midpoint=0, aspect='auto',
+                        text_auto='.1f',
+                        title=f"🗺️ ÉCART EN {int(annees[-1])} PAR MÉTRIQUE (% vs {scenarios[0]})")
+        fig.update_layout(height=max(350, 28 * len(finale) + 150))
+        self.render_chart(fig)
+    
+    def create_mobilization_queue(self, df, config, controls):
+        """Temps de mobilisation simulés par événements discrets (réseau de files, réplications par scénario)"""
+        st.markdown('<h3 class="section-header">🚆 MOBILISATION : SIMULATION À ÉVÉNEMENTS DISCRETS</h3>', 
+                   unsafe_allow_html=True)
+        
+        annees = df['Annee'].to_numpy()
+        scenarios = self.scenarios_options
+        metriques, cube, _, _ = defense_model.compare_scenarios(annees, config, scenarios)
+        if 'Resilience_Logistique' not in metriques or 'Temps_Mobilisation_Jours' not in metriques:
+            st.info("Résilience logistique et temps de mobilisation absents de cette sélection.")
+            return
+        
+        col_a, col_b, col_c = st.columns(3)
+        with col_a:
+            annee = st.select_slider("Année du réseau:", [int(a) for a in annees], value=int(annees[-1]))
+            n_unites = st.select_slider("Unités mobilisées:", [1000, 5000, 20000, 100000], value=5000)
+        with col_b:
+            n_replications = st.select_slider("Réplications par scénario:", [8, 16, 32, 64, 128], value=16)
+            workers = st.number_input("Processus (1 = séquentiel):", min_value=1, max_value=default_workers(),
+                                      value=1, key="processus_mobilisation")
+        with col_c:
+            lancer = st.toggle("Simuler la mobilisation", value=False)
+        
+        # Réseau de l'année : résilience logistique et temps planifié de chaque scénario (modèle annuel)
+        k = int(np.searchsorted(annees, annee))
+        resilience = cube[metriques.index('Resilience_Logistique'), :, k]
+        plan = cube[metriques.index('Temps_Mobilisation_Jours'), :, k]
+        etats = {s: (float(resilience[i]), float(plan[i])) for i, s in enumerate(scenarios)}
+        if not lancer:
+            st.info("Activez « Simuler la mobilisation » pour les distributions par scénario "
+                    f"({len(scenarios) * n_replications * n_unites * (1 + len(NETWORK)):,} événements).")
+            return
+        resultat = run_mobilization_queue(etats, n_unites, n_replications, workers)
+        st.caption(f"{resultat['evenements']:,} événements en {resultat['duree_s']:.1f} s "
+                   f"({resultat['evenements'] / resultat['duree_s'] / 1e6:.2f} M événements/s) • "
+                   f"{n_replications} réplications × {len(scenarios)} scénarios")
+        
+        replications = resultat['replications']
+        colonne = 'Temps de mobilisation (j)'
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            fig = px.box(replications, x='Scénario', y=colonne, color='Scénario', points='all',
+                         title=f"⏱️ TEMPS DE MOBILISATION ({OBJECTIF:.0%} DES UNITÉS) - {annee}")
+            fig.add_trace(go.Scatter(x=scenarios, y=plan, mode='markers', name='Plan (modèle annuel)',
+                                     marker=dict(symbol='diamond', size=12, color='#2d3436')))
+            fig.update_layout(height=480, showlegend=False)
+            self.render_chart(fig)
+        
+        with col2:
+            s = scenarios.index(controls['scenario'])
+            bas, median, haut = np.quantile(resultat['rassemblement'][s], [0.05, 0.5, 0.95], axis=0)
+            fractions = np.linspace(5, 100, len(median))
+            fig = go.Figure()
+            fig.add_trace(go.Scatter(x=np.concatenate([haut, bas[::-1]]),
+                                     y=np.concatenate([fractions, fractions[::-1]]), fill='toself',
+                                     fillcolor='rgba(2, 79, 162, 0.15)', line=dict(width=0), name='P5-P95',
+                                     hoverinfo='skip'))
+            fig.add_trace(go.Scatter(x=median, y=fractions, name='Médiane', line=dict(color='#024FA2', width=3)))
+            fig.add_hline(y=OBJECTIF * 100, line_dash="dash", line_color="#ED1C27")
+            fig.update_layout(title=f"🚆 RASSEMBLEMENT DES UNITÉS - {controls['scenario']}",
+                              xaxis_title="Jours depuis l'ordre de mobilisation", yaxis_title="Unités rassemblées (%)",
+                              height=480)
+            self.render_chart(fig)
+        
+        attentes = [c for c in replications.columns if c.startswith('Attente')]
+        synthese = replications.groupby('Scénario', sort=False).agg(
+            **{'Médiane (j)': (colonne, 'median'),
+               'P5 (j)': (colonne, lambda x: x.quantile(0.05)),
+               'P95 (j)': (colonne, lambda x: x.quantile(0.95))},
+            **{c: (c, 'mean') for c in attentes})
+        synthese.insert(0, 'Plan (j)', plan)
+        synthese.insert(1, 'Résilience (%)', resilience)
+        st.dataframe(synthese.round(2), use_container_width=True)
+    
+    def create_composite_index(self, controls):
+        """Indice composite pondéré des branches et programmes, balayage des poids et stabilité des rangs"""
+        st.markdown('<h3 class="section-header">🧮 INDICE STRATÉGIQUE COMPOSITE</h3>', 
+                   unsafe_allow_html=True)
+        
+        entites = self.branches_options + self.programmes_options
+        # Métriques communes aux entités, relues seulement quand la version du code change
+        memo = st.session_state.get('indice_composite_metriques')
+        if memo is None or memo[0] != self.code_version:
+            frames = {e: self.load_advanced_data(e)[0] for e in entites}
+            communes = [c for c in frames[entites[0]].columns
+                        if c != 'Annee' and all(c in df.columns for df in frames.values())]
+            memo = (self.code_version, communes, frames[entites[0]]['Annee'].to_numpy())
+            st.session_state['indice_composite_metriques'] = memo
+        _, communes, annees = memo
+        col_a, col_b, col_c = st.columns([2, 1, 1])
+        with col_a:
+            metriques = st.multiselect("Métriques de l'indice:", communes,
+                                       default=[m for m in DEFAULT_METRICS if m in communes])
+        with col_b:
+            n_tirages = st.select_slider("Vecteurs de poids balayés:", [1000, 5000, 10000], value=5000)
+        with col_c:
+            dispersion = st.slider("Dispersion des poids (log-normale):", 0.05, 1.0, 0.25)
+        if not metriques:
+            st.info("Sélectionnez au moins une métrique.")
+            return
+        
+        colonnes = st.columns(min(len(metriques), 5))
+        poids = [colonnes[i % len(colonnes)].slider(m.replace('_', ' '), 0.0, 5.0, 1.0, 0.1, key=f"poids_{m}")
+                 for i, m in enumerate(metriques)]
+        
+        # Moteur conservé par session : un poids modifié = mise à jour de rang 1 ; les entités ne sont
+        # chargées et normalisées que si les métriques, le balayage ou la version du code changent
+        cle = (tuple(metriques), n_tirages, dispersion, self.code_version)
+        moteur = st.session_state.get('indice_composite')
+        if moteur is None or moteur[0] != cle:
+            frames = {e: self.load_advanced_data(e)[0] for e in entites}
+            moteur = (cle, CompositeIndexEngine(normalize_metrics(frames, metriques), poids, n_tirages, dispersion))
+            st.session_state['indice_composite'] = moteur
+            changes = len(metriques)
+        else:
+            changes = moteur[1].update(poids)
+        moteur = moteur[1]
+        
+        stabilite = moteur.rank_stability()
+        col1, col2, col3 = st.columns(3)
+        col1.metric("Vecteurs × entités × années", f"{moteur.n_tirages:,} × {len(entites)} × {len(annees)}",
+                    f"{moteur.derniere_ms:.1f} ms", delta_color="off")
+        col2.metric("Mises à jour rang 1 / reconstructions", f"{moteur.mises_a_jour} / {moteur.reconstructions}",
+                    f"{changes} poids modifié(s)", delta_color="off")
+        col3.metric("Classement modifié", f"{stabilite['part_modifiee'] * 100:.1f}%")
+        
+        col1, col2 = st.columns(2)
+        reference = moteur.reference()
+        with col1:
+            fig = go.Figure()
+            for e in np.argsort(-reference[:, -1]):
+                largeur = 4 if entites[e] == controls['selection'] else 2
+                fig.add_trace(go.Scatter(x=annees, y=reference[e], name=entites[e], line=dict(width=largeur)))
+            fig.update_layout(title="📈 INDICE COMPOSITE PAR ENTITÉ (POIDS CHOISIS)", height=500,
+                              yaxis_title="Indice (0-100)", template="plotly_white")
+            self.render_chart(fig)
+        with col2:
+            fig = px.imshow(stabilite['frequence'] * 100, x=[f"Rang {r + 1}" for r in range(len(entites))],
+                            y=entites, color_continuous_scale='reds', text_auto='.0f', aspect='auto',
+                            title=f"📊 STABILITÉ DES RANGS EN {int(annees[-1])} (% DES VECTEURS)")
+            fig.update_layout(height=500)
+            self.render_chart(fig)
+        
+        col1, col2 = st.columns(2)
+        finale = moteur.scores(-1)
+        with col1:
+            fig = go.Figure()
+            for e in np.argsort(-reference[:, -1]):
+                fig.add_trace(go.Box(y=finale[:, e], name=entites[e], boxpoints=False))
+            fig.update_layout(title=f"📦 DISTRIBUTION DE L'INDICE {int(annees[-1])} SUR LE BALAYAGE",
+                              height=500, showlegend=False)
+            self.render_chart(fig)
+        with col2:
+            cible = entites.index(controls['selection']) if controls['selection'] in entites else 0
+            bandes = np.percentile(moteur.scores()[:, cible, :], [5, 50, 95], axis=0)
+            fig = go.Figure()
+            fig.add_trace(go.Scatter(x=annees, y=bandes[2], line=dict(width=0), showlegend=False))
+            fig.add_trace(go.Scatter(x=annees, y=bandes[0], fill='tonexty', line=dict(width=0),
+                                     fillcolor='rgba(2,79,162,0.25)', name='P5-P95'))
+            fig.add_trace(go.Scatter(x=annees, y=bandes[1], name='Médiane', line=dict(color='#024FA2', width=3)))
+            fig.add_trace(go.Scatter(x=annees, y=reference[cible], name='Poids choisis',
+                                     line=dict(color='#ED1C27', width=3, dash='dash')))
+            fig.update_layout(title=f"🎯 {entites[cible].upper()} - ÉVENTAIL DE L'INDICE", height=500)
+            self.render_chart(fig)
+        
+        st.dataframe(pd.DataFrame({
+            'Entité': entites,
+            'Indice': reference[:, -1].round(1),
+            'Rang': stabilite['rang_reference'] + 1,
+            'Décalage moyen de rang': stabilite['decalage_moyen'].round(2),
+        }).sort_values('Rang'), hide_index=True, use_container_width=True)
+    
+    def create_run_history(self, df, config, controls):
+        """Historique SQLite des runs de la sélection : enregistrement des scénarios et superposition"""
+        st.markdown('<h3 class="section-header">🗄️ HISTORIQUE DES RUNS</h3>', 
+                   unsafe_allow_html=True)
+        
+        store = get_run_store()
+        selection = controls['selection']
+        annees = df['Annee'].to_numpy()
+        if st.button("💾 Enregistrer les scénarios de ce run"):
+            metriques, cube, _, _ = defense_model.compare_scenarios(annees, config, self.scenarios_options)
+            runs = [("dash", selection, scenario, self.code_version,
+                     {"config": config, "modificateurs": defense_model.SCENARIO_MODIFIERS[scenario]},
+                     pd.DataFrame({'Annee': annees, **dict(zip(metriques, cube[:, s]))}))
+                    for s, scenario in enumerate(self.scenarios_options)]
+            debut = time.perf_counter()
+            nouveaux = store.record_many(runs)
+            st.success(f"{nouveaux} run(s) enregistré(s) en {(time.perf_counter() - debut) * 1000:.1f} ms "
+                       f"({len(runs) - nouveaux} identique(s) déjà présent(s))")
+        
+        col_a, col_b, col_c = st.columns(3)
+        with col_a:
+            scenarios = store.scenarios("dash", selection)
+            scenario = st.selectbox("Scénario enregistré:", [None] + scenarios,
+                                    format_func=lambda s: "Tous" if s is None else (s or "Génération de base"))
+        with col_b:
+            limite = st.select_slider("Runs superposés (les plus récents):", [10, 50, 100, 500, 1000, 5000],
+                                      value=500)
+        debut = time.perf_counter()
+        runs = store.history("dash", selection, scenario, limite=limite)
+        if runs.empty:
+            st.info("Aucun run enregistré pour cette sélection.")
+            return
+        with col_c:
+            metriques = store.metrics(runs['id'].tolist())
+            metrique = st.selectbox("Métrique:", metriques,
+                                    index=metriques.index('Budget_Defense_Mds') if 'Budget_Defense_Mds' in metriques else 0)
+        axe, matrice = store.load_series(runs, metrique)
+        duree = (time.perf_counter() - debut) * 1000
+        
+        col1, col2, col3 = st.columns(3)
+        col1.metric("Runs superposés", f"{len(runs):,}", f"{duree:.1f} ms de requête", delta_color="off")
+        col2.metric("Runs enregistrés (toutes sélections)", f"{store.count():,}")
+        col3.metric("Versions du code", runs['code_version'].nunique())
+        
+        # Tous les runs historiques en une seule trace (séparés par des NaN)
+        x = np.tile(np.append(axe, np.nan), len(matrice))
+        y = np.hstack([matrice, np.full((len(matrice), 1), np.nan)]).ravel()
+        fig = go.Figure()
+        fig.add_trace(go.Scattergl(x=x, y=y, mode='lines', name=f"Historique ({len(runs)} runs)",
+                                   line=dict(color='rgba(100,100,100,0.25)', width=1)))
+        fig.add_trace(go.Scatter(x=axe, y=matrice[0], name=f"Dernier run ({runs['horodatage'].iloc[0]:%Y-%m-%d %H:%M})",
+                                 line=dict(color='#ED1C27', width=3)))
+        if metrique in df.columns:
+            fig.add_trace(go.Scatter(x=annees, y=df[metrique], name="Run courant",
+                                     line=dict(color='#024FA2', width=3, dash='dash')))
+        fig.update_layout(title=f"🗄️ {metrique.replace('_', ' ')} - RUNS HISTORIQUES SUPERPOSÉS", height=500,
+                          template="plotly_white")
+        self.render_chart(fig)
+        
+        runs['code_version'] = runs['code_version'].str[:8]
+        st.dataframe(runs.drop(columns=['annee_debut', 'n_annees']), hide_index=True,
+                     use_container_width=True, height=300)
+    
+    def create_country_comparison(self, df):
+        """Comparaison de profils de pays (plugins) générés ensemble en un cube entité × métrique × année"""
+        st.markdown('<h3 class="section-header">🌐 COMPARAISON ENTRE PROFILS DE PAYS</h3>', 
+                   unsafe_allow_html=True)
+        
+        for chemin, erreur in load_plugins().items():
+            st.warning(f"Profil ignoré ({os.path.basename(chemin)}): {erreur}")
+        noms = list(PROFILES)
+        col_a, col_b = st.columns([2, 1])
+        with col_a:
+            choisis = st.multiselect("Profils comparés:", noms, default=noms)
+        with col_b:
+            relatif = st.toggle("Valeurs relatives au premier profil", value=False)
+        if not choisis:
+            st.info("Sélectionnez au moins un profil.")
+            return
+        
+        annees = df['Annee'].to_numpy()
+        profils = [PROFILES[n] for n in choisis]
+        debut = time.perf_counter()
+        metriques, cube = generate_profiles(annees, profils)
+        duree = (time.perf_counter() - debut) * 1000
+        st.caption(f"{len(profils)} profils × {len(metriques)} métriques × {len(annees)} années générés "
+                   f"en une passe : {duree:.2f} ms • plugins : dossier profiles/ et RPDC_PROFILES_DIR")
+        
+        choix = st.multiselect("Métriques:", metriques,
+                               default=[m for m in ('Budget_Defense_Mds', 'Personnel_Milliers',
+                                                    'Developpement_Technologique', 'Cyber_Capabilities')
+                                        if m in metriques])
+        if relatif:
+            with np.errstate(divide='ignore', invalid='ignore'):
+                cube = cube / cube[:1] * 100
+        if choix:
+            lignes = -(-len(choix) // 2)
+            fig = make_subplots(rows=lignes, cols=2, subplot_titles=[m.replace('_', ' ') for m in choix],
+                                vertical_spacing=0.1)
+            couleurs = px.colors.qualitative.Bold
+            for k, m in enumerate(choix):
+                i = metriques.index(m)
+                for e, nom in enumerate(choisis):
+                    fig.add_trace(go.Scatter(x=annees, y=cube[e, i], name=nom, legendgroup=nom, showlegend=k == 0,
+                                             line=dict(color=couleurs[e % len(couleurs)], width=3)),
+                                  row=k // 2 + 1, col=k % 2 + 1)
+            fig.update_layout(title="🌐 ÉVOLUTION COMPARÉE DES PROFILS" + (f" (% de {choisis[0]})" if relatif else ""),
+                              height=350 * lignes + 100, template="plotly_white")
+            self.render_chart(fig)
+        
+        # Dernière année : part du meilleur profil par métrique (toutes les métriques d'un coup)
+        finale = cube[:, :, -1]
+        with np.errstate(invalid='ignore', divide='ignore'):
+            part = finale / np.nanmax(np.abs(finale), axis=0) * 100
+        renseignees = ~np.all(np.isnan(part), axis=0)
+        fig = px.imshow(pd.DataFrame(part[:, renseignees].T, index=np.array(metriques)[renseignees], columns=choisis),
+                        color_continuous_scale='Blues', text_auto='.0f', aspect='auto', zmin=0, zmax=100,
+                        title=f"📊 NIVEAU {int(annees[-1])} EN % DU PROFIL LE PLUS ÉLEVÉ")
+        fig.update_layout(height=max(400, 26 * int(renseignees.sum()) + 150))
+        self.render_chart(fig)
+        
+        st.dataframe(pd.DataFrame([{'Profil': p['nom'], 'Description': p['description'],
+                                    'Priorités': ", ".join(p['config'].get('priorites', [])),
+                                    'Coefficients propres': len(p['coefficients'])} for p in profils]),
+                     hide_index=True, use_container_width=True)
     
     def create_strategic_synthesis(self, df, config, controls):
         """Synthèse stratégique finale"""
@@ -925,7 +1881,7 @@ class DefenseCoreeNordDashboardAvance:
         col1, col2 = st.columns(2)
         
         with col1:
-            st.markdown("""
+            self.render_html("synthese_points_forts", """
             <div class="juche-card">
                 <h4>🏆 POINTS FORTS STRATÉGIQUES</h4>
                 <div style="margin-top: 1rem;">
@@ -947,10 +1903,10 @@ class DefenseCoreeNordDashboardAvance:
                     </div>
                 </div>
             </div>
-            """, unsafe_allow_html=True)
+            """)
         
         with col2:
-            st.markdown("""
+            self.render_html("synthese_defis", """
             <div class="warning-card">
                 <h4>🎯 DÉFIS ET VULNÉRABILITÉS</h4>
                 <div style="margin-top: 1rem;">
@@ -972,10 +1928,10 @@ class DefenseCoreeNordDashboardAvance:
                     </div>
                 </div>
             </div>
-            """, unsafe_allow_html=True)
+            """)
         
         # Perspectives futures
-        st.markdown("""
+        self.render_html("synthese_perspectives", """
         <div class="metric-card">
             <h4>🔮 PERSPECTIVES STRATÉGIQUES 2027-2035</h4>
             <div style="display: grid; grid-template-columns: repeat(3, 1fr); gap: 1rem; margin-top: 1rem;">
@@ -993,10 +1949,10 @@ class DefenseCoreeNordDashboardAvance:
                 </div>
             </div>
         </div>
-        """, unsafe_allow_html=True)
+        """)
         
         # Recommandations finales
-        st.markdown("""
+        self.render_html("synthese_recommandations", """
         <div class="juche-card">
             <h4>🎖️ RECOMMANDATIONS STRATÉGIQUES FINALES</h4>
             <div style="display: grid; grid-template-columns: repeat(2, 1fr); gap: 1rem; margin-top: 1rem;">
@@ -1016,9 +1972,10 @@ class DefenseCoreeNordDashboardAvance:
                 </div>
             </div>
         </div>
-        """, unsafe_allow_html=True)
+        """)
 
 # Lancement du dashboard avancé
 if __name__ == "__main__":
+    st.set_page_config(**PAGE_CONFIG)
     dashboard = DefenseCoreeNordDashboardAvance()
     dashboard.run_advanced_dashboard()
\ No newline at end of file
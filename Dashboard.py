@@ -8,20 +8,35 @@ from plotly.subplots import make_subplots
 import matplotlib.pyplot as plt
 import seaborn as sns
 from datetime import datetime, timedelta
+import hashlib
+import os
+import time
 import warnings
+from contextlib import ExitStack, contextmanager
+from metrics_export import record_generation, requested_metrics
+from memory_accounting import render_memory_controls, render_memory_panel, requested_memory_accounting
+from rerun_profiler import render_profile_controls, render_profile_report, requested_profiler
+from shared_store import simulation_hash
+from shared_resources import dataset_key, get_live_feed, get_shared_store, load_observed_events
+from html_fragments import style_block
+from figure_payload import PayloadReport, optimize_figure
+from calibration import apply_calibration, calibrate, model_specs
+from observed_ingest import merge_observed, to_year_grid
+from webgl_charts import WEBGL_POINT_THRESHOLD, apply_webgl, render_benchmark_page
+import defense_model
+import geopolitical_events
 warnings.filterwarnings('ignore')
 
-# Configuration de la page
-st.set_page_config(
-    page_title="Analyse de la Défense Nord-Coréenne - RPDC",
-    page_icon="⭐",
-    layout="wide",
-    initial_sidebar_state="expanded"
-)
+# Configuration de la page (lancement autonome ; l'application multipage a la sienne, cf. app.py)
+PAGE_CONFIG = {
+    "page_title": "Analyse de la Défense Nord-Coréenne - RPDC",
+    "page_icon": "⭐",
+    "layout": "wide",
+    "initial_sidebar_state": "expanded",
+}
 
-# CSS personnalisé
-st.markdown("""
-<style>
+# CSS personnalisé (minifié une fois par processus, cf. html_fragments)
+CSS = """
     .main-header {
         font-size: 2.5rem;
         background: linear-gradient(45deg, #024FA2, #ED1C27, #FFFFFF);
@@ -64,13 +79,21 @@ st.markdown("""
         border-radius: 10px;
         margin: 0.5rem 0;
     }
-</style>
-""", unsafe_allow_html=True)
+"""
+STYLE_HTML = style_block(CSS)[0]
 
 class DefenseCoreeNordDashboard:
     def __init__(self):
         self.branches_options = self.define_branches_options()
         self.programmes_options = self.define_programmes_options()
+        self.shared_store = get_shared_store()
+        self.code_version = simulation_hash(type(self), defense_model, geopolitical_events)
+        self.payload_report = PayloadReport()
+        self.measure_payload = False
+        self.webgl_threshold = WEBGL_POINT_THRESHOLD
+        self.profiler = None
+        self.memory = None
+        self.metrics = None
         
     def define_branches_options(self):
         """Définit les branches militaires disponibles pour l'analyse"""
@@ -117,6 +140,21 @@ class DefenseCoreeNordDashboard:
         
         return pd.DataFrame(data), config
     
+    def load_defense_data(self, selection):
+        """Données lues depuis le store partagé (générées une seule fois par hôte)"""
+        config = self.get_config(selection)
+        df = self.shared_store.get_or_publish(dataset_key("militaire", selection),
+                                              lambda: self.timed_generation(selection), self.code_version)
+        return df, config
+    
+    def timed_generation(self, selection):
+        """Génère le jeu de données d'une sélection (durée exportée dans les métriques si actives)"""
+        debut = time.perf_counter()
+        df = self.generate_defense_data(selection)[0]
+        if self.metrics is not None:
+            record_generation("dashboard", selection, time.perf_counter() - debut)
+        return df
+    
     def get_config(self, selection):
         """Retourne la configuration pour une branche/programme donné"""
         configs = {
@@ -170,75 +208,57 @@ class DefenseCoreeNordDashboard:
             "priorites": ["defense_generique"]
         })
     
+    def model_coefficients(self, config=None):
+        """Coefficients du profil « militaire » du modèle vectorisé (bases issues de la configuration)"""
+        return defense_model.coefficients(config, profil="militaire")
+    
     def simulate_budget(self, annees, config):
         """Simule l'évolution du budget défense"""
-        budget_base = config.get('budget_base', 2.0)
-        return [budget_base * (1 + 0.04 * (annee - 2012)) for annee in annees]
+        return defense_model.military_budget(annees, self.model_coefficients(config))
     
     def simulate_personnel(self, annees, config):
         """Simule l'évolution des effectifs (en milliers)"""
-        personnel_base = config.get('personnel_base', 100)
-        return [personnel_base * (1 + 0.01 * (annee - 2012)) for annee in annees]
+        return defense_model.military_personnel(annees, self.model_coefficients(config))
     
     def simulate_military_exercises(self, annees, config):
         """Simule les exercices militaires"""
-        base = config.get('exercices_base', 30)
-        return [base + 2 * (annee - 2012) for annee in annees]
+        return defense_model.military_exercises(annees, self.model_coefficients(config))
     
     def simulate_readiness(self, annees):
         """Simule le niveau de préparation opérationnelle"""
-        return [min(70 + 2 * (annee - 2012), 95) for annee in annees]
+        return defense_model.military_readiness(annees, self.model_coefficients())
     
     def simulate_deterrence_capacity(self, annees):
         """Simule la capacité de dissuasion"""
-        return [min(40 + 5 * (annee - 2012), 90) for annee in annees]
+        return defense_model.military_deterrence(annees, self.model_coefficients())
     
     def simulate_mobilization_time(self, annees):
         """Simule le temps de mobilisation"""
-        return [max(48 - 1.5 * (annee - 2012), 24) for annee in annees]
+        return defense_model.military_mobilization(annees, self.model_coefficients())
     
     def simulate_missile_tests(self, annees):
         """Simule les tests de missiles"""
-        tests = []
-        for annee in annees:
-            if annee < 2015:
-                tests.append(3 + (annee - 2012))
-            elif annee < 2020:
-                tests.append(6 + 2 * (annee - 2014))
-            else:
-                tests.append(16 + 3 * (annee - 2019))
-        return tests
+        return defense_model.military_missile_tests(annees, self.model_coefficients())
     
     def simulate_tech_development(self, annees):
         """Simule le développement technologique"""
-        return [min(35 + 6 * (annee - 2012), 85) for annee in annees]
+        return defense_model.military_tech(annees, self.model_coefficients())
     
     def simulate_artillery_capacity(self, annees):
         """Simule la capacité d'artillerie"""
-        return [min(75 + 1.5 * (annee - 2012), 95) for annee in annees]
+        return defense_model.military_artillery(annees, self.model_coefficients())
     
     def simulate_nuclear_tests(self, annees):
         """Simule les tests nucléaires"""
-        tests = [0] * len(annees)
-        # Tests réels simulés + développement continu
-        for i, annee in enumerate(annees):
-            if annee == 2013:
-                tests[i] = 1
-            elif annee == 2016:
-                tests[i] = 2
-            elif annee == 2017:
-                tests[i] = 1
-            elif annee >= 2022:
-                tests[i] = min(1 + (annee - 2022), 3)
-        return tests
+        return defense_model.nuclear_tests(annees, self.model_coefficients())
     
     def simulate_missile_range(self, annees):
         """Simule la portée des missiles (en km)"""
-        return [min(1300 + 300 * (annee - 2012), 15000) for annee in annees]
+        return defense_model.military_missile_range(annees, self.model_coefficients())
     
     def simulate_cyber_capacity(self, annees):
         """Simule la capacité cyber"""
-        return [min(50 + 4 * (annee - 2012), 85) for annee in annees]
+        return defense_model.military_cyber(annees, self.model_coefficients())
     
     def display_header(self):
         """Affiche l'en-tête du dashboard"""
@@ -273,13 +293,178 @@ class DefenseCoreeNordDashboard:
         show_projection = st.sidebar.checkbox("Afficher les projections 2023-2027", value=True)
         show_juche_analysis = st.sidebar.checkbox("Analyse doctrine Juche", value=True)
         
+        # Calibration sur données observées
+        st.sidebar.markdown("### 📐 Calibration")
+        observations = st.sidebar.file_uploader("Données observées (CSV):", type=["csv"])
+        courbes = st.sidebar.radio("Courbes:", ["Ajustées à la main", "Calibrées"], horizontal=True,
+                                   disabled=observations is None)
+        
+        # Journal d'événements observés (CSV, Parquet ou JSONL, lu par blocs)
+        st.sidebar.markdown("### 📥 Données observées")
+        journal_observe = st.sidebar.text_input("Journal d'événements (chemin local):",
+                                                value=os.environ.get("RPDC_OBSERVED_EVENTS", ""))
+        
+        # Suivi en continu d'un journal JSONL
+        st.sidebar.markdown("### 📡 Mode ops")
+        mode_ops = st.sidebar.checkbox("Flux temps réel", value=bool(os.environ.get("RPDC_LIVE_FEED")))
+        flux_ops = st.sidebar.text_input("Journal JSONL suivi:", value=os.environ.get("RPDC_LIVE_FEED", ""),
+                                         disabled=not mode_ops)
+        intervalle_ops = st.sidebar.slider("Rafraîchissement (s):", 1, 60, 5, disabled=not mode_ops)
+        
+        # Outils de performance
+        st.sidebar.markdown("### 🛠️ Outils performance")
+        payload_report = st.sidebar.checkbox("Taille des figures (octets)", value=False)
+        webgl_threshold = st.sidebar.number_input("Seuil WebGL (points par figure):", min_value=100,
+                                                  value=WEBGL_POINT_THRESHOLD, step=1000)
+        webgl_benchmark = st.sidebar.checkbox("Page benchmark WebGL", value=False)
+        render_profile_controls()
+        render_memory_controls()
+        
         return {
             'selection': selection,
             'type_analyse': type_analyse,
             'show_projection': show_projection,
-            'show_juche_analysis': show_juche_analysis
+            'show_juche_analysis': show_juche_analysis,
+            'observations': observations.getvalue() if observations is not None else None,
+            'courbes_calibrees': courbes == "Calibrées" and observations is not None,
+            'journal_observe': journal_observe.strip(),
+            'mode_ops': mode_ops,
+            'flux_ops': flux_ops.strip(),
+            'intervalle_ops': intervalle_ops,
+            'payload_report': payload_report,
+            'webgl_threshold': webgl_threshold,
+            'webgl_benchmark': webgl_benchmark
         }
     
+    def apply_observed_calibration(self, df, controls):
+        """Remplace les courbes ajustées à la main par les courbes calibrées si demandé"""
+        if not controls['courbes_calibrees']:
+            return df
+        try:
+            parametres = calibrate(controls['observations'], model_specs(df))
+        except (ValueError, KeyError) as e:
+            st.sidebar.error(f"Calibration impossible: {e}")
+            return df
+        df, ajustees = apply_calibration(df, parametres, controls['selection'])
+        if ajustees:
+            with st.sidebar.expander(f"Qualité d'ajustement ({len(ajustees)} métriques)"):
+                st.dataframe(pd.DataFrame([{'Métrique': m, 'RMSE': p['rmse'], 'Points': p['n']}
+                                           for m, p in ajustees.items()]),
+                             hide_index=True, use_container_width=True)
+        else:
+            st.sidebar.warning("Aucune métrique observée pour cette sélection.")
+        return df
+    
+    def create_observed_comparison(self, df, controls):
+        """Métriques simulées et observées (journal d'événements ingéré par blocs)"""
+        chemin = controls['journal_observe']
+        if not chemin:
+            return
+        st.markdown('<h3 class="section-header">📥 DONNÉES OBSERVÉES vs SIMULÉES</h3>', 
+                   unsafe_allow_html=True)
+        try:
+            agrege, rapport = load_observed_events(chemin, os.path.getmtime(chemin))
+        except (OSError, ValueError) as e:
+            st.error(f"Ingestion impossible: {e}")
+            return
+        fusion, communes = merge_observed(df, to_year_grid(agrege, df['Annee'], controls['selection']))
+        
+        col1, col2, col3 = st.columns(3)
+        col1.metric("Événements lus", f"{rapport['lignes']:,}")
+        col2.metric("Événements valides", f"{rapport['valides']:,}")
+        col3.metric("Rejets", f"{rapport['lignes'] - rapport['valides']:,}",
+                    ", ".join(f"{motif}: {n:,}" for motif, n in rapport['rejets'].items() if n) or None,
+                    delta_color="off")
+        if not communes:
+            st.info("Aucune métrique observée ne correspond aux métriques simulées.")
+            return
+        
+        colonnes = st.columns(len(communes))
+        for col, metrique in zip(colonnes, communes):
+            with col:
+                fig = go.Figure()
+                fig.add_trace(go.Scatter(x=fusion['Annee'], y=fusion[metrique], mode='lines',
+                                         name='Simulé', line=dict(color='#024FA2', width=3)))
+                fig.add_trace(go.Scatter(x=fusion['Annee'], y=fusion[f"{metrique}_Observe"], mode='markers',
+                                         name='Observé', marker=dict(color='#ED1C27', size=8)))
+                fig.update_layout(title=metrique.replace('_', ' '), height=350)
+                self.render_chart(fig)
+    
+    def create_live_feed_panel(self, df, controls):
+        """Mode ops : suivi du journal JSONL avec réexécution partielle périodique"""
+        st.markdown('<h3 class="section-header">📡 FLUX TEMPS RÉEL</h3>', 
+                   unsafe_allow_html=True)
+        chemin = controls['flux_ops']
+        if not chemin:
+            st.info("Indiquez le chemin du journal JSONL à suivre.")
+            return
+        feed = get_live_feed(chemin)
+        selection = controls['selection']
+        annees = df['Annee'].to_numpy()
+        metriques = [m for m in feed.versions if m in df.columns]
+        empreintes = {m: hashlib.sha1(np.ascontiguousarray(df[m].to_numpy()).tobytes()).hexdigest()
+                      for m in metriques}
+        
+        @st.fragment(run_every=controls['intervalle_ops'])
+        def panneau():
+            feed.poll()
+            annee_courante = datetime.now().year
+            kpis = st.columns(len(metriques) + 1)
+            for col, metrique in zip(kpis, metriques):
+                valeur = feed.value(metrique, annee_courante, selection)
+                col.metric(f"{metrique.replace('_', ' ')} ({annee_courante})",
+                           "—" if valeur is None else f"{valeur:,.1f}")
+            kpis[-1].metric("Événements suivis", f"{feed.stats['evenements']:,}",
+                            f"relevé {feed.stats['dernier_releve_ms']:.1f} ms", delta_color="off")
+            
+            # Seules les métriques dont la version du flux ou la série simulée (calibration, journal
+            # observé) a changé sont reconstruites et recompactées ; une figure inchangée est réémise
+            # telle quelle et Streamlit n'en renvoie qu'une référence (cache des messages ≥ 10 Ko).
+            # Session commune aux pages de l'application : cache propre au profil de la vue
+            figures = st.session_state.setdefault('ops_figures_militaire', {})
+            colonnes = st.columns(len(metriques))
+            for col, metrique in zip(colonnes, metriques):
+                cle = (chemin, selection, feed.versions[metrique], empreintes[metrique])
+                if figures.get(metrique, (None,))[0] != cle:
+                    fig = go.Figure()
+                    fig.add_trace(go.Scatter(x=annees, y=df[metrique], mode='lines', name='Simulé',
+                                             line=dict(color='#024FA2', width=3)))
+                    fig.add_trace(go.Scatter(x=annees, y=feed.series(metrique, annees, selection),
+                                             mode='markers', name='Flux', marker=dict(color='#ED1C27', size=9)))
+                    fig.update_layout(title=f"{metrique.replace('_', ' ')} - flux", height=350)
+                    with col:
+                        self.render_chart(fig)
+                    figures[metrique] = (cle, fig)
+                else:
+                    col.plotly_chart(figures[metrique][1], use_container_width=True)
+            
+            if feed.recents:
+                with st.expander(f"Derniers événements ({len(feed.recents)})"):
+                    st.dataframe(pd.DataFrame(list(feed.recents)[-20:][::-1],
+                                              columns=['Sélection', 'Métrique', 'Année', 'Valeur']),
+                                 hide_index=True, use_container_width=True)
+        
+        panneau()
+    
+    def render_chart(self, fig):
+        """Bascule en WebGL si besoin, compacte la charge utile puis affiche la figure"""
+        apply_webgl(fig, self.webgl_threshold)
+        stats = optimize_figure(fig, measure=self.measure_payload)
+        self.payload_report.add(fig.layout.title.text, stats)
+        st.plotly_chart(fig, use_container_width=True)
+    
+    def display_payload_report(self):
+        """Octets transmis par figure, avant et après optimisation"""
+        if not self.payload_report.lignes:
+            return
+        avant, apres = self.payload_report.totals()
+        with st.sidebar.expander("📦 Charge utile des figures", expanded=True):
+            st.metric("Total transmis", f"{apres / 1024:.1f} Ko",
+                      f"{(apres - avant) / 1024:+.1f} Ko", delta_color="inverse")
+            rapport = pd.DataFrame(self.payload_report.lignes)
+            rapport['Gain (%)'] = (1 - rapport['octets_apres'] / rapport['octets_avant']) * 100
+            st.dataframe(rapport, hide_index=True, use_container_width=True)
+    
     def display_key_metrics(self, df, config):
         """Affiche les métriques clés"""
         st.markdown('<h3 class="section-header">📊 INDICATEURS STRATÉGIQUES CLÉS</h3>', 
@@ -344,7 +529,7 @@ class DefenseCoreeNordDashboard:
                              labels={'Budget_Defense_Mds': 'Budget (Md$)', 'Annee': 'Année'})
                 fig.update_traces(line=dict(color='#024FA2', width=3))
                 fig.update_layout(height=400)
-                st.plotly_chart(fig, use_container_width=True)
+                self.render_chart(fig)
         
         with col2:
             if 'Personnel_Milliers' in df.columns:
@@ -353,7 +538,7 @@ class DefenseCoreeNordDashboard:
                              labels={'Personnel_Milliers': 'Effectifs (Milliers)', 'Annee': 'Année'})
                 fig.update_traces(line=dict(color='#ED1C27', width=3))
                 fig.update_layout(height=400)
-                st.plotly_chart(fig, use_container_width=True)
+                self.render_chart(fig)
     
     def create_military_activities_analysis(self, df, config):
         """Analyse des activités militaires"""
@@ -368,7 +553,7 @@ class DefenseCoreeNordDashboard:
                          labels={'Exercices_Militaires': "Nombre d'exercices", 'Annee': 'Année'})
             fig.update_traces(line=dict(color='#024FA2', width=3))
             fig.update_layout(height=400)
-            st.plotly_chart(fig, use_container_width=True)
+            self.render_chart(fig)
         
         with col2:
             if 'Tests_Missiles' in df.columns:
@@ -377,7 +562,7 @@ class DefenseCoreeNordDashboard:
                              labels={'Tests_Missiles': 'Nombre de tests', 'Annee': 'Année'})
                 fig.update_traces(line=dict(color='#ED1C27', width=3))
                 fig.update_layout(height=400)
-                st.plotly_chart(fig, use_container_width=True)
+                self.render_chart(fig)
     
     def create_capabilities_analysis(self, df, config):
         """Analyse des capacités opérationnelles"""
@@ -407,7 +592,7 @@ class DefenseCoreeNordDashboard:
                              xaxis_title="Année",
                              yaxis_title="Niveau (%)",
                              height=500)
-            st.plotly_chart(fig, use_container_width=True)
+            self.render_chart(fig)
         
         with col2:
             # Temps de mobilisation
@@ -417,7 +602,7 @@ class DefenseCoreeNordDashboard:
             fig.update_traces(line=dict(color='#FF6600', width=3))
             fig.update_layout(height=500)
             fig.update_yaxes(autorange="reversed")  # Moins de jours = mieux
-            st.plotly_chart(fig, use_container_width=True)
+            self.render_chart(fig)
     
     def create_strategic_programs_analysis(self, df, config):
         """Analyse des programmes stratégiques"""
@@ -434,7 +619,7 @@ class DefenseCoreeNordDashboard:
                             labels={'Tests_Nucleaires': 'Nombre de tests', 'Annee': 'Année'})
                 fig.update_traces(marker_color='#ED1C27')
                 fig.update_layout(height=400)
-                st.plotly_chart(fig, use_container_width=True)
+                self.render_chart(fig)
         
         with col2:
             # Portée des missiles
@@ -444,7 +629,7 @@ class DefenseCoreeNordDashboard:
                              labels={'Portee_Missiles_Km': 'Portée (km)', 'Annee': 'Année'})
                 fig.update_traces(line=dict(color='#024FA2', width=3))
                 fig.update_layout(height=400)
-                st.plotly_chart(fig, use_container_width=True)
+                self.render_chart(fig)
     
     def create_juche_analysis(self, df, config):
         """Analyse de la doctrine Juche"""
@@ -472,7 +657,7 @@ class DefenseCoreeNordDashboard:
                          labels={'Developpement_Technologique': 'Niveau (%)', 'Annee': 'Année'})
             fig.update_traces(line=dict(color='#024FA2', width=3))
             fig.update_layout(height=400)
-            st.plotly_chart(fig, use_container_width=True)
+            self.render_chart(fig)
         
         with col2:
             # Indice d'autosuffisance
@@ -482,7 +667,7 @@ class DefenseCoreeNordDashboard:
                          labels={'x': 'Année', 'y': 'Autosuffisance (%)'})
             fig.update_traces(line=dict(color='#ED1C27', width=3))
             fig.update_layout(height=400)
-            st.plotly_chart(fig, use_container_width=True)
+            self.render_chart(fig)
     
     def create_comparative_analysis(self, df, config):
         """Analyse comparative avant/après développement stratégique"""
@@ -510,7 +695,7 @@ class DefenseCoreeNordDashboard:
             fig.update_layout(title="Comparaison Avant/Après Accélération Stratégique",
                              barmode='group',
                              height=500)
-            st.plotly_chart(fig, use_container_width=True)
+            self.render_chart(fig)
     
     def create_strategic_insights(self, df, config, selection):
         """Génère des insights stratégiques"""
@@ -609,15 +794,60 @@ class DefenseCoreeNordDashboard:
                 st.progress(niveau/10, text=f"{programme}: {niveau}/10")
 
     def run_dashboard(self):
-        """Exécute le dashboard complet"""
+        """Exécute le dashboard complet (profilé / mesuré si demandé pour cette session)"""
+        self.profiler = requested_profiler()
+        self.memory = requested_memory_accounting()
+        self.metrics = requested_metrics("dashboard", self.shared_store, "militaire")
+        st.markdown(STYLE_HTML, unsafe_allow_html=True)
+        with ExitStack() as pile:
+            for observateur in (self.profiler, self.memory, self.metrics):
+                if observateur is not None:
+                    pile.enter_context(observateur)
+            self.render_dashboard()
+            if self.memory is not None:
+                self.account_memory()
+        if self.profiler is not None:
+            render_profile_report(self.profiler)
+        if self.memory is not None:
+            render_memory_panel(self.memory)
+    
+    @contextmanager
+    def section(self, nom):
+        """Section instrumentée de la réexécution (attribution du profil, de la mémoire et des latences)"""
+        with ExitStack() as pile:
+            for observateur in (self.profiler, self.memory, self.metrics):
+                if observateur is not None:
+                    pile.enter_context(observateur.section(nom))
+            yield
+    
+    def account_memory(self):
+        """Tailles profondes des DataFrames générés et des figures en cache"""
+        for cle, df in self.shared_store.attached_frames().items():
+            self.memory.account(f"DataFrame {cle}", df)
+        self.memory.account("Rapport de charge utile", self.payload_report)
+    
+    def render_dashboard(self):
+        """Corps de la réexécution"""
         # Sidebar
-        controls = self.create_sidebar()
+        with self.section("Sidebar"):
+            controls = self.create_sidebar()
+        if self.metrics is not None:
+            self.metrics.selection = controls['selection']
+        self.payload_report = PayloadReport()
+        self.measure_payload = controls['payload_report']
+        self.webgl_threshold = controls['webgl_threshold']
+        
+        if controls['webgl_benchmark']:
+            render_benchmark_page()
+            return
         
         # Header
         self.display_header()
         
         # Génération des données
-        df, config = self.generate_defense_data(controls['selection'])
+        with self.section("Données"):
+            df, config = self.load_defense_data(controls['selection'])
+            df = self.apply_observed_calibration(df, controls)
         
         # Navigation par onglets
         tab1, tab2, tab3, tab4, tab5, tab6 = st.tabs([
@@ -629,26 +859,29 @@ class DefenseCoreeNordDashboard:
             "🌍 Analyse RPDC"
         ])
         
-        with tab1:
+        with tab1, self.section("Vue d'Ensemble"):
             st.markdown(f"## ⭐ Analyse Militaire - {controls['selection']}")
+            if controls['mode_ops']:
+                self.create_live_feed_panel(df, controls)
             self.display_key_metrics(df, config)
             self.create_strategic_insights(df, config, controls['selection'])
+            self.create_observed_comparison(df, controls)
         
-        with tab2:
+        with tab2, self.section("Budgets & Effectifs"):
             self.create_budget_analysis(df, config)
         
-        with tab3:
+        with tab3, self.section("Activités Militaires"):
             self.create_military_activities_analysis(df, config)
         
-        with tab4:
+        with tab4, self.section("Capacités"):
             self.create_capabilities_analysis(df, config)
         
-        with tab5:
+        with tab5, self.section("Programmes Stratégiques"):
             self.create_strategic_programs_analysis(df, config)
             if controls['show_juche_analysis']:
                 self.create_juche_analysis(df, config)
         
-        with tab6:
+        with tab6, self.section("Analyse RPDC"):
             self.create_korean_overview()
             
             st.markdown("---")
@@ -671,8 +904,11 @@ class DefenseCoreeNordDashboard:
             
             *Note: Ce dashboard utilise des données estimées et simulées pour l'analyse stratégique.*
             """)
+        
+        self.display_payload_report()
 
 # Lancement du dashboard
 if __name__ == "__main__":
+    st.set_page_config(**PAGE_CONFIG)
     dashboard = DefenseCoreeNordDashboard()
     dashboard.run_dashboard()
\ No newline at end of file
@@ -0,0 +1,150 @@
+# animation_frames.py
+"""Animations temporelles des figures, lues côté navigateur.
+
+Les images sont calculées une seule fois à partir de tableaux cumulés (maximum atteint, totaux
+cumulés, systèmes déployés) et jointes à la figure : le curseur d'années et le bouton lecture
+sont des contrôles plotly.js, le défilement ne relance pas le script.
+
+Chaque image est un delta : la figure de base porte une fois les données lourdes (courbes
+complètes, nuages de systèmes) et une image ne transporte que les propriétés qui changent des
+traces dynamiques (`traces=[...]`) : position des curseurs, opacité des cohortes, trait vertical
+et encart d'indicateurs. Les états sont absolus pour ces traces, on peut donc sauter à n'importe
+quelle année dans les deux sens.
+"""
+import numpy as np
+import plotly.graph_objects as go
+import plotly.io as pio
+
+FRAME_DURATION_MS = 450
+OPACITE_DEPLOYE = 0.85
+OPACITE_A_VENIR = 0.07
+
+
+def playback_controls(annees, actif, duree_ms=FRAME_DURATION_MS):
+    """(menus, curseurs) de lecture exécutés par plotly.js"""
+    immediat = {"mode": "immediate", "frame": {"duration": 0, "redraw": False}, "transition": {"duration": 0}}
+    lecture = {"frame": {"duration": duree_ms, "redraw": False}, "transition": {"duration": duree_ms // 2},
+               "fromcurrent": True, "mode": "immediate"}
+    menus = [{
+        "type": "buttons", "direction": "left", "showactive": False, "x": 0.0, "y": -0.12,
+        "xanchor": "left", "yanchor": "top", "pad": {"r": 10, "t": 10},
+        "buttons": [{"label": "▶", "method": "animate", "args": [None, lecture]},
+                    {"label": "⏸", "method": "animate", "args": [[None], immediat]}],
+    }]
+    curseurs = [{
+        "active": actif, "x": 0.08, "len": 0.92, "y": -0.12, "yanchor": "top", "pad": {"t": 10},
+        "currentvalue": {"prefix": "Année : ", "font": {"size": 14}},
+        "steps": [{"label": str(a), "method": "animate", "args": [[str(a)], immediat]} for a in annees],
+    }]
+    return menus, curseurs
+
+
+def animate(fig, annees, dynamiques, etats, mises_en_page, actif=-1):
+    """Joint une image par année : `etats[k]` = propriétés des traces `dynamiques`,
+    `mises_en_page[k]` = formes et annotations de l'année ; la figure affiche l'année `actif`"""
+    actif = actif % len(annees)
+    fig.frames = [go.Frame(name=str(a), traces=dynamiques, data=e, layout=l)
+                  for a, e, l in zip(annees, etats, mises_en_page)]
+    for i, proprietes in zip(dynamiques, etats[actif]):
+        fig.data[i].update(proprietes)
+    fig.update_layout(mises_en_page[actif])
+    menus, curseurs = playback_controls(annees, actif)
+    fig.update_layout(updatemenus=menus, sliders=curseurs, margin=dict(b=110))
+    return fig
+
+
+def frame_payload(fig):
+    """(octets des images, octets de la figure de base) du JSON envoyé"""
+    base = go.Figure(data=fig.data, layout=fig.layout)
+    images = pio.json.to_json_plotly([f.to_plotly_json() for f in fig.frames])
+    return len(images.encode("utf-8")), len(pio.to_json(base, validate=False).encode("utf-8"))
+
+
+def _curseur_annee(annee, texte):
+    """Trait vertical et encart d'indicateurs d'une image"""
+    return {
+        "shapes": [{"type": "line", "x0": annee, "x1": annee, "xref": "x", "y0": 0, "y1": 1, "yref": "paper",
+                    "line": {"color": "#ED1C27", "width": 2, "dash": "dot"}}],
+        "annotations": [{"text": texte, "x": 0.01, "y": 0.99, "xref": "paper", "yref": "paper",
+                         "xanchor": "left", "yanchor": "top", "showarrow": False, "align": "left",
+                         "bgcolor": "rgba(255, 255, 255, 0.85)", "bordercolor": "#024FA2", "borderwidth": 1,
+                         "font": {"size": 11}}],
+    }
+
+
+def capabilities_animation(annees, capacites, indicateurs):
+    """Capacités animées : courbes complètes en fond, curseurs et indicateurs cumulés par année.
+
+    `capacites` = {nom: (valeurs, couleur)}, `indicateurs` = {libellé: (valeurs cumulées, format)}."""
+    annees = np.asarray(annees)
+    noms = list(capacites)
+    valeurs = np.stack([np.asarray(v, dtype=np.float64) for v, _ in capacites.values()])
+    couleurs = [c for _, c in capacites.values()]
+    fig = go.Figure()
+    for nom, serie, couleur in zip(noms, valeurs, couleurs):
+        fig.add_trace(go.Scatter(x=annees, y=serie, mode='lines', name=nom, line=dict(color=couleur, width=3),
+                                 opacity=0.35, hovertemplate=f"{nom}: %{{y:.1f}}%<extra></extra>"))
+    fig.add_trace(go.Scatter(x=np.full(len(noms), annees[0]), y=valeurs[:, 0], mode='markers+text',
+                             marker=dict(color=couleurs, size=14, line=dict(color='white', width=2)),
+                             text=noms, textposition='middle right', showlegend=False, hoverinfo='skip'))
+    # États par année, en une passe sur les tableaux (M × T) et (I × T)
+    cumules = [(libelle, np.asarray(v, dtype=np.float64), fmt) for libelle, (v, fmt) in indicateurs.items()]
+    etats = [[{"x": np.full(len(noms), a), "y": valeurs[:, k]}] for k, a in enumerate(annees)]
+    textes = [f"<b>{a}</b><br>" + "<br>".join(f"{libelle} : {fmt.format(v[k])}" for libelle, v, fmt in cumules)
+              for k, a in enumerate(annees)]
+    fig.update_layout(
+        title="🎞️ ÉVOLUTION ANIMÉE DES CAPACITÉS ET INDICATEURS CLÉS",
+        xaxis=dict(title="Année", range=[annees[0] - 0.5, annees[-1] + 2.5]),
+        yaxis=dict(title="Niveau de Capacité (%)"),
+        height=560, template="plotly_white",
+        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
+    )
+    return animate(fig, annees, [len(noms)], etats, [_curseur_annee(a, t) for a, t in zip(annees, textes)])
+
+
+def deployment_animation(annees, noms, portees, precisions, deploiements, ogives, couleurs_ogives):
+    """Systèmes missiliers animés par année de déploiement (une trace par cohorte, seule son
+    opacité change d'une image à l'autre) et enveloppe de portée cumulée"""
+    annees = np.asarray(annees)
+    deploiements = np.asarray(deploiements)
+    portees = np.asarray(portees, dtype=np.float64)
+    cohortes, inverse = np.unique(deploiements, return_inverse=True)
+    reference = 2 * portees.max() / 30 ** 2 if len(portees) else 1
+    fig = go.Figure()
+    for ogive, couleur in couleurs_ogives.items():
+        fig.add_trace(go.Scatter(x=[None], y=[None], mode='markers', name=ogive,
+                                 marker=dict(color=couleur, size=10)))
+    premiere = len(fig.data)
+    couleurs = np.array([couleurs_ogives[o] for o in ogives], dtype=object)
+    for c, cohorte in enumerate(cohortes):
+        membres = inverse == c
+        fig.add_trace(go.Scatter(
+            x=portees[membres], y=np.asarray(precisions)[membres], mode='markers', showlegend=False,
+            text=np.asarray(noms, dtype=object)[membres],
+            marker=dict(size=portees[membres], sizemode='area', sizeref=reference, sizemin=3,
+                        color=couleurs[membres], line=dict(width=0.5, color='white')),
+            hovertemplate=f"%{{text}}<br>%{{x:,.0f}} km • CEP %{{y:,.0f}} m • {cohorte}<extra></extra>"))
+    dynamiques = list(range(premiere, premiere + len(cohortes)))
+    # Tableaux cumulés : cohortes visibles, systèmes déployés et portée maximale atteinte par année
+    visibles = cohortes[None, :] <= annees[:, None]
+    deployes = np.searchsorted(np.sort(deploiements), annees, side="right")
+    portee_cohorte = np.zeros(len(cohortes))
+    np.maximum.at(portee_cohorte, inverse, portees)
+    portee_max = np.where(visibles, portee_cohorte[None, :], 0).max(axis=1, initial=0)
+    opacites = np.where(visibles, OPACITE_DEPLOYE, OPACITE_A_VENIR)
+    etats = [[{"marker": {"opacity": o}} for o in ligne] for ligne in opacites.tolist()]
+    mises_en_page = [{
+        "shapes": [{"type": "line", "x0": p, "x1": p, "xref": "x", "y0": 0, "y1": 1, "yref": "paper",
+                    "line": {"color": "#ED1C27", "width": 2, "dash": "dot"}}] if p > 0 else [],
+        "annotations": [{"text": f"<b>{a}</b><br>Systèmes déployés : {n:,} / {len(portees):,}<br>"
+                                 f"Portée maximale : {p:,.0f} km",
+                         "x": 0.01, "y": 0.01, "xref": "paper", "yref": "paper", "xanchor": "left",
+                         "yanchor": "bottom", "showarrow": False, "align": "left",
+                         "bgcolor": "rgba(255, 255, 255, 0.85)", "bordercolor": "#024FA2", "borderwidth": 1}],
+    } for a, n, p in zip(annees, deployes, portee_max)]
+    fig.update_layout(
+        title="🎞️ DÉPLOIEMENT DES SYSTÈMES MISSILIERS PAR ANNÉE",
+        xaxis=dict(title="Portée (km)", type="log"), yaxis=dict(title="Précision CEP (m)", type="log"),
+        height=560, template="plotly_white",
+    )
+    return animate(fig, annees, dynamiques, etats, mises_en_page)
@@ -0,0 +1,36 @@
+# app.py
+"""Application multipage : les deux dashboards dans un seul serveur Streamlit.
+
+Les vues partagent le processus, donc le modèle vectorisé (`defense_model`, un profil de
+coefficients par vue), le store memmap, l'historique SQLite et les caches de figures ; un seul
+serveur à lancer et à préchauffer au lieu de deux.
+
+    streamlit run app.py
+"""
+import streamlit as st
+
+from Dash import DefenseCoreeNordDashboardAvance
+from Dashboard import DefenseCoreeNordDashboard
+
+st.set_page_config(
+    page_title="Défense RPDC - Analyses",
+    page_icon="⭐",
+    layout="wide",
+    initial_sidebar_state="expanded"
+)
+
+
+def vue_avancee():
+    """Analyse Stratégique Avancée (profil « avance »)"""
+    DefenseCoreeNordDashboardAvance().run_advanced_dashboard()
+
+
+def vue_militaire():
+    """Analyse Militaire (profil « militaire »)"""
+    DefenseCoreeNordDashboard().run_dashboard()
+
+
+st.navigation([
+    st.Page(vue_avancee, title="Analyse Stratégique Avancée", icon="🎯", url_path="avance", default=True),
+    st.Page(vue_militaire, title="Analyse Militaire", icon="⭐", url_path="militaire"),
+]).run()
@@ -0,0 +1,181 @@
+# calibration.py
+"""Calibration des courbes simulées sur des données observées (CSV).
+
+Chaque métrique suit un modèle linéaire par morceaux dont les ruptures (sauts et changements
+de pente) sont celles de la courbe ajustée à la main. Le modèle s'écrit y = X β avec une base
+[1, t, 1(t ≥ r), (t - r)+ ...] ; toutes les paires (sélection, métrique) partageant la même base
+sont ajustées ensemble par moindres carrés pondérés (équations normales résolues par lot).
+Les paramètres ajustés sont mis en cache sur disque, indexés par l'empreinte des données.
+"""
+import hashlib
+import io
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+from shared_store import CACHE_DIR
+
+SELECTION_COLUMN = "Selection"
+GLOBAL_SELECTION = "*"
+PERIODE_SAISONNIERE = 4  # cycle des exercices militaires (simulate_advanced_exercises)
+RIDGE = 1e-6
+FIT_VERSION = 2  # entre dans l'empreinte du cache : l'incrémenter quand l'ajustement change
+
+
+def detect_breakpoints(annees, valeurs, rtol=1e-6):
+    """Années où la courbe quitte son régime linéaire (saut ou changement de pente).
+
+    Un nouveau régime commence à l'année r quand la valeur s'écarte de l'extrapolation linéaire
+    du régime précédent ; le couple (saut en r, pente à partir de r) le reproduit exactement.
+    """
+    annees = np.asarray(annees)
+    valeurs = np.asarray(valeurs, dtype=np.float64)
+    tolerance = max(np.abs(valeurs).max(initial=0.0), 1.0) * rtol
+    ruptures = []
+    i = 2
+    while i < len(valeurs):
+        pente = valeurs[i - 1] - valeurs[i - 2]
+        if abs(valeurs[i] - (valeurs[i - 1] + pente)) > tolerance:
+            ruptures.append(int(annees[i]))
+            i += 2  # la pente du nouveau régime se lit sur l'année suivante
+        else:
+            i += 1
+    return ruptures
+
+
+def model_specs(df):
+    """Spécification (ruptures, saisonnalité) de chaque métrique, déduite des courbes ajustées à la main"""
+    specs = {}
+    for metrique in df.columns:
+        if metrique == "Annee":
+            continue
+        ruptures = detect_breakpoints(df["Annee"], df[metrique])
+        if len(ruptures) > len(df) // 3:  # courbe oscillante : tendance + cycle
+            specs[metrique] = {"ruptures": [], "periode": PERIODE_SAISONNIERE}
+        else:
+            specs[metrique] = {"ruptures": ruptures, "periode": None}
+    return specs
+
+
+def piecewise_basis(annees, ruptures, periode=None, origine=None):
+    """Matrice de base (T × p) du modèle linéaire par morceaux"""
+    annees = np.asarray(annees, dtype=np.float64)
+    origine = annees.min() if origine is None else origine
+    t = annees - origine
+    colonnes = [np.ones_like(t), t]
+    for r in ruptures:
+        colonnes.append((annees >= r).astype(np.float64))
+        colonnes.append(np.maximum(annees - r, 0.0))
+    if periode:
+        colonnes.append(np.sin(2 * np.pi * t / periode))
+        colonnes.append(np.cos(2 * np.pi * t / periode))
+    return np.column_stack(colonnes)
+
+
+def read_observations(donnees):
+    """Observations au format large : Annee, [Selection], colonnes de métriques"""
+    obs = pd.read_csv(io.BytesIO(donnees)) if isinstance(donnees, bytes) else pd.read_csv(donnees)
+    if "Annee" not in obs.columns:
+        raise ValueError("Colonne 'Annee' absente des données observées")
+    if SELECTION_COLUMN not in obs.columns:
+        obs[SELECTION_COLUMN] = GLOBAL_SELECTION
+    return obs
+
+
+def fit(obs, specs):
+    """Ajuste toutes les paires (sélection, métrique) observées.
+
+    Retourne {sélection: {métrique: {"beta", "ruptures", "periode", "origine", "rmse", "n"}}}.
+    Seules les ruptures comprises dans les années observées de la métrique sont gardées : avant la
+    première année, la rupture serait colinéaire à la constante et la tendance antérieure arbitraire.
+    """
+    metriques = [m for m in specs if m in obs.columns]
+    origine = float(obs["Annee"].min())
+    selections = list(pd.unique(obs[SELECTION_COLUMN]))
+    # Grille (années observées × sélections) pour chaque métrique
+    annees = np.sort(obs["Annee"].unique()).astype(np.float64)
+    table = obs.groupby([SELECTION_COLUMN, "Annee"])[metriques].mean()
+
+    groupes = {}
+    for metrique in metriques:
+        observees = obs.loc[obs[metrique].notna(), "Annee"]
+        ruptures = tuple(r for r in specs[metrique]["ruptures"]
+                         if len(observees) and observees.min() < r <= observees.max())
+        cle = (ruptures, specs[metrique]["periode"])
+        groupes.setdefault(cle, []).append(metrique)
+
+    resultat = {s: {} for s in selections}
+    for (ruptures, periode), membres in groupes.items():
+        x = piecewise_basis(annees, ruptures, periode, origine)
+        colonnes = []
+        for metrique in membres:
+            large = table[metrique].unstack(SELECTION_COLUMN).reindex(index=annees, columns=selections)
+            colonnes.append(large.to_numpy(dtype=np.float64))
+        y = np.concatenate(colonnes, axis=1)  # (T, K) avec K = métriques × sélections
+        poids = np.isfinite(y).astype(np.float64)
+        y = np.nan_to_num(y)
+        # Équations normales pondérées résolues en un seul appel pour les K colonnes
+        gram = np.einsum("tk,tp,tq->kpq", poids, x, x) + RIDGE * np.eye(x.shape[1])
+        second = np.einsum("tk,tp,tk->kp", poids, x, y)
+        beta = np.linalg.solve(gram, second[..., None])[..., 0]
+        residus = (y - x @ beta.T) * poids
+        n_obs = poids.sum(axis=0)
+        rmse = np.sqrt((residus ** 2).sum(axis=0) / np.maximum(n_obs, 1))
+        for k in range(y.shape[1]):
+            if n_obs[k] == 0:
+                continue
+            metrique, selection = membres[k // len(selections)], selections[k % len(selections)]
+            resultat[selection][metrique] = {
+                "beta": beta[k].tolist(), "ruptures": list(ruptures), "periode": periode,
+                "origine": origine, "rmse": float(rmse[k]), "n": int(n_obs[k]),
+            }
+    return {s: m for s, m in resultat.items() if m}
+
+
+def data_hash(donnees, specs):
+    """Empreinte des données observées et de la spécification du modèle"""
+    h = hashlib.sha256(donnees)
+    h.update(json.dumps([FIT_VERSION, specs], sort_keys=True).encode("utf-8"))
+    return h.hexdigest()[:20]
+
+
+def check_dtypes(obs, specs):
+    """Lève ValueError si l'année ou une métrique observée n'est pas numérique"""
+    colonnes = ["Annee"] + [m for m in specs if m in obs.columns]
+    invalides = [c for c in colonnes if not pd.api.types.is_numeric_dtype(obs[c])]
+    if invalides:
+        raise ValueError(f"Colonnes non numériques dans les données observées: {', '.join(invalides)}")
+
+
+def calibrate(donnees, specs, root=CACHE_DIR):
+    """Paramètres ajustés pour `donnees` (octets CSV), lus depuis le cache disque si disponibles ;
+    ValueError si les données ne sont pas exploitables"""
+    chemin = os.path.join(root, "calibration", f"{data_hash(donnees, specs)}.json")
+    try:
+        with open(chemin, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        pass
+    obs = read_observations(donnees)
+    check_dtypes(obs, specs)
+    parametres = fit(obs, specs)
+    os.makedirs(os.path.dirname(chemin), exist_ok=True)
+    tmp = f"{chemin}.{os.getpid()}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(parametres, f)
+    os.replace(tmp, chemin)
+    return parametres
+
+
+def apply_calibration(df, parametres, selection):
+    """Copie de `df` dont les métriques calibrées suivent les courbes ajustées"""
+    ajustees = dict(parametres.get(GLOBAL_SELECTION, {}))
+    ajustees.update(parametres.get(selection, {}))
+    df = df.copy()
+    for metrique, p in ajustees.items():
+        if metrique in df.columns:
+            x = piecewise_basis(df["Annee"], p["ruptures"], p["periode"], p["origine"])
+            df[metrique] = x @ np.asarray(p["beta"])
+    return df, ajustees
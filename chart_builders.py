@@ -0,0 +1,170 @@
+# chart_builders.py
+"""Constructeurs de figures indépendants, exécutables dans le pool de processus.
+
+Chaque constructeur est une fonction de module (sérialisable par référence) qui reçoit des
+données simples (tableaux numpy, listes) et retourne une figure Plotly. `build_chart` construit
+la figure dans le worker, applique la même chaîne que `render_chart` (WebGL, compaction) et
+renvoie un dictionnaire que le script principal réattache sans revalidation.
+"""
+import time
+from concurrent.futures import as_completed
+
+import numpy as np
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+from plotly.subplots import make_subplots
+
+from figure_payload import optimize_figure
+from webgl_charts import apply_webgl
+
+
+# Couleurs des annotations d'événements par catégorie (cf. geopolitical_events)
+EVENT_COLORS = {"periode": "rgba(237, 28, 39, 0.08)", "regime": "#636e72", "sanction": "#024FA2"}
+
+
+def event_layout(evenements):
+    """Formes et annotations des événements ((début, fin, nom, catégorie), cf.
+    geopolitical_events.annotations), en dictionnaires sur l'axe x principal et la hauteur du papier"""
+    formes, notes = [], []
+    for debut, fin, nom, categorie in evenements:
+        couleur = EVENT_COLORS[categorie]
+        if categorie == "periode":
+            formes.append(dict(type="rect", xref="x", yref="paper", x0=debut, x1=fin, y0=0, y1=1,
+                               fillcolor=couleur, line=dict(width=0), layer="below"))
+            notes.append(dict(xref="x", yref="paper", x=debut, y=1, xanchor="left", yanchor="top", text=nom,
+                              showarrow=False, font=dict(size=9, color="#636e72")))
+        else:
+            formes.append(dict(type="line", xref="x", yref="paper", x0=debut, x1=debut, y0=0, y1=1,
+                               line=dict(color=couleur, width=1, dash="dash" if categorie == "regime" else "dot")))
+            if categorie == "regime":
+                notes.append(dict(xref="x", yref="paper", x=debut, y=0, xanchor="left", yanchor="bottom",
+                                  text=nom, showarrow=False, font=dict(size=9, color=couleur)))
+    return formes, notes
+
+
+def annotate_events(fig, evenements):
+    """Bandes pour les périodes, lignes de rupture pour les régimes et les sanctions, ajoutées en une
+    seule mise à jour de la mise en page (sans répétition par sous-graphique)"""
+    formes, notes = event_layout(evenements)
+    if formes:
+        fig.update_layout(shapes=list(fig.layout.shapes) + formes,
+                          annotations=list(fig.layout.annotations) + notes)
+    return fig
+
+
+def capabilities_evolution(annees, capacites, evenements=()):
+    """Évolution des capacités principales ({nom: (valeurs, couleur)})"""
+    fig = go.Figure()
+    for nom, (valeurs, couleur) in capacites.items():
+        fig.add_trace(go.Scatter(
+            x=annees, y=valeurs,
+            mode='lines', name=nom,
+            line=dict(color=couleur, width=4),
+            hovertemplate=f"{nom}: %{{y:.1f}}%<extra></extra>"
+        ))
+    fig.update_layout(
+        title="📈 ÉVOLUTION DES CAPACITÉS STRATÉGIQUES (2000-2027)",
+        xaxis_title="Année",
+        yaxis_title="Niveau de Capacité (%)",
+        height=500,
+        template="plotly_white",
+        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1)
+    )
+    return annotate_events(fig, evenements)
+
+
+def strategic_programs(annees, series, evenements=()):
+    """Programmes stratégiques comparés ({nom: valeurs}), axe secondaire après la première série"""
+    fig = make_subplots(specs=[[{"secondary_y": True}]])
+    for i, (nom, valeurs) in enumerate(series.items()):
+        fig.add_trace(
+            go.Scatter(x=annees, y=valeurs, name=nom,
+                       line=dict(width=4)),
+            secondary_y=(i > 0)
+        )
+    fig.update_layout(
+        title="🚀 PROGRAMMES STRATÉGIQUES - ÉVOLUTION COMPARÉE",
+        height=500,
+        template="plotly_white"
+    )
+    return annotate_events(fig, evenements)
+
+
+def weapon_systems(systems_data):
+    """Portée vs précision des systèmes d'armes"""
+    fig = px.scatter(pd.DataFrame(systems_data), x='Portée (km)', y='Précision (m)',
+                     size='Portée (km)', color='Statut',
+                     hover_name='Système', log_x=True,
+                     title="🎯 CARACTÉRISTIQUES DES SYSTÈMES D'ARMES",
+                     size_max=30)
+    fig.update_layout(height=500)
+    return fig
+
+
+def modernization(modernization_data):
+    """Niveaux de modernisation 2000 vs 2027 par domaine"""
+    fig = go.Figure()
+    fig.add_trace(go.Bar(name='2000', x=modernization_data['Domaine'], y=modernization_data['Niveau 2000'],
+                         marker_color='#024FA2'))
+    fig.add_trace(go.Bar(name='2027', x=modernization_data['Domaine'], y=modernization_data['Niveau 2027'],
+                         marker_color='#ED1C27'))
+    fig.update_layout(title="📈 MODERNISATION DES CAPACITÉS MILITAIRES",
+                      barmode='group', height=500)
+    return fig
+
+
+def sanctions_effects(temps, metriques, base, nominal, quantiles, scenarios, scenario, evenements=()):
+    """Séries sanctionnées du scénario retenu (bande P5-P95) et effet relatif de chaque scénario,
+    une ligne de sous-graphiques par métrique"""
+    s = scenarios.index(scenario)
+    couleurs = ['#024FA2', '#ffa502', '#00b894', '#ED1C27']
+    fig = make_subplots(rows=len(metriques), cols=2, shared_xaxes=True, vertical_spacing=0.08,
+                        subplot_titles=[t for m in metriques for t in (
+                            f"{m.replace('_', ' ')} — {scenario}", "Effet relatif (%)")])
+    for i, m in enumerate(metriques):
+        ligne = i + 1
+        if quantiles is not None:
+            bas, _, haut = quantiles[:, i, s]
+            fig.add_trace(go.Scatter(x=np.concatenate([temps, temps[::-1]]),
+                                     y=np.concatenate([haut, bas[::-1]]), fill='toself',
+                                     fillcolor='rgba(237, 28, 39, 0.15)', line=dict(width=0),
+                                     name='P5-P95', showlegend=ligne == 1, hoverinfo='skip'),
+                          row=ligne, col=1)
+        fig.add_trace(go.Scatter(x=temps, y=base[i], name='Sans sanctions', showlegend=ligne == 1,
+                                 line=dict(color='gray', dash='dash')), row=ligne, col=1)
+        fig.add_trace(go.Scatter(x=temps, y=nominal[i, s], name='Avec sanctions',
+                                 showlegend=ligne == 1, line=dict(color='#ED1C27', width=3)), row=ligne, col=1)
+        effets = (nominal[i] / base[i] - 1) * 100
+        for k, nom in enumerate(scenarios):
+            fig.add_trace(go.Scatter(x=temps, y=effets[k], name=nom, legendgroup=nom,
+                                     showlegend=ligne == 1,
+                                     line=dict(color=couleurs[k % len(couleurs)], width=4 if k == s else 2)),
+                          row=ligne, col=2)
+    fig.update_layout(title="📉 SÉRIES SANCTIONNÉES ET EFFET PAR SCÉNARIO",
+                      height=300 * len(metriques) + 120, template="plotly_white",
+                      legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1))
+    return annotate_events(fig, evenements)
+
+
+def build_chart(builder, kwargs, webgl_threshold, measure=False):
+    """Construit et compacte une figure ; retourne (dict de figure, titre, statistiques, ms de construction)"""
+    debut = time.perf_counter()
+    fig = builder(**kwargs)
+    apply_webgl(fig, webgl_threshold)
+    stats = optimize_figure(fig, measure=measure)
+    return fig.to_dict(), fig.layout.title.text, stats, (time.perf_counter() - debut) * 1000
+
+
+def attach_figure(figure):
+    """Figure reconstruite à partir du dictionnaire d'un worker (déjà validée, pas de revalidation)"""
+    return go.Figure(figure, _validate=False)
+
+
+def build_charts(taches, pool, webgl_threshold, measure=False):
+    """Construit les figures de `taches` [(builder, kwargs)] dans le pool ; génère (indice, résultat)
+    dans l'ordre d'achèvement"""
+    futures = {pool.submit(build_chart, builder, kwargs, webgl_threshold, measure): i
+               for i, (builder, kwargs) in enumerate(taches)}
+    for future in as_completed(futures):
+        yield futures[future], future.result()
@@ -0,0 +1,98 @@
+# country_profiles.py
+"""Profils de pays comparables sur les axes du modèle vectorisé (API de plugins).
+
+Un profil fournit une configuration (bases budget / effectifs / exercices, priorités) et des
+coefficients propres de `defense_model`. Les plugins sont des fichiers Python du dossier
+`profiles/` (et de `RPDC_PROFILES_DIR`) qui appellent `register_profile` :
+
+    from country_profiles import register_profile
+    register_profile("Pays X", {"budget_base": 4.0, "personnel_base": 300, "priorites": ["missiles"]},
+                     {"cyber_croissance": 5.0}, description="...")
+
+Tous les profils sont évalués ensemble : les coefficients qui diffèrent deviennent des colonnes
+(E, 1) et `defense_model.generate` produit le cube (entité × métrique × année) en une seule passe ;
+un profil de plus ajoute une ligne aux tableaux, pas une génération.
+"""
+import glob
+import hashlib
+import importlib.util
+import os
+import threading
+
+import numpy as np
+
+import defense_model
+
+PROFILES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "profiles")
+
+PROFILES = {}
+_plugins_charges = {}
+_noms_par_plugin = {}
+_chargement = threading.local()
+_lock = threading.Lock()
+
+
+def register_profile(nom, config, coefficients=None, description=""):
+    """Enregistre (ou remplace) un profil ; les coefficients doivent exister dans le modèle"""
+    inconnus = set(coefficients or {}) - set(defense_model.DEFAULT_COEFFICIENTS)
+    if inconnus:
+        raise ValueError(f"Coefficients inconnus pour {nom}: {', '.join(sorted(inconnus))}")
+    PROFILES[nom] = {"nom": nom, "config": dict(config), "coefficients": dict(coefficients or {}),
+                     "description": description}
+    plugin = getattr(_chargement, "plugin", None)
+    if plugin is not None:
+        _noms_par_plugin.setdefault(plugin, set()).add(nom)
+    return PROFILES[nom]
+
+
+def _decharger(chemin):
+    """Retire les profils enregistrés par un plugin (avant réimport ou après suppression)"""
+    for nom in _noms_par_plugin.pop(chemin, ()):
+        PROFILES.pop(nom, None)
+
+
+def load_plugins(dossiers=None):
+    """Importe les plugins nouveaux ou modifiés et retire les profils des plugins modifiés ou
+    supprimés ; retourne {chemin: erreur} des plugins invalides"""
+    if dossiers is None:
+        dossiers = [PROFILES_DIR] + [d for d in os.environ.get("RPDC_PROFILES_DIR", "").split(os.pathsep) if d]
+    erreurs = {}
+    with _lock:
+        presents = set()
+        for dossier in dossiers:
+            for chemin in sorted(glob.glob(os.path.join(dossier, "*.py"))):
+                presents.add(chemin)
+                mtime = os.path.getmtime(chemin)
+                if _plugins_charges.get(chemin) == mtime:
+                    continue
+                _decharger(chemin)
+                nom = "rpdc_profile_" + hashlib.sha1(chemin.encode("utf-8")).hexdigest()[:8]
+                spec = importlib.util.spec_from_file_location(nom, chemin)
+                _chargement.plugin = chemin
+                try:
+                    spec.loader.exec_module(importlib.util.module_from_spec(spec))
+                except Exception as e:  # un plugin invalide ne doit pas casser le dashboard
+                    erreurs[chemin] = f"{type(e).__name__}: {e}"
+                finally:
+                    _chargement.plugin = None
+                _plugins_charges[chemin] = mtime
+        for chemin in set(_plugins_charges) - presents:
+            _decharger(chemin)
+            del _plugins_charges[chemin]
+    return erreurs
+
+
+def generate_profiles(annees, profils):
+    """(métriques, cube E × M × T) de tous les profils en une passe ; une métrique hors des priorités
+    d'un profil vaut NaN pour ce profil"""
+    coefficients = [defense_model.coefficients(p["config"], p["coefficients"]) for p in profils]
+    overrides = {}
+    for nom, valeur in coefficients[0].items():
+        valeurs = [c[nom] for c in coefficients]
+        overrides[nom] = np.array(valeurs, dtype=np.float64)[:, None] if len(set(valeurs)) > 1 else valeur
+    priorites = sorted({pr for p in profils for pr in p["config"].get("priorites", [])})
+    series = defense_model.generate(annees, {"priorites": priorites}, overrides)
+    metriques = list(series)
+    cube = np.stack([np.broadcast_to(series[m], (len(profils), len(annees))) for m in metriques], axis=1)
+    actives = np.array([[m in defense_model.metric_functions(p["config"]) for m in metriques] for p in profils])
+    return metriques, np.where(actives[:, :, None], cube, np.nan)
@@ -0,0 +1,346 @@
+# defense_model.py
+"""Modèle vectorisé des courbes simulées du dashboard avancé.
+
+Chaque métrique est une fonction `(annees, c)` où `c` contient les coefficients du modèle.
+Les coefficients peuvent être des scalaires ou des tableaux (B, 1) : la sortie est alors un
+tableau (B, T) et un lot entier de jeux de coefficients s'évalue en une seule passe numpy.
+Les périodes géopolitiques (modificateurs, ruptures de régime) viennent de la table
+d'événements de `geopolitical_events`.
+"""
+import numpy as np
+
+from geopolitical_events import event_factors, regime_index
+
+ANNEE_ORIGINE = 2000
+
+# Coefficients par défaut (valeurs historiques des simulate_* du dashboard)
+DEFAULT_COEFFICIENTS = {
+    "budget_base": 2.0, "budget_croissance": 0.035,
+    "budget_mult_tensions": 1.1, "budget_mult_nucleaire": 1.15, "budget_mult_modernisation": 1.2,
+    "personnel_base": 100.0, "personnel_croissance": 0.008,
+    "pib_base": 22.0, "pib_croissance": 0.2,
+    "exercices_base": 30.0, "exercices_croissance": 3.0, "exercices_amplitude": 5.0,
+    "readiness_base": 65.0, "readiness_croissance": 1.5, "readiness_bonus_2010": 5.0,
+    "readiness_bonus_2020": 8.0, "readiness_max": 95.0,
+    "dissuasion_conventionnelle": 30.0, "dissuasion_nucleaire": 45.0, "dissuasion_icbm": 65.0,
+    "dissuasion_mature": 80.0, "dissuasion_croissance": 2.0, "dissuasion_max": 95.0,
+    "mobilisation_base": 72.0, "mobilisation_reduction": 2.0, "mobilisation_min": 12.0,
+    "tests_base": 1.0, "tests_croissance_2006": 1.0, "tests_croissance_2012": 2.0, "tests_croissance_2017": 4.0,
+    "tech_base": 30.0, "tech_croissance": 3.0, "tech_max": 85.0,
+    "artillerie_base": 70.0, "artillerie_croissance": 2.0, "artillerie_max": 95.0,
+    "ad_base": 40.0, "ad_croissance": 3.0, "ad_max": 85.0,
+    "logistique_base": 50.0, "logistique_croissance": 2.5, "logistique_max": 90.0,
+    "cyber_base": 30.0, "cyber_croissance": 4.0, "cyber_max": 88.0,
+    "munitions_base": 60.0, "munitions_croissance": 2.0, "munitions_max": 95.0,
+    "ogives_croissance_2013": 3.0, "ogives_croissance_2017": 4.0,
+    "portee_croissance_2006": 200.0, "portee_croissance_2012": 1000.0, "portee_icbm": 15000.0,
+    "mirv_croissance": 3.0, "mirv_max": 8.0,
+    "souterrains_base": 20.0, "souterrains_croissance": 2.0, "souterrains_max": 80.0,
+    "precision_base": 2000.0, "precision_amelioration": 80.0, "precision_min": 50.0,
+    "lancement_base": 40.0, "lancement_croissance": 3.0, "lancement_max": 92.0,
+    "plateformes_base": 20.0, "plateformes_croissance": 4.0, "plateformes_max": 85.0,
+    "attaques_base": 5.0, "attaques_croissance": 2.0,
+    "cmd_cyber_base": 25.0, "cmd_cyber_croissance": 5.0, "cmd_cyber_max": 90.0,
+    "cyber_def_base": 35.0, "cyber_def_croissance": 4.0, "cyber_def_max": 85.0,
+}
+
+# Scénarios : facteurs multiplicatifs appliqués aux coefficients de la configuration. Ce sont des
+# hypothèses illustratives (ordres de grandeur choisis pour contraster les scénarios), non calibrées
+SCENARIO_MODIFIERS = {
+    "Statut Quo": {},
+    "Escalation Modérée": {
+        "budget_croissance": 1.3, "budget_mult_modernisation": 1.05, "exercices_croissance": 1.4,
+        "tests_croissance_2017": 1.5, "dissuasion_croissance": 1.25, "ogives_croissance_2017": 1.3,
+    },
+    "Modernisation Accélérée": {
+        "tech_croissance": 1.5, "readiness_croissance": 1.3, "ad_croissance": 1.4, "cyber_croissance": 1.5,
+        "plateformes_croissance": 1.4, "lancement_croissance": 1.3, "precision_amelioration": 1.3,
+        "mobilisation_reduction": 1.2,
+    },
+    "Crise Majeure": {
+        "budget_mult_modernisation": 1.35, "pib_croissance": 1.8, "exercices_amplitude": 2.0,
+        "munitions_croissance": 1.6, "mobilisation_reduction": 1.5, "tests_croissance_2017": 2.0,
+        "logistique_croissance": 0.6, "ogives_croissance_2017": 1.6,
+    },
+}
+
+# Coefficients lus dans la configuration de la sélection (get_advanced_config)
+CONFIG_COEFFICIENTS = ("budget_base", "personnel_base", "exercices_base")
+
+
+def coefficients(config=None, overrides=None, profil="avance"):
+    """Coefficients effectifs : défauts du profil, puis valeurs de la configuration, puis surcharges"""
+    c = dict(MODEL_PROFILES[profil]["coefficients"])
+    for nom in CONFIG_COEFFICIENTS:
+        if config and nom in config:
+            c[nom] = config[nom]
+    if overrides:
+        c.update(overrides)
+    return c
+
+
+def _t(annees, origine=ANNEE_ORIGINE):
+    return np.asarray(annees, dtype=np.float64) - origine
+
+
+def budget_trend(annees, c):
+    return c["budget_base"] * (1 + c["budget_croissance"] * _t(annees))
+
+
+def budget(annees, c):
+    """Budget avec les modificateurs des périodes géopolitiques"""
+    return budget_trend(annees, c) * event_factors(annees, c, ("Budget_Defense_Mds",))["Budget_Defense_Mds"]
+
+
+def personnel(annees, c):
+    return c["personnel_base"] * (1 + c["personnel_croissance"] * _t(annees))
+
+
+def military_gdp(annees, c):
+    return c["pib_base"] + c["pib_croissance"] * _t(annees)
+
+
+def exercises(annees, c):
+    t = _t(annees)
+    return c["exercices_base"] + c["exercices_croissance"] * t + c["exercices_amplitude"] * np.sin(2 * np.pi * t / 4)
+
+
+def readiness(annees, c):
+    a = np.asarray(annees)
+    base = (c["readiness_base"] + c["readiness_croissance"] * _t(a)
+            + c["readiness_bonus_2010"] * (a >= 2010) + c["readiness_bonus_2020"] * (a >= 2020))
+    return np.minimum(base, c["readiness_max"])
+
+
+def deterrence(annees, c):
+    regime, ecoule = regime_index(annees)
+    base = np.select([regime == 0, regime == 1, regime == 2],
+                     [c["dissuasion_conventionnelle"], c["dissuasion_nucleaire"], c["dissuasion_icbm"]],
+                     c["dissuasion_mature"] + c["dissuasion_croissance"] * ecoule)
+    return np.minimum(base, c["dissuasion_max"])
+
+
+def _floored_decline(prefixe, origine=ANNEE_ORIGINE):
+    """Décroissance linéaire avec plancher `max(base - reduction * (annee - origine), min)`"""
+    def courbe(annees, c):
+        return np.maximum(c[f"{prefixe}_base"] - c[f"{prefixe}_reduction"] * _t(annees, origine), c[f"{prefixe}_min"])
+    courbe.__name__ = prefixe
+    return courbe
+
+
+mobilization = _floored_decline("mobilisation")
+
+
+def missile_tests(annees, c):
+    a = np.asarray(annees)
+    return np.where(a < 2006, c["tests_base"],
+                    np.where(a < 2012, 2 + c["tests_croissance_2006"] * _t(a, 2006),
+                             np.where(a < 2017, 8 + c["tests_croissance_2012"] * _t(a, 2012),
+                                      20 + c["tests_croissance_2017"] * _t(a, 2017))))
+
+
+def _capped_linear(prefixe, origine=ANNEE_ORIGINE):
+    """Courbe linéaire plafonnée `min(base + croissance * (annee - origine), max)`"""
+    def courbe(annees, c):
+        return np.minimum(c[f"{prefixe}_base"] + c[f"{prefixe}_croissance"] * _t(annees, origine), c[f"{prefixe}_max"])
+    courbe.__name__ = prefixe
+    return courbe
+
+
+tech_development = _capped_linear("tech")
+artillery = _capped_linear("artillerie")
+air_defense = _capped_linear("ad")
+logistics = _capped_linear("logistique")
+cyber = _capped_linear("cyber")
+ammunition = _capped_linear("munitions")
+underground_tests = _capped_linear("souterrains")
+launch_success = _capped_linear("lancement")
+platforms = _capped_linear("plateformes")
+cyber_command = _capped_linear("cmd_cyber", 2010)
+cyber_defense = _capped_linear("cyber_def", 2010)
+
+
+def nuclear_arsenal(annees, c):
+    regime, ecoule = regime_index(annees)
+    return np.select([regime == 0, regime == 1, regime == 2],
+                     [0.0, np.maximum(5 + ecoule, 10), 15 + c["ogives_croissance_2013"] * ecoule],
+                     30 + c["ogives_croissance_2017"] * ecoule)
+
+
+def missile_range(annees, c):
+    a = np.asarray(annees)
+    return np.where(a < 2006, 500.0,
+                    np.where(a < 2012, 1000 + c["portee_croissance_2006"] * _t(a, 2006),
+                             np.where(a < 2017, 3000 + c["portee_croissance_2012"] * _t(a, 2012),
+                                      c["portee_icbm"] + 0 * _t(a))))
+
+
+def mirv(annees, c):
+    return np.maximum(0, np.minimum(c["mirv_croissance"] * _t(annees, 2017), c["mirv_max"]))
+
+
+def missile_accuracy(annees, c):
+    return np.maximum(c["precision_base"] - c["precision_amelioration"] * _t(annees), c["precision_min"])
+
+
+def cyber_attacks(annees, c):
+    return np.maximum(c["attaques_base"] + c["attaques_croissance"] * _t(annees, 2010), 0)
+
+
+# Métriques communes puis métriques conditionnées par les priorités de la configuration
+BASE_METRICS = {
+    "Budget_Defense_Mds": budget_trend,
+    "Personnel_Milliers": personnel,
+    "PIB_Militaire_Pourcent": military_gdp,
+    "Exercices_Militaires": exercises,
+    "Readiness_Operative": readiness,
+    "Capacite_Dissuasion": deterrence,
+    "Temps_Mobilisation_Jours": mobilization,
+    "Tests_Missiles": missile_tests,
+    "Developpement_Technologique": tech_development,
+    "Capacite_Artillerie": artillery,
+    "Couverture_AD": air_defense,
+    "Resilience_Logistique": logistics,
+    "Cyber_Capabilities": cyber,
+    "Production_Munitions": ammunition,
+}
+PRIORITY_METRICS = {
+    "nucleaire": {
+        "Stock_Ogives_Nucleaires": nuclear_arsenal,
+        "Portee_Max_Missiles_Km": missile_range,
+        "Tetes_Multiples": mirv,
+        "Essais_Souterrains": underground_tests,
+    },
+    "missiles": {
+        "Precision_Missiles_Metres": missile_accuracy,
+        "Taux_Success_Lancement": launch_success,
+        "Diversification_Plateformes": platforms,
+    },
+    "cyber": {
+        "Attaques_Cyber_Reussies": cyber_attacks,
+        "Reseau_Commandement_Cyber": cyber_command,
+        "Cyber_Defense_Niveau": cyber_defense,
+    },
+}
+
+
+# Profil "militaire" : courbes de la vue Analyse Militaire (origine 2012, autres coefficients)
+MILITARY_ORIGIN = 2012
+MILITARY_COEFFICIENTS = {
+    "budget_base": 2.0, "budget_croissance": 0.04,
+    "personnel_base": 100.0, "personnel_croissance": 0.01,
+    "exercices_base": 30.0, "exercices_croissance": 2.0,
+    "readiness_base": 70.0, "readiness_croissance": 2.0, "readiness_max": 95.0,
+    "dissuasion_base": 40.0, "dissuasion_croissance": 5.0, "dissuasion_max": 90.0,
+    "mobilisation_base": 48.0, "mobilisation_reduction": 1.5, "mobilisation_min": 24.0,
+    "tests_base": 3.0, "tests_croissance_2015": 2.0, "tests_croissance_2020": 3.0,
+    "tech_base": 35.0, "tech_croissance": 6.0, "tech_max": 85.0,
+    "artillerie_base": 75.0, "artillerie_croissance": 1.5, "artillerie_max": 95.0,
+    "portee_base": 1300.0, "portee_croissance": 300.0, "portee_max": 15000.0,
+    "cyber_base": 50.0, "cyber_croissance": 4.0, "cyber_max": 85.0,
+}
+
+
+def _proportional_growth(prefixe, origine):
+    """Croissance proportionnelle `base * (1 + croissance * (annee - origine))`"""
+    def courbe(annees, c):
+        return c[f"{prefixe}_base"] * (1 + c[f"{prefixe}_croissance"] * _t(annees, origine))
+    courbe.__name__ = prefixe
+    return courbe
+
+
+def military_exercises(annees, c):
+    return c["exercices_base"] + c["exercices_croissance"] * _t(annees, MILITARY_ORIGIN)
+
+
+def military_missile_tests(annees, c):
+    a = np.asarray(annees)
+    return np.where(a < 2015, c["tests_base"] + _t(a, MILITARY_ORIGIN),
+                    np.where(a < 2020, 6 + c["tests_croissance_2015"] * _t(a, 2014),
+                             16 + c["tests_croissance_2020"] * _t(a, 2019)))
+
+
+def nuclear_tests(annees, c):
+    a = np.asarray(annees)
+    return np.select([a == 2013, a == 2016, a == 2017, a >= 2022],
+                     [1.0, 2.0, 1.0, np.minimum(1 + _t(a, 2022), 3)], 0.0)
+
+
+military_budget = _proportional_growth("budget", MILITARY_ORIGIN)
+military_personnel = _proportional_growth("personnel", MILITARY_ORIGIN)
+military_readiness = _capped_linear("readiness", MILITARY_ORIGIN)
+military_deterrence = _capped_linear("dissuasion", MILITARY_ORIGIN)
+military_mobilization = _floored_decline("mobilisation", MILITARY_ORIGIN)
+military_tech = _capped_linear("tech", MILITARY_ORIGIN)
+military_artillery = _capped_linear("artillerie", MILITARY_ORIGIN)
+military_missile_range = _capped_linear("portee", MILITARY_ORIGIN)
+military_cyber = _capped_linear("cyber", MILITARY_ORIGIN)
+
+MILITARY_BASE_METRICS = {
+    "Budget_Defense_Mds": military_budget,
+    "Personnel_Milliers": military_personnel,
+    "Exercices_Militaires": military_exercises,
+    "Readiness_Operative": military_readiness,
+    "Capacite_Dissuasion": military_deterrence,
+    "Temps_Mobilisation_Jours": military_mobilization,
+    "Tests_Missiles": military_missile_tests,
+    "Developpement_Technologique": military_tech,
+    "Capacite_Artillerie": military_artillery,
+}
+MILITARY_PRIORITY_METRICS = {
+    "nucleaire": {"Tests_Nucleaires": nuclear_tests},
+    "missiles": {"Portee_Missiles_Km": military_missile_range},
+    "cyber": {"Capacite_Cyber": military_cyber},
+}
+
+# Profils du moteur : jeu de coefficients, métriques, période de chaque vue et application des
+# modificateurs d'événements
+MODEL_PROFILES = {
+    "avance": {"coefficients": DEFAULT_COEFFICIENTS, "metriques": BASE_METRICS,
+               "priorites": PRIORITY_METRICS, "annees": range(2000, 2028), "evenements": True},
+    "militaire": {"coefficients": MILITARY_COEFFICIENTS, "metriques": MILITARY_BASE_METRICS,
+                  "priorites": MILITARY_PRIORITY_METRICS, "annees": range(MILITARY_ORIGIN, 2028),
+                  "evenements": False},
+}
+
+
+def metric_functions(config, profil="avance"):
+    """Fonctions de métriques actives pour une configuration"""
+    modele = MODEL_PROFILES[profil]
+    fonctions = dict(modele["metriques"])
+    for priorite, metriques in modele["priorites"].items():
+        if priorite in config.get("priorites", []):
+            fonctions.update(metriques)
+    return fonctions
+
+
+def generate(annees, config, overrides=None, profil="avance"):
+    """Toutes les métriques actives : {métrique: tableau (T,) ou (B, T)}"""
+    c = coefficients(config, overrides, profil)
+    forme = np.broadcast_shapes(*(np.shape(v) for v in c.values()), (1, len(annees))) \
+        if any(np.ndim(v) for v in c.values()) else (len(annees),)
+    series = {nom: f(annees, c) for nom, f in metric_functions(config, profil).items()}
+    if MODEL_PROFILES[profil]["evenements"]:
+        for nom, facteur in event_factors(annees, c, series).items():
+            series[nom] = series[nom] * facteur
+    return {nom: np.broadcast_to(v, forme) for nom, v in series.items()}
+
+
+def scenario_overrides(config, scenarios):
+    """Coefficients modifiés par les scénarios, en colonnes (S, 1) pour une évaluation en un lot"""
+    c = coefficients(config)
+    noms = sorted({nom for s in scenarios for nom in SCENARIO_MODIFIERS[s]})
+    return {nom: np.array([[c[nom] * SCENARIO_MODIFIERS[s].get(nom, 1.0)] for s in scenarios]) for nom in noms}
+
+
+def compare_scenarios(annees, config, scenarios):
+    """Séries (M, S, T) de tous les scénarios en une passe, écarts absolus et relatifs au premier
+    scénario (référence) ; retourne (métriques, séries, écarts, écarts en %)"""
+    series = generate(annees, config, scenario_overrides(config, scenarios))
+    metriques = list(series)
+    cube = np.stack([np.broadcast_to(series[m], (len(scenarios), len(annees))) for m in metriques])
+    ecarts = cube - cube[:, :1]
+    reference = cube[:, :1]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        pourcents = np.where(reference != 0, ecarts / np.abs(reference) * 100, 0.0)
+    return metriques, cube, ecarts, pourcents
@@ -0,0 +1,132 @@
+# figure_payload.py
+"""Réduction de la charge utile JSON des figures Plotly envoyées au navigateur.
+
+- tableaux numériques encodés en binaire (typed arrays base64) au plus petit type fidèle :
+  entiers courts pour les années/compteurs, float32 quand la précision le permet ;
+- axe x régulier (les années) remplacé par `x0`/`dx` au lieu d'être répété dans chaque trace ;
+- template remplacé par une copie sans les valeurs par défaut des types de trace absents de la
+  figure (mise en page et défauts des traces présentes intacts : rendu identique), enregistrée
+  une seule fois par processus.
+"""
+import hashlib
+import time
+
+import numpy as np
+import plotly.io as pio
+
+FLOAT32_RTOL = 1e-5
+ARRAY_PROPS = ("x", "y", "z")
+MARKER_PROPS = ("size", "color")
+
+_lean_templates = {}
+
+
+def figure_bytes(fig):
+    """Taille en octets du JSON transmis pour la figure"""
+    return len(pio.to_json(fig, validate=False).encode("utf-8"))
+
+
+def compact_array(valeurs, rtol=FLOAT32_RTOL):
+    """Plus petit dtype numérique restituant les valeurs (None si non numérique)"""
+    try:
+        arr = np.asarray(valeurs)
+    except (TypeError, ValueError):
+        return None
+    if arr.dtype.kind not in "biuf" or arr.size == 0:
+        return None
+    if arr.dtype.kind == "f":
+        if not np.all(np.isfinite(arr)):
+            a32 = arr.astype(np.float32)
+            return a32 if np.allclose(a32, arr, rtol=rtol, equal_nan=True) else arr
+        if not np.all(arr == np.round(arr)):
+            a32 = arr.astype(np.float32)
+            return a32 if np.allclose(a32, arr, rtol=rtol, atol=0) else arr
+    for dtype in (np.int8, np.int16, np.int32):
+        info = np.iinfo(dtype)
+        if arr.min() >= info.min and arr.max() <= info.max:
+            return arr.astype(dtype)
+    return arr
+
+
+def regular_axis(valeurs):
+    """(x0, dx) si l'axe est numérique et régulièrement espacé, sinon None"""
+    try:
+        arr = np.asarray(valeurs, dtype=float)
+    except (TypeError, ValueError):
+        return None
+    if arr.ndim != 1 or arr.size < 3:
+        return None
+    pas = np.diff(arr)
+    if pas[0] == 0 or not np.allclose(pas, pas[0]):
+        return None
+    x0, dx = arr[0].item(), pas[0].item()
+    return (int(x0) if x0.is_integer() else x0, int(dx) if dx.is_integer() else dx)
+
+
+def lean_template(template, types):
+    """Template au rendu identique pour des traces de `types` : mise en page complète, défauts de
+    trace limités à ces types (les autres n'ont aucun effet) ; enregistré une fois par
+    (template, types) dans `pio.templates`"""
+    source = template.to_plotly_json()
+    types = tuple(sorted(types))
+    cle = hashlib.sha1(pio.json.to_json_plotly([source, types]).encode("utf-8")).hexdigest()[:12]
+    nom = _lean_templates.get(cle)
+    if nom is None:
+        donnees = source.get("data", {})
+        nom = f"rpdc_lean_{cle}"
+        pio.templates[nom] = {"layout": source.get("layout", {}),
+                              "data": {t: donnees[t] for t in types if t in donnees}}
+        _lean_templates[cle] = nom
+    return pio.templates[nom]
+
+
+def optimize_figure(fig, measure=False):
+    """Compacte la figure en place ; retourne les tailles avant/après si `measure`"""
+    debut = time.perf_counter()
+    avant = figure_bytes(fig) if measure else None
+
+    for trace in fig.data:
+        props = trace.to_plotly_json()
+        if "x" in props and props["x"] is not None and "x0" in trace:
+            axe = regular_axis(props["x"])
+            if axe is not None:
+                trace.update(x=None, x0=axe[0], dx=axe[1])
+        for prop in ARRAY_PROPS:
+            if prop in trace and trace[prop] is not None:
+                compact = compact_array(trace[prop])
+                if compact is not None:
+                    trace[prop] = compact
+        marker = props.get("marker") or {}
+        for prop in MARKER_PROPS:
+            valeur = marker.get(prop)
+            if valeur is not None and np.ndim(valeur) == 1:
+                compact = compact_array(valeur)
+                if compact is not None:
+                    trace.marker[prop] = compact
+
+    if fig.layout.template is not None:
+        fig.layout.template = lean_template(fig.layout.template, {trace.type for trace in fig.data})
+
+    if not measure:
+        return None
+    return {
+        "octets_avant": avant,
+        "octets_apres": figure_bytes(fig),
+        "ms": (time.perf_counter() - debut) * 1000,
+    }
+
+
+class PayloadReport:
+    """Tailles des figures d'un rerun, avant et après optimisation"""
+
+    def __init__(self):
+        self.lignes = []
+
+    def add(self, titre, stats):
+        if stats is not None:
+            self.lignes.append({"Figure": titre or "(sans titre)", **stats})
+
+    def totals(self):
+        avant = sum(l["octets_avant"] for l in self.lignes)
+        apres = sum(l["octets_apres"] for l in self.lignes)
+        return avant, apres
@@ -0,0 +1,108 @@
+# geopolitical_events.py
+"""Table unique des événements géopolitiques, indexée par intervalles d'années.
+
+Chaque événement couvre un intervalle fermé [début, fin] (fin infinie pour un événement en
+cours) d'une catégorie :
+
+- `periode` : période de tension ou d'effort, porteuse de modificateurs multiplicatifs ;
+- `regime` : ères stratégiques successives (sans chevauchement), ruptures des courbes de
+  dissuasion et d'arsenal ;
+- `sanction` : résolutions du Conseil de sécurité (intervalle d'une année, impact sur 10).
+
+Les modificateurs relient un événement à une métrique et au coefficient du modèle qui donne le
+facteur ; ils restent ainsi pilotables par les scénarios et l'analyse de sensibilité. Pour des
+années données, tous les masques événement × année sont calculés en une comparaison vectorisée
+et tous les facteurs en un produit masqué : un événement de plus ajoute une ligne aux tableaux,
+pas de boucle par année.
+"""
+import numpy as np
+import pandas as pd
+
+_EVENEMENTS = [
+    # (début, fin, nom, catégorie, impact)
+    (2006, 2009, "Tensions après le premier essai nucléaire", "periode", np.nan),
+    (2013, 2017, "Accélération des programmes nucléaire et balistique", "periode", np.nan),
+    (2022, np.inf, "Modernisation des forces", "periode", np.nan),
+    (-np.inf, 2005, "Ère conventionnelle", "regime", np.nan),
+    (2006, 2012, "Ère nucléaire", "regime", np.nan),
+    (2013, 2016, "Ère balistique intercontinentale", "regime", np.nan),
+    (2017, np.inf, "Dissuasion mature", "regime", np.nan),
+    (2006, 2006, "Résolution 1718", "sanction", 3),
+    (2009, 2009, "Résolution 1874", "sanction", 5),
+    (2013, 2013, "Résolution 2094", "sanction", 6),
+    (2016, 2016, "Résolution 2270", "sanction", 7),
+    (2017, 2017, "Résolution 2371", "sanction", 8),
+    (2022, 2022, "Nouvelles sanctions", "sanction", 8),
+]
+EVENTS = pd.DataFrame(
+    [e[2:] for e in _EVENEMENTS], columns=["nom", "categorie", "impact"],
+    index=pd.IntervalIndex.from_arrays([float(e[0]) for e in _EVENEMENTS], [float(e[1]) for e in _EVENEMENTS],
+                                       closed="both", name="periode"),
+)
+
+# (événement, métrique, coefficient du modèle donnant le facteur multiplicatif)
+EVENT_MODIFIERS = [
+    ("Tensions après le premier essai nucléaire", "Budget_Defense_Mds", "budget_mult_tensions"),
+    ("Accélération des programmes nucléaire et balistique", "Budget_Defense_Mds", "budget_mult_nucleaire"),
+    ("Modernisation des forces", "Budget_Defense_Mds", "budget_mult_modernisation"),
+]
+
+REGIMES = EVENTS[EVENTS["categorie"] == "regime"]
+
+_lignes_modificateurs = np.array([np.flatnonzero(EVENTS["nom"].to_numpy() == e)[0] for e, _, _ in EVENT_MODIFIERS],
+                                 dtype=np.intp)
+
+
+def event_masks(annees, evenements=EVENTS):
+    """Masque (E, T) : l'année t est dans l'intervalle de l'événement e"""
+    a = np.asarray(annees, dtype=np.float64)
+    return (evenements.index.left.to_numpy()[:, None] <= a) & (a <= evenements.index.right.to_numpy()[:, None])
+
+
+def regime_index(annees):
+    """(indice du régime de chaque année dans REGIMES, années écoulées depuis le début du régime)
+
+    Les régimes sont pris fermés à gauche et prolongés jusqu'au début du suivant : une année
+    fractionnaire entre deux intervalles (2012.5) relève du régime commencé avant elle."""
+    a = np.asarray(annees, dtype=np.float64)
+    debuts = REGIMES.index.left.to_numpy()
+    indices = np.clip(np.searchsorted(debuts, a, side="right") - 1, 0, len(debuts) - 1)
+    debuts = debuts[indices]
+    return indices, np.where(np.isfinite(debuts), a - debuts, 0.0)
+
+
+def event_factors(annees, c, metriques=None):
+    """{métrique: facteur (T,) ou (B, T)} produit des modificateurs actifs, en une passe masquée"""
+    retenus = [i for i, (_, m, _) in enumerate(EVENT_MODIFIERS) if metriques is None or m in metriques]
+    if not retenus:
+        return {}
+    masques = event_masks(annees)[_lignes_modificateurs[retenus]]
+    valeurs = np.stack(np.broadcast_arrays(*(np.asarray(c[EVENT_MODIFIERS[i][2]], dtype=np.float64)
+                                             for i in retenus)))
+    # valeurs (R,) ou (R, B, 1) ; masques alignés en (R, T) ou (R, 1, T)
+    if valeurs.ndim == 1:
+        valeurs = valeurs[:, None]
+    else:
+        masques = masques.reshape(len(retenus), *(1,) * (valeurs.ndim - 2), -1)
+    facteurs = np.where(masques, valeurs, 1.0)
+    noms = [EVENT_MODIFIERS[i][1] for i in retenus]
+    return {m: facteurs[[j for j, n in enumerate(noms) if n == m]].prod(axis=0) for m in dict.fromkeys(noms)}
+
+
+def sanctions():
+    """Résolutions de sanctions : année, nom et impact"""
+    table = EVENTS[EVENTS["categorie"] == "sanction"]
+    return pd.DataFrame({"Année": table.index.left.astype(int), "Sanctions": table["nom"].to_numpy(),
+                         "Impact": table["impact"].astype(int).to_numpy()})
+
+
+def annotations(annees, categories=("periode", "sanction")):
+    """Événements visibles sur l'axe des années, en tuples simples (début, fin, nom, catégorie)
+    pour les constructeurs de figures du pool"""
+    a = np.asarray(annees, dtype=np.float64)
+    # Recouvrement de l'intervalle avec l'axe (et non appartenance d'un point de la grille, qu'une
+    # grille fractionnaire peut manquer à l'arrondi près)
+    visibles = (EVENTS.index.left <= a.max()) & (EVENTS.index.right >= a.min())
+    table = EVENTS[EVENTS["categorie"].isin(categories) & visibles]
+    return [(float(max(iv.left, a.min())), float(min(iv.right, a.max())), nom, categorie)
+            for iv, nom, categorie in zip(table.index, table["nom"], table["categorie"])]
@@ -0,0 +1,123 @@
+# html_fragments.py
+"""Fragments HTML précompilés pour les cartes et blocs de synthèse.
+
+Un fragment est compilé une seule fois par processus (indentation et espaces entre balises
+supprimés, gabarit `str.format` prêt) puis ses rendus sont mis en cache par valeurs d'entrée :
+une réexécution qui affiche les mêmes valeurs ne reformate rien. Les fragments sont enregistrés
+par nom au niveau du module, donc partagés entre réexécutions et sessions du processus.
+
+La feuille de style est minifiée une fois par processus. Elle reste émise à chaque réexécution :
+Streamlit retire du DOM les éléments qu'une réexécution n'a pas réémis, une injection « une fois
+par session » ferait disparaître le style dès la réexécution suivante.
+"""
+import re
+import threading
+import time
+from collections import OrderedDict
+
+MAX_RENDUS = 128  # rendus conservés par fragment (LRU)
+
+_ENTRE_BALISES = re.compile(r">\s+<")
+_INDENTATION = re.compile(r"\s*\n\s*")
+_COMMENTAIRES_CSS = re.compile(r"/\*.*?\*/", re.S)
+_ESPACES_CSS = re.compile(r"\s*([{};:,>])\s*")
+
+
+def minify_html(html):
+    """HTML sans indentation ni espaces entre balises (le texte des balises est conservé)"""
+    return _INDENTATION.sub(" ", _ENTRE_BALISES.sub("><", html.strip()))
+
+
+def minify_css(css):
+    """CSS sans commentaires, indentation ni espaces autour des séparateurs"""
+    css = _ESPACES_CSS.sub(r"\1", _COMMENTAIRES_CSS.sub("", css))
+    return re.sub(r"\s+", " ", css).replace(";}", "}").strip()
+
+
+class Fragment:
+    """Gabarit HTML compilé et rendus mis en cache par valeurs"""
+
+    def __init__(self, nom, source):
+        self.nom = nom
+        self.source = source
+        self.compile = minify_html(source)
+        self.statique = not re.search(r"\{[^{}]*\}", self.compile)
+        self.octets_economises = len(source.encode("utf-8")) - len(self.compile.encode("utf-8"))
+        self._rendus = OrderedDict()
+        self._lock = threading.Lock()
+        self.cout_moyen_ms = 0.0
+        self._mesures = 0
+
+    def render(self, valeurs):
+        """(html, servi depuis le cache, ms de rendu)"""
+        if self.statique:
+            return self.compile, True, 0.0
+        cle = tuple(sorted(valeurs.items()))
+        with self._lock:
+            html = self._rendus.get(cle)
+            if html is not None:
+                self._rendus.move_to_end(cle)
+                return html, True, 0.0
+        debut = time.perf_counter()
+        html = self.compile.format(**valeurs)
+        ms = (time.perf_counter() - debut) * 1000
+        with self._lock:
+            self._rendus[cle] = html
+            if len(self._rendus) > MAX_RENDUS:
+                self._rendus.popitem(last=False)
+            self._mesures += 1
+            self.cout_moyen_ms += (ms - self.cout_moyen_ms) / self._mesures
+        return html, False, ms
+
+
+_fragments = {}
+_styles = {}
+_registre_lock = threading.Lock()
+
+
+def fragment(nom, source):
+    """Fragment enregistré sous `nom`, recompilé seulement si sa source a changé"""
+    frag = _fragments.get(nom)
+    if frag is None or (frag.source is not source and frag.source != source):
+        with _registre_lock:
+            frag = _fragments[nom] = Fragment(nom, source)
+    return frag
+
+
+def style_block(css):
+    """Balise <style> minifiée, calculée une fois par processus ; (html, octets économisés)"""
+    bloc = _styles.get(css)
+    if bloc is None:
+        html = f"<style>{minify_css(css)}</style>"
+        bloc = _styles[css] = (html, len(css.encode("utf-8")) + 15 - len(html.encode("utf-8")))
+    return bloc
+
+
+class FragmentReport:
+    """Bilan d'une réexécution : octets et millisecondes économisés par fragment"""
+
+    def __init__(self):
+        self.lignes = {}
+
+    def add(self, frag, succes, ms):
+        ligne = self.lignes.get(frag.nom)
+        if ligne is None:
+            ligne = self.lignes[frag.nom] = {"fragment": frag.nom, "rendus": 0, "depuis_cache": 0,
+                                             "ms_rendu": 0.0, "ms_economisees": 0.0, "octets_economises": 0}
+        ligne["rendus"] += 1
+        ligne["octets_economises"] += frag.octets_economises
+        if succes:
+            ligne["depuis_cache"] += 1
+            ligne["ms_economisees"] += frag.cout_moyen_ms
+        else:
+            ligne["ms_rendu"] += ms
+
+    def add_style(self, octets_economises):
+        self.lignes["<style>"] = {"fragment": "<style>", "rendus": 1, "depuis_cache": 1, "ms_rendu": 0.0,
+                                  "ms_economisees": 0.0, "octets_economises": octets_economises}
+
+    def totals(self):
+        """(octets économisés, ms de rendu, ms économisées)"""
+        lignes = self.lignes.values()
+        return (sum(l["octets_economises"] for l in lignes), sum(l["ms_rendu"] for l in lignes),
+                sum(l["ms_economisees"] for l in lignes))
@@ -0,0 +1,132 @@
+# live_feed.py
+"""Suivi en continu d'un journal JSONL d'événements (mode ops).
+
+Le fichier est lu à partir du dernier offset connu : seules les lignes ajoutées depuis le
+précédent relevé sont décodées. Chaque événement met à jour en O(1) un tampon circulaire des
+derniers événements et les sommes/effectifs (métrique, année) ; un numéro de version par
+métrique permet aux vues de ne redessiner que les graphiques touchés.
+"""
+import json
+import os
+import threading
+import time
+from collections import deque
+
+from observed_ingest import ALL_SELECTIONS, COLUMN_ALIASES, EVENT_SCHEMA, TYPE_ALIASES
+
+RING_CAPACITY = 500
+MAX_READ_BYTES = 8 * 1024 * 1024  # borne de lecture par relevé
+
+
+def _champ(evenement, champ):
+    for alias in COLUMN_ALIASES[champ]:
+        if alias in evenement:
+            return evenement[alias]
+    return None
+
+
+def parse_event(ligne):
+    """(sélection, métrique, année, valeur) d'une ligne JSONL, ou None si l'événement est invalide"""
+    try:
+        evenement = json.loads(ligne)
+        type_evenement = str(_champ(evenement, "type")).strip().lower()
+        schema = EVENT_SCHEMA.get(TYPE_ALIASES.get(type_evenement, type_evenement))
+        if schema is None:
+            return None
+        date = _champ(evenement, "date")
+        annee = int(str(date)[:4]) if date is not None else int(_champ(evenement, "annee"))
+        valeur = _champ(evenement, "valeur")
+        if valeur is None and schema["agregation"] == "somme":
+            valeur = 1.0
+        valeur = float(valeur)
+    except (ValueError, TypeError):
+        return None
+    if not schema["min"] <= valeur <= schema["max"]:
+        return None
+    selection = _champ(evenement, "selection") or ALL_SELECTIONS
+    return selection, schema["metrique"], annee, valeur
+
+
+class LiveFeed:
+    """Lecteur incrémental d'un journal JSONL avec agrégats tenus à jour événement par événement"""
+
+    def __init__(self, chemin, capacite=RING_CAPACITY):
+        self.chemin = chemin
+        self.recents = deque(maxlen=capacite)
+        self.sommes = {}
+        self.effectifs = {}
+        self.versions = {schema["metrique"]: 0 for schema in EVENT_SCHEMA.values()}
+        self.stats = {"evenements": 0, "rejets": 0, "releves": 0, "dernier_releve_ms": 0.0}
+        self._offset = 0
+        self._inode = None
+        self._reste = b""
+        self._lock = threading.Lock()
+
+    def _reinitialiser(self):
+        """Fichier tronqué ou remplacé (rotation) : on repart de zéro"""
+        self.recents.clear()
+        self.sommes.clear()
+        self.effectifs.clear()
+        for metrique in self.versions:
+            self.versions[metrique] += 1
+        self.stats["evenements"] = self.stats["rejets"] = 0
+        self._offset = 0
+        self._reste = b""
+
+    def _ajouter(self, evenement):
+        selection, metrique, annee, valeur = evenement
+        cle = (selection, metrique, annee)
+        self.sommes[cle] = self.sommes.get(cle, 0.0) + valeur
+        self.effectifs[cle] = self.effectifs.get(cle, 0) + 1
+        self.versions[metrique] += 1
+        self.recents.append(evenement)
+
+    def poll(self):
+        """Lit les lignes ajoutées depuis le dernier relevé ; retourne les métriques touchées"""
+        debut = time.perf_counter()
+        touchees = set()
+        with self._lock:
+            try:
+                etat = os.stat(self.chemin)
+            except OSError:
+                return touchees
+            if self._inode != etat.st_ino or etat.st_size < self._offset:
+                if self._inode is not None:
+                    touchees.update(self.versions)
+                self._reinitialiser()
+                self._inode = etat.st_ino
+            if etat.st_size > self._offset:
+                with open(self.chemin, "rb") as f:
+                    f.seek(self._offset)
+                    bloc = f.read(MAX_READ_BYTES)
+                self._offset += len(bloc)
+                lignes = (self._reste + bloc).split(b"\n")
+                self._reste = lignes.pop()  # ligne partielle en cours d'écriture
+                for ligne in lignes:
+                    if not ligne.strip():
+                        continue
+                    evenement = parse_event(ligne)
+                    if evenement is None:
+                        self.stats["rejets"] += 1
+                        continue
+                    self._ajouter(evenement)
+                    touchees.add(evenement[1])
+                    self.stats["evenements"] += 1
+            self.stats["releves"] += 1
+            self.stats["dernier_releve_ms"] = (time.perf_counter() - debut) * 1000
+        return touchees
+
+    def value(self, metrique, annee, selection):
+        """Valeur agrégée d'une métrique pour une année (événements de la sélection et globaux)"""
+        agregation = next(s["agregation"] for s in EVENT_SCHEMA.values() if s["metrique"] == metrique)
+        somme = effectif = 0
+        for sel in {selection, ALL_SELECTIONS}:
+            somme += self.sommes.get((sel, metrique, annee), 0.0)
+            effectif += self.effectifs.get((sel, metrique, annee), 0)
+        if effectif == 0:
+            return None
+        return somme / effectif if agregation == "moyenne" else somme
+
+    def series(self, metrique, annees, selection):
+        """Valeurs agrégées sur une grille d'années (None sans événement)"""
+        return [self.value(metrique, int(a), selection) for a in annees]
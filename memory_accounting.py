@@ -0,0 +1,339 @@
+# memory_accounting.py
+"""Comptabilité mémoire par session, par section et par cache (diagnostic OOM).
+
+- tracemalloc : mémoire nette et pic par section ; en mode détaillé, principales lignes
+  allocatrices par section (différence de snapshots à l'entrée et à la sortie, coûteux) ;
+- taille profonde estimée de `st.session_state`, des DataFrames générés et des figures en cache
+  (les tableaux memmap du store partagé sont comptés à part : pages partagées entre workers) ;
+- historique par session des réexécutions, avec signalement des croissances continues (fuites).
+
+tracemalloc trace tout le processus : il n'est démarré que tant qu'au moins une session a
+activé la comptabilité, puis arrêté. Une session qui ne réexécute plus (fermée, déconnectée)
+expire après `SESSION_TTL_S` ou dès que le runtime ne la connaît plus ; son historique est
+purgé en même temps. Les mesures sont celles du processus : le pic d'une section inclut les
+allocations des autres sessions concurrentes (`reset_peak` est global).
+"""
+import gc
+import json
+import mmap
+import os
+import sys
+import threading
+import time
+import tracemalloc
+import types
+from collections import deque
+from contextlib import contextmanager
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+TRACEMALLOC_FRAMES = 1
+TOP_ALLOCATIONS = 5
+HISTORY_LENGTH = 50
+LEAK_WINDOW = 5
+LEAK_MIN_BYTES = 1024 * 1024
+MAX_OBJECTS = 200_000
+QUERY_PARAM = "memory"
+SESSION_KEY = "memoire_active"
+DETAIL_KEY = "memoire_detail"
+SESSION_TTL_S = 600
+
+_historiques = {}
+_sessions_actives = {}
+_demarre_par_nous = False
+_minuterie = None
+_lock = threading.Lock()
+
+# Types jamais parcourus (graphes globaux partagés par tout le processus)
+_OPAQUES = (type, types.ModuleType, types.FunctionType, types.BuiltinFunctionType, types.MethodType,
+            types.CodeType, types.FrameType, threading.Thread)
+
+
+def _tableau_racine(tableau):
+    """Premier tableau propriétaire du buffer d'une vue numpy, et objet sous-jacent"""
+    while isinstance(tableau.base, np.ndarray):
+        tableau = tableau.base
+    return tableau, tableau.base
+
+
+def deep_size(obj):
+    """Taille profonde estimée (octets privés, octets mappés) d'un graphe d'objets"""
+    vus = set()
+    pile = [obj]
+    prives = mappes = 0
+    while pile and len(vus) < MAX_OBJECTS:
+        o = pile.pop()
+        if id(o) in vus or isinstance(o, _OPAQUES):
+            continue
+        vus.add(id(o))
+        if isinstance(o, np.ndarray):
+            racine, buffer = _tableau_racine(o)
+            if id(racine) in vus and racine is not o:
+                continue
+            vus.add(id(racine))
+            if isinstance(racine, np.memmap) or isinstance(buffer, mmap.mmap):
+                mappes += racine.nbytes
+            else:
+                prives += racine.nbytes
+                if racine.dtype == object:
+                    pile.extend(racine.ravel())
+        elif isinstance(o, pd.DataFrame):
+            prives += int(o.index.memory_usage(deep=True))
+            for _, colonne in o.items():
+                pile.append(colonne)
+        elif isinstance(o, pd.Series):
+            if isinstance(o.values, np.ndarray) and o.dtype != object:
+                pile.append(o.values)
+            else:
+                prives += int(o.memory_usage(deep=True, index=False))
+        elif isinstance(o, dict):
+            prives += sys.getsizeof(o)
+            pile.extend(o.keys())
+            pile.extend(o.values())
+        elif isinstance(o, (list, tuple, set, frozenset, deque)):
+            prives += sys.getsizeof(o)
+            pile.extend(o)
+        elif hasattr(o, "to_plotly_json"):
+            prives += sys.getsizeof(o)
+            pile.append(o.to_plotly_json())
+        else:
+            prives += sys.getsizeof(o)
+            if hasattr(o, "__dict__"):
+                pile.append(vars(o))
+            for nom in getattr(type(o), "__slots__", ()):
+                if hasattr(o, nom):
+                    pile.append(getattr(o, nom))
+    return prives, mappes
+
+
+def resident_bytes():
+    """Mémoire résidente du processus (RSS)"""
+    try:
+        with open("/proc/self/statm", "r") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def _filtre(snapshot):
+    return snapshot.filter_traces((tracemalloc.Filter(False, tracemalloc.__file__),
+                                   tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+                                   tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+                                   tracemalloc.Filter(False, __file__)))
+
+
+def _sessions_vivantes():
+    """Identifiants des sessions connues du runtime Streamlit, ou None hors serveur"""
+    try:
+        from streamlit.runtime import Runtime
+        if not Runtime.exists():
+            return None
+        return {info.session.id for info in Runtime.instance()._session_mgr.list_sessions()}
+    except Exception:
+        return None
+
+
+def _purger():
+    """Expire les sessions inactives depuis SESSION_TTL_S ou disparues du runtime, purge leurs
+    historiques et arrête tracemalloc quand plus aucune session n'est comptabilisée"""
+    global _demarre_par_nous, _minuterie
+    limite = time.time() - SESSION_TTL_S
+    vivantes = _sessions_vivantes()
+
+    def expiree(session_id, vu):
+        return vu < limite or (vivantes is not None and session_id not in vivantes)
+
+    with _lock:
+        for session_id in [i for i, vu in _sessions_actives.items() if expiree(i, vu)]:
+            del _sessions_actives[session_id]
+        for session_id in [i for i, h in _historiques.items()
+                           if i not in _sessions_actives and expiree(i, h[-1]["horodatage"] if h else 0)]:
+            del _historiques[session_id]
+        if not _sessions_actives and _demarre_par_nous and tracemalloc.is_tracing():
+            tracemalloc.stop()
+            _demarre_par_nous = False
+        _minuterie = None
+        if _sessions_actives or _historiques:
+            _planifier_purge()
+
+
+def _planifier_purge():
+    """Purge périodique (appelée sous `_lock`) : une session déconnectée n'a plus de réexécution
+    pour arrêter le traçage elle-même"""
+    global _minuterie
+    if _minuterie is None:
+        _minuterie = threading.Timer(SESSION_TTL_S / 4, _purger)
+        _minuterie.daemon = True
+        _minuterie.start()
+
+
+class MemoryAccounting:
+    """Comptabilité mémoire d'une réexécution de la session `session_id`"""
+
+    def __init__(self, session_id, snapshots=False):
+        self.session_id = session_id
+        self.snapshots = snapshots
+        self.sections = {}
+        self.allocations = []
+        self.objets = {}
+        self.mesure = {}
+
+    def __enter__(self):
+        global _demarre_par_nous
+        with _lock:
+            _sessions_actives[self.session_id] = time.time()
+            if not tracemalloc.is_tracing():
+                tracemalloc.start(TRACEMALLOC_FRAMES)
+                _demarre_par_nous = True
+            _planifier_purge()
+        self._debut = time.perf_counter()
+        self._courant_initial = tracemalloc.get_traced_memory()[0]
+        return self
+
+    @contextmanager
+    def section(self, nom):
+        """Mémoire nette, pic et lignes allocatrices du bloc (mesures du processus entier)"""
+        avant = _filtre(tracemalloc.take_snapshot()) if self.snapshots else None
+        courant, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        try:
+            yield
+        finally:
+            apres_courant, pic = tracemalloc.get_traced_memory()
+            ligne = self.sections.setdefault(nom, {"Section": nom, "Net (Ko)": 0.0, "Pic (Ko)": 0.0})
+            ligne["Net (Ko)"] += (apres_courant - courant) / 1024
+            ligne["Pic (Ko)"] = max(ligne["Pic (Ko)"], (pic - courant) / 1024)
+            if avant is not None:
+                for stat in _filtre(tracemalloc.take_snapshot()).compare_to(avant, "lineno")[:TOP_ALLOCATIONS]:
+                    if stat.size_diff <= 0:
+                        continue
+                    cadre = stat.traceback[0]
+                    self.allocations.append({"Section": nom,
+                                             "Ligne": f"{os.path.basename(cadre.filename)}:{cadre.lineno}",
+                                             "Allocations": stat.count_diff, "Ko": stat.size_diff / 1024})
+
+    def account(self, nom, obj):
+        """Enregistre la taille profonde d'un objet suivi (DataFrames, figures, caches)"""
+        prives, mappes = deep_size(obj)
+        self.objets[nom] = {"Objet": nom, "Privé (Ko)": prives / 1024, "Mappé (Ko)": mappes / 1024}
+
+    def __exit__(self, *exc):
+        gc.collect()
+        courant, _ = tracemalloc.get_traced_memory()
+        etat = {}
+        for cle in list(st.session_state.keys()):
+            etat[str(cle)] = deep_size(st.session_state[cle])[0]
+        self.session_state = etat
+        self.mesure = {
+            "horodatage": time.time(),
+            "tracemalloc_octets": courant,
+            "croissance_octets": courant - self._courant_initial,
+            "rss_octets": resident_bytes(),
+            "session_state_octets": sum(etat.values()),
+            "sections": {nom: ligne["Net (Ko)"] for nom, ligne in self.sections.items()},
+            "session_state": etat,
+            "duree_ms": (time.perf_counter() - self._debut) * 1000,
+        }
+        with _lock:
+            historique = _historiques.setdefault(self.session_id, deque(maxlen=HISTORY_LENGTH))
+            historique.append(self.mesure)
+            self.historique = list(historique)
+        return False
+
+    def leaks(self):
+        """Croissances continues sur les `LEAK_WINDOW` dernières réexécutions"""
+        fenetre = self.historique[-LEAK_WINDOW:]
+        if len(fenetre) < LEAK_WINDOW:
+            return []
+        alertes = []
+
+        def croissant(valeurs):
+            return all(b > a for a, b in zip(valeurs, valeurs[1:])) and valeurs[-1] - valeurs[0] >= LEAK_MIN_BYTES
+
+        for nom, cle in (("Mémoire tracée (processus)", "tracemalloc_octets"), ("session_state", "session_state_octets")):
+            valeurs = [m[cle] for m in fenetre]
+            if croissant(valeurs):
+                alertes.append({"Suspect": nom, "Croissance (Ko)": (valeurs[-1] - valeurs[0]) / 1024})
+        for cle in fenetre[-1]["session_state"]:
+            valeurs = [m["session_state"].get(cle, 0) for m in fenetre]
+            if croissant(valeurs):
+                alertes.append({"Suspect": f"session_state['{cle}']", "Croissance (Ko)": (valeurs[-1] - valeurs[0]) / 1024})
+        for section in fenetre[-1]["sections"]:
+            nets = [m["sections"].get(section, 0.0) for m in fenetre]
+            if all(n > 0 for n in nets) and sum(nets) * 1024 >= LEAK_MIN_BYTES:
+                alertes.append({"Suspect": f"section {section}", "Croissance (Ko)": sum(nets)})
+        return alertes
+
+    def export(self):
+        """Rapport complet (JSON) : sections, allocations, objets suivis, historique, alertes"""
+        return json.dumps({
+            "session": self.session_id,
+            "sections": list(self.sections.values()),
+            "allocations": self.allocations,
+            "objets": list(self.objets.values()),
+            "historique": self.historique,
+            "alertes": self.leaks(),
+        }, ensure_ascii=False, indent=1, default=float).encode("utf-8")
+
+
+def _session_id():
+    from streamlit.runtime.scriptrunner import get_script_run_ctx
+    ctx = get_script_run_ctx()
+    return ctx.session_id if ctx is not None else "local"
+
+
+def requested_memory_accounting():
+    """Comptabilité demandée pour cette réexécution (?memory=1|detail ou cases admin), sinon None.
+
+    Quand plus aucune session ne la demande, tracemalloc est arrêté.
+    """
+    session_id = _session_id()
+    parametre = st.query_params.get(QUERY_PARAM)
+    if st.session_state.get(SESSION_KEY) or parametre in ("1", "detail"):
+        return MemoryAccounting(session_id, snapshots=parametre == "detail" or bool(st.session_state.get(DETAIL_KEY)))
+    with _lock:
+        _sessions_actives.pop(session_id, None)
+        _historiques.pop(session_id, None)
+    _purger()
+    return None
+
+
+def render_memory_controls():
+    """Contrôle admin (RPDC_ADMIN=1) : comptabilité mémoire de cette session"""
+    if os.environ.get("RPDC_ADMIN") != "1":
+        return
+    active = st.sidebar.checkbox("🧠 Comptabilité mémoire (tracemalloc)", key=SESSION_KEY)
+    st.sidebar.checkbox("Lignes allocatrices par section (lent)", key=DETAIL_KEY, disabled=not active)
+
+
+def render_memory_panel(comptabilite):
+    """Panneau mémoire : sections, allocations, objets suivis, historique et alertes de fuite"""
+    mesure = comptabilite.mesure
+    with st.sidebar.expander(f"🧠 MÉMOIRE ({mesure['rss_octets'] / 2**20:.0f} Mo RSS)", expanded=True):
+        col1, col2 = st.columns(2)
+        col1.metric("Tracée", f"{mesure['tracemalloc_octets'] / 2**20:.1f} Mo",
+                    f"{mesure['croissance_octets'] / 1024:+.0f} Ko", delta_color="inverse")
+        col2.metric("session_state", f"{mesure['session_state_octets'] / 1024:.0f} Ko")
+        st.caption("Mesures tracemalloc du processus : les pics incluent les sessions concurrentes.")
+        for alerte in comptabilite.leaks():
+            st.warning(f"Fuite probable : {alerte['Suspect']} (+{alerte['Croissance (Ko)']:.0f} Ko "
+                       f"sur {LEAK_WINDOW} réexécutions)")
+        st.dataframe(pd.DataFrame(list(comptabilite.sections.values())), hide_index=True, use_container_width=True)
+        if comptabilite.allocations:
+            st.dataframe(pd.DataFrame(comptabilite.allocations).sort_values("Ko", ascending=False),
+                         hide_index=True, use_container_width=True)
+        objets = list(comptabilite.objets.values()) + [
+            {"Objet": f"session_state['{cle}']", "Privé (Ko)": octets / 1024, "Mappé (Ko)": 0.0}
+            for cle, octets in comptabilite.session_state.items()]
+        st.dataframe(pd.DataFrame(objets).sort_values("Privé (Ko)", ascending=False),
+                     hide_index=True, use_container_width=True)
+        if len(comptabilite.historique) > 1:
+            st.line_chart(pd.DataFrame({
+                "Tracée (Mo)": [m["tracemalloc_octets"] / 2**20 for m in comptabilite.historique],
+                "RSS (Mo)": [m["rss_octets"] / 2**20 for m in comptabilite.historique],
+            }))
+        st.download_button("📥 Rapport mémoire (JSON)", comptabilite.export(), "memoire.json",
+                           mime="application/json", on_click="ignore")
@@ -0,0 +1,242 @@
+# metrics_export.py
+"""Métriques de service au format texte Prometheus (sans dépendance externe).
+
+Activées par variables d'environnement :
+- RPDC_METRICS_PORT : endpoint HTTP local `/metrics` (un serveur par processus, 127.0.0.1 par défaut,
+  hôte modifiable avec RPDC_METRICS_HOST) ; avec plusieurs workers, seul le premier obtient le
+  port, les autres le signalent dans les logs et réessaient périodiquement ;
+- RPDC_METRICS_FILE : un fichier par processus (`<base>.<pid>.prom`), réécrit atomiquement
+  après chaque réexécution et supprimé à l'arrêt (collecteur "textfile" de node_exporter).
+
+Séries : latence des réexécutions (totale et par section), temps de génération des jeux de
+données, ratio de succès du cache partagé et sessions actives, étiquetées par application, par
+sélection et par worker (pid) : les registres de chaque processus restent des séries distinctes.
+"""
+import atexit
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+LOGGER = logging.getLogger(__name__)
+BIND_RETRY_S = 60
+BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+SESSION_TTL = 300  # une session est active si elle a réexécuté dans les 5 dernières minutes
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+HISTOGRAMS = {
+    "rpdc_rerun_duration_seconds": "Durée d'une réexécution complète du script",
+    "rpdc_section_duration_seconds": "Durée d'une section de la réexécution",
+    "rpdc_dataset_generation_seconds": "Durée de génération d'un jeu de données publié dans le store partagé",
+}
+
+
+def _echapper(valeur):
+    return str(valeur).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _etiquettes(labels):
+    return ",".join(f'{cle}="{_echapper(v)}"' for cle, v in labels)
+
+
+class MetricsRegistry:
+    """Histogrammes, sessions et collecteurs du processus"""
+
+    def __init__(self, buckets=BUCKETS):
+        self.buckets = buckets
+        self._histogrammes = {nom: {} for nom in HISTOGRAMS}
+        self._sessions = {}
+        self._stores = {}
+        self._lock = threading.Lock()
+
+    def observe(self, nom, valeur, **labels):
+        cle = tuple(sorted(labels.items()))
+        with self._lock:
+            serie = self._histogrammes[nom].get(cle)
+            if serie is None:
+                serie = self._histogrammes[nom][cle] = [[0] * len(self.buckets), 0, 0.0]
+            for i, borne in enumerate(self.buckets):
+                if valeur <= borne:
+                    serie[0][i] += 1
+            serie[1] += 1
+            serie[2] += valeur
+
+    def touch_session(self, app, session_id):
+        with self._lock:
+            self._sessions[(app, session_id)] = time.time()
+
+    def register_store(self, app, store, prefixe=None):
+        """Le store de `app` est lu au moment de l'export (compteurs cumulés du processus, limités
+        aux clés `<prefixe>/...` quand le store est partagé entre vues)"""
+        with self._lock:
+            self._stores[app] = (store, prefixe)
+
+    def render(self):
+        """Exposition texte Prometheus"""
+        worker = f'worker="{os.getpid()}"'
+        lignes = []
+        with self._lock:
+            for nom, aide in HISTOGRAMS.items():
+                lignes += [f"# HELP {nom} {aide}", f"# TYPE {nom} histogram"]
+                for cle, (cumuls, total, somme) in sorted(self._histogrammes[nom].items()):
+                    base = ",".join(filter(None, (worker, _etiquettes(cle))))
+                    for borne, n in zip(self.buckets, cumuls):
+                        lignes.append(f'{nom}_bucket{{{base},le="{borne}"}} {n}')
+                    lignes.append(f'{nom}_bucket{{{base},le="+Inf"}} {total}')
+                    lignes.append(f"{nom}_sum{{{base}}} {somme:.6f}")
+                    lignes.append(f"{nom}_count{{{base}}} {total}")
+
+            limite = time.time() - SESSION_TTL
+            actives = {}
+            for (app, _), vu in list(self._sessions.items()):
+                if vu >= limite:
+                    actives[app] = actives.get(app, 0) + 1
+                else:
+                    del self._sessions[(app, _)]
+            lignes += ["# HELP rpdc_active_sessions Sessions ayant réexécuté dans les 5 dernières minutes",
+                       "# TYPE rpdc_active_sessions gauge"]
+            lignes += [f'rpdc_active_sessions{{{worker},app="{app}"}} {n}' for app, n in sorted(actives.items())]
+
+            lignes += ["# HELP rpdc_shared_store_events_total Accès au store partagé par issue",
+                       "# TYPE rpdc_shared_store_events_total counter"]
+            ratios = []
+            for app, (store, prefixe) in sorted(self._stores.items()):
+                stats = store.stats_for(prefixe)
+                for evenement, n in sorted(stats.items()):
+                    lignes.append(f'rpdc_shared_store_events_total{{{worker},app="{app}",event="{evenement}"}} {n}')
+                # chaque accès finit par un attachement (ou un succès en mémoire) ; une publication = un échec
+                total = stats.get("hits", 0) + stats.get("attaches", 0)
+                if total:
+                    succes = total - stats.get("publications", 0)
+                    ratios.append(f'rpdc_cache_hit_ratio{{{worker},app="{app}",cache="shared_store"}} {succes / total:.6f}')
+            lignes += ["# HELP rpdc_cache_hit_ratio Part des accès servis sans génération",
+                       "# TYPE rpdc_cache_hit_ratio gauge"] + ratios
+        return "\n".join(lignes) + "\n"
+
+
+REGISTRY = MetricsRegistry()
+_serveur = None
+_echec_serveur = 0.0
+_fichiers = set()
+_serveur_lock = threading.Lock()
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.split("?")[0] != "/metrics":
+            self.send_error(404)
+            return
+        corps = REGISTRY.render().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(corps)))
+        self.end_headers()
+        self.wfile.write(corps)
+
+    def log_message(self, *args):
+        pass
+
+
+def start_http_server(port, host="127.0.0.1"):
+    """Démarre une seule fois par processus le serveur `/metrics` (thread démon) ; un échec
+    (port pris par un autre worker) est journalisé et retenté après BIND_RETRY_S"""
+    global _serveur, _echec_serveur
+    with _serveur_lock:
+        if _serveur is None and time.time() - _echec_serveur >= BIND_RETRY_S:
+            try:
+                _serveur = ThreadingHTTPServer((host, port), _MetricsHandler)
+            except OSError as e:
+                _echec_serveur = time.time()
+                LOGGER.warning("Endpoint /metrics indisponible sur %s:%s (pid %s) : %s ; "
+                               "nouvel essai dans %s s", host, port, os.getpid(), e, BIND_RETRY_S)
+                return None
+            threading.Thread(target=_serveur.serve_forever, daemon=True, name="rpdc-metrics").start()
+        return _serveur
+
+
+def textfile_path(chemin):
+    """Fichier de métriques propre au processus : `<base>.<pid>.prom`"""
+    return f"{chemin.removesuffix('.prom')}.{os.getpid()}.prom"
+
+
+def write_textfile(chemin):
+    """Réécrit atomiquement le fichier de métriques du processus"""
+    fichier = textfile_path(chemin)
+    tmp = f"{fichier}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write(REGISTRY.render())
+    os.replace(tmp, fichier)
+    _fichiers.add(fichier)
+
+
+@atexit.register
+def remove_textfiles():
+    """Supprime à l'arrêt les fichiers du processus (pas de séries figées d'un worker arrêté)"""
+    for fichier in _fichiers:
+        try:
+            os.remove(fichier)
+        except OSError:
+            pass
+
+
+def metrics_enabled():
+    return bool(os.environ.get("RPDC_METRICS_PORT") or os.environ.get("RPDC_METRICS_FILE"))
+
+
+class RerunMetrics:
+    """Mesures d'une réexécution : durée totale et par section.
+
+    Les durées de section sont enregistrées à la fin de la réexécution, une fois la sélection
+    connue (la section "Sidebar" se termine avant que `selection` ne soit renseignée).
+    """
+
+    def __init__(self, app, session_id):
+        self.app = app
+        self.session_id = session_id
+        self.selection = ""
+        self.sections = []
+
+    def __enter__(self):
+        REGISTRY.touch_session(self.app, self.session_id)
+        self._debut = time.perf_counter()
+        return self
+
+    @contextmanager
+    def section(self, nom):
+        debut = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.sections.append((nom, time.perf_counter() - debut))
+
+    def __exit__(self, *exc):
+        for nom, duree in self.sections:
+            REGISTRY.observe("rpdc_section_duration_seconds", duree,
+                             app=self.app, selection=self.selection, section=nom)
+        REGISTRY.observe("rpdc_rerun_duration_seconds", time.perf_counter() - self._debut,
+                         app=self.app, selection=self.selection)
+        chemin = os.environ.get("RPDC_METRICS_FILE")
+        if chemin:
+            write_textfile(chemin)
+        return False
+
+
+def record_generation(app, selection, secondes):
+    REGISTRY.observe("rpdc_dataset_generation_seconds", secondes, app=app, selection=selection)
+
+
+def requested_metrics(app, store=None, profil=None):
+    """Mesures de la réexécution si l'export est configuré, sinon None"""
+    if not metrics_enabled():
+        return None
+    port = os.environ.get("RPDC_METRICS_PORT")
+    if port:
+        start_http_server(int(port), os.environ.get("RPDC_METRICS_HOST", "127.0.0.1"))
+    if store is not None:
+        # store commun aux vues : chaque app exporte les compteurs de ses propres clés
+        REGISTRY.register_store(app, store, profil)
+    from streamlit.runtime.scriptrunner import get_script_run_ctx
+    ctx = get_script_run_ctx()
+    return RerunMetrics(app, ctx.session_id if ctx is not None else "local")
@@ -0,0 +1,174 @@
+# missile_catalog.py
+"""Catalogue missilier indexé : index triés (portée, CEP, déploiement),
+index catégoriels (statut, type d'ogive), requêtes par intervalles et pagination.
+"""
+import os
+
+import numpy as np
+import pandas as pd
+
+# Colonnes canoniques -> colonnes affichées dans le dashboard
+DISPLAY_COLUMNS = {
+    "systeme": "Système",
+    "portee": "Portée (km)",
+    "precision": "Précision CEP (m)",
+    "deploiement": "Année Déploiement",
+    "statut": "Statut",
+    "ogive": "Type Ogive",
+}
+NUMERIC_INDEXES = ("portee", "precision", "deploiement")
+CATEGORICAL_INDEXES = ("statut", "ogive")
+
+_ALIASES = {
+    "systeme": ("systeme", "système", "system", "name", "nom"),
+    "portee": ("portee", "portée", "portée (km)", "range", "range_km"),
+    "precision": ("precision", "précision", "précision cep (m)", "cep", "cep_m"),
+    "deploiement": ("deploiement", "déploiement", "année déploiement", "year", "deployment_year"),
+    "statut": ("statut", "status"),
+    "ogive": ("ogive", "type ogive", "warhead", "warhead_type"),
+}
+
+
+def default_status(deploiement):
+    """Règle du dashboard : opérationnel si déployé avant 2020"""
+    return np.where(deploiement < 2020, "Opérationnel", "Développement")
+
+
+def default_warhead(portee):
+    """Règle du dashboard : capacité nucléaire au-delà de 1 000 km"""
+    return np.where(portee > 1000, "Conventionnelle/Nucléaire", "Conventionnelle")
+
+
+def normalize_catalog(df):
+    """Renomme les colonnes connues vers le schéma canonique et complète statut/ogive"""
+    renommage = {}
+    for col in df.columns:
+        cle = str(col).strip().lower()
+        for canonique, alias in _ALIASES.items():
+            if cle in alias:
+                renommage[col] = canonique
+    df = df.rename(columns=renommage)
+    manquantes = [c for c in ("systeme", "portee", "precision", "deploiement") if c not in df.columns]
+    if manquantes:
+        raise ValueError(f"Colonnes manquantes dans le catalogue: {', '.join(manquantes)}")
+    df = df.dropna(subset=["portee", "precision", "deploiement"])
+    if "statut" not in df.columns:
+        df["statut"] = default_status(df["deploiement"].to_numpy())
+    if "ogive" not in df.columns:
+        df["ogive"] = default_warhead(df["portee"].to_numpy())
+    return df[list(DISPLAY_COLUMNS)].reset_index(drop=True)
+
+
+class MissileCatalog:
+    """Colonnes numpy + index triés/catégoriels ; les requêtes retournent des numéros de lignes"""
+
+    def __init__(self, df):
+        df = normalize_catalog(df)
+        self.size = len(df)
+        self.systeme = df["systeme"].astype(str).to_numpy()
+        self.columns = {}
+        self.sorted_index = {}
+        for nom in NUMERIC_INDEXES:
+            valeurs = df[nom].to_numpy(dtype=np.float64)
+            ordre = np.argsort(valeurs, kind="stable")
+            self.columns[nom] = valeurs
+            self.sorted_index[nom] = (ordre, valeurs[ordre])
+        self.categories = {}
+        self.codes = {}
+        self.categorical_index = {}
+        for nom in CATEGORICAL_INDEXES:
+            codes, categories = pd.factorize(df[nom].astype(str), sort=True)
+            self.codes[nom] = codes
+            self.categories[nom] = list(categories)
+            ordre = np.argsort(codes, kind="stable")
+            bornes = np.searchsorted(codes[ordre], np.arange(len(categories) + 1))
+            self.categorical_index[nom] = {cat: ordre[bornes[i]:bornes[i + 1]]
+                                           for i, cat in enumerate(categories)}
+
+    @classmethod
+    def from_missile_types(cls, missile_types):
+        """Catalogue construit à partir de `define_missile_types`"""
+        return cls(pd.DataFrame([
+            {"systeme": nom, "portee": s["portee"], "precision": s["precision"], "deploiement": s["deploiement"]}
+            for nom, s in missile_types.items()
+        ]))
+
+    @classmethod
+    def from_file(cls, path):
+        """Catalogue chargé depuis un CSV ou un Parquet local"""
+        extension = os.path.splitext(path)[1].lower()
+        if extension in (".parquet", ".pq"):
+            df = pd.read_parquet(path)
+        elif extension in (".csv", ".txt"):
+            df = pd.read_csv(path)
+        else:
+            raise ValueError(f"Format de catalogue non supporté: {extension}")
+        return cls(df)
+
+    def bounds(self, nom):
+        """(min, max) d'une colonne numérique indexée"""
+        valeurs = self.sorted_index[nom][1]
+        return (valeurs[0], valeurs[-1]) if len(valeurs) else (0.0, 0.0)
+
+    def _range_rows(self, nom, bornes):
+        ordre, valeurs = self.sorted_index[nom]
+        debut = np.searchsorted(valeurs, bornes[0], side="left")
+        fin = np.searchsorted(valeurs, bornes[1], side="right")
+        return ordre[debut:fin]
+
+    def _category_rows(self, nom, valeurs):
+        index = self.categorical_index[nom]
+        morceaux = [index[v] for v in valeurs if v in index]
+        return np.concatenate(morceaux) if morceaux else np.empty(0, dtype=np.intp)
+
+    def query(self, ranges=None, categories=None, sort_by=None, descending=False):
+        """Lignes satisfaisant toutes les contraintes.
+
+        `ranges` : {colonne numérique: (min, max)} ; `categories` : {colonne catégorielle: valeurs}.
+        Le prédicat le plus sélectif passe par son index, les autres filtrent les candidats.
+        """
+        ranges = {k: v for k, v in (ranges or {}).items() if v is not None}
+        categories = {k: v for k, v in (categories or {}).items() if v is not None}
+
+        candidats = None
+        if ranges or categories:
+            selections = [(nom, self._range_rows(nom, b)) for nom, b in ranges.items()]
+            selections += [(nom, self._category_rows(nom, v)) for nom, v in categories.items()]
+            pivot, candidats = min(selections, key=lambda s: len(s[1]))
+            masque = np.ones(len(candidats), dtype=bool)
+            for nom, (bas, haut) in ranges.items():
+                if nom != pivot:
+                    valeurs = self.columns[nom][candidats]
+                    masque &= (valeurs >= bas) & (valeurs <= haut)
+            for nom, valeurs in categories.items():
+                if nom != pivot:
+                    codes = [self.categories[nom].index(v) for v in valeurs if v in self.categories[nom]]
+                    masque &= np.isin(self.codes[nom][candidats], codes)
+            candidats = candidats[masque]
+
+        if sort_by in self.sorted_index:
+            ordre = self.sorted_index[sort_by][0]
+            if candidats is not None:
+                retenues = np.zeros(self.size, dtype=bool)
+                retenues[candidats] = True
+                ordre = ordre[retenues[ordre]]
+            return ordre[::-1] if descending else ordre
+        if candidats is None:
+            return np.arange(self.size)
+        return np.sort(candidats)
+
+    def frame(self, rows):
+        """DataFrame d'affichage pour des numéros de lignes"""
+        return pd.DataFrame({
+            DISPLAY_COLUMNS["systeme"]: self.systeme[rows],
+            DISPLAY_COLUMNS["portee"]: self.columns["portee"][rows],
+            DISPLAY_COLUMNS["precision"]: self.columns["precision"][rows],
+            DISPLAY_COLUMNS["deploiement"]: self.columns["deploiement"][rows].astype(int),
+            DISPLAY_COLUMNS["statut"]: np.asarray(self.categories["statut"], dtype=object)[self.codes["statut"][rows]],
+            DISPLAY_COLUMNS["ogive"]: np.asarray(self.categories["ogive"], dtype=object)[self.codes["ogive"][rows]],
+        })
+
+    def page(self, rows, page, page_size):
+        """Page `page` (à partir de 0) des lignes sélectionnées"""
+        debut = page * page_size
+        return self.frame(rows[debut:debut + page_size])
@@ -0,0 +1,193 @@
+# observed_ingest.py
+"""Ingestion par blocs de journaux d'événements observés (CSV, Parquet, JSONL).
+
+Chaque bloc est validé contre le schéma des métriques puis réduit en sommes et effectifs par
+(sélection, métrique, année) : la mémoire reste bornée par la taille d'un bloc quelle que soit la
+taille du fichier. Le résultat agrégé est écrit en Parquet dans le cache et relu directement tant
+que le fichier source n'a pas changé.
+"""
+import hashlib
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+from shared_store import CACHE_DIR
+
+CHUNK_ROWS = 250_000
+SCHEMA_VERSION = 1
+ALL_SELECTIONS = "*"
+
+# Type d'événement -> métrique du dashboard, agrégation annuelle et bornes de validité de la valeur
+EVENT_SCHEMA = {
+    "test_missile": {"metrique": "Tests_Missiles", "agregation": "somme", "min": 0.0, "max": 100.0},
+    "exercice": {"metrique": "Exercices_Militaires", "agregation": "somme", "min": 0.0, "max": 100.0},
+    "budget": {"metrique": "Budget_Defense_Mds", "agregation": "moyenne", "min": 0.0, "max": 100.0},
+}
+TYPE_ALIASES = {
+    "missile_test": "test_missile", "tir": "test_missile", "lancement": "test_missile", "launch": "test_missile",
+    "exercise": "exercice", "manoeuvre": "exercice", "drill": "exercice",
+    "budget_estimate": "budget", "estimation_budget": "budget",
+}
+COLUMN_ALIASES = {
+    "date": ("date", "Date", "timestamp", "horodatage"),
+    "annee": ("Annee", "annee", "year", "Année"),
+    "type": ("type", "Type", "evenement", "event"),
+    "valeur": ("valeur", "Valeur", "value", "montant"),
+    "selection": ("Selection", "selection", "branche", "programme"),
+}
+
+
+def _colonne(bloc, champ):
+    for alias in COLUMN_ALIASES[champ]:
+        if alias in bloc.columns:
+            return bloc[alias]
+    return None
+
+
+def iter_chunks(chemin, chunk_rows=CHUNK_ROWS):
+    """Blocs DataFrame successifs d'un fichier CSV, Parquet ou JSONL"""
+    extension = os.path.splitext(chemin.removesuffix(".gz"))[1].lower()
+    if extension == ".parquet":
+        import pyarrow.parquet as pq
+        for lot in pq.ParquetFile(chemin).iter_batches(batch_size=chunk_rows):
+            yield lot.to_pandas()
+    elif extension in (".jsonl", ".ndjson", ".json"):
+        with pd.read_json(chemin, lines=True, chunksize=chunk_rows) as lecteur:
+            yield from lecteur
+    elif extension == ".csv":
+        with pd.read_csv(chemin, chunksize=chunk_rows) as lecteur:
+            yield from lecteur
+    else:
+        raise ValueError(f"Format non supporté: {extension or chemin}")
+
+
+def validate_chunk(bloc, rapport):
+    """Lignes valides (selection, metrique, annee, valeur) d'un bloc ; les rejets sont comptés par motif"""
+    n = len(bloc)
+    date = _colonne(bloc, "date")
+    if date is not None:
+        annee = pd.to_datetime(date, errors="coerce", format="ISO8601", utc=True).dt.year.to_numpy(dtype=np.float64)
+    else:
+        annee = _colonne(bloc, "annee")
+        if annee is None:
+            raise ValueError("Colonne de date ('date' ou 'Annee') absente du journal")
+        annee = pd.to_numeric(annee, errors="coerce").to_numpy(dtype=np.float64)
+    types = _colonne(bloc, "type")
+    if types is None:
+        raise ValueError("Colonne 'type' absente du journal")
+    types = types.astype("string").str.strip().str.lower()
+    types = types.replace(TYPE_ALIASES).to_numpy(dtype=object, na_value=None)
+    valeur = _colonne(bloc, "valeur")
+    valeur = np.full(n, np.nan) if valeur is None else \
+        pd.to_numeric(valeur, errors="coerce").to_numpy(dtype=np.float64, copy=True)
+    selection = _colonne(bloc, "selection")
+    selection = np.full(n, ALL_SELECTIONS, dtype=object) if selection is None else \
+        selection.astype("string").fillna(ALL_SELECTIONS).to_numpy(dtype=object)
+
+    metrique = np.full(n, None, dtype=object)
+    valide = np.zeros(n, dtype=bool)
+    motifs = {"date invalide": ~np.isfinite(annee), "type inconnu": np.zeros(n, dtype=bool),
+              "valeur invalide": np.zeros(n, dtype=bool)}
+    for type_evenement, schema in EVENT_SCHEMA.items():
+        masque = types == type_evenement
+        if not masque.any():
+            continue
+        if schema["agregation"] == "somme":  # un événement de comptage sans valeur compte pour 1
+            valeur[masque] = np.where(np.isnan(valeur[masque]), 1.0, valeur[masque])
+        hors_plage = masque & ~((valeur >= schema["min"]) & (valeur <= schema["max"]))
+        motifs["valeur invalide"] |= hors_plage
+        metrique[masque] = schema["metrique"]
+        valide |= masque
+    motifs["type inconnu"] = ~valide
+    for nom in ("valeur invalide", "date invalide"):
+        motifs[nom] &= valide
+        valide &= ~motifs[nom]
+
+    rapport["lignes"] += n
+    rapport["valides"] += int(valide.sum())
+    for nom, masque in motifs.items():
+        rapport["rejets"][nom] = rapport["rejets"].get(nom, 0) + int(masque.sum())
+    return pd.DataFrame({"Selection": selection[valide], "Metrique": metrique[valide],
+                         "Annee": annee[valide].astype(np.int64), "Valeur": valeur[valide]})
+
+
+def aggregate_file(chemin, chunk_rows=CHUNK_ROWS):
+    """Sommes et effectifs par (sélection, métrique, année) sur tout le fichier, bloc par bloc"""
+    rapport = {"lignes": 0, "valides": 0, "blocs": 0, "rejets": {}}
+    cumul = None
+    for bloc in iter_chunks(chemin, chunk_rows):
+        lignes = validate_chunk(bloc, rapport)
+        rapport["blocs"] += 1
+        partiel = lignes.groupby(["Selection", "Metrique", "Annee"])["Valeur"].agg(["sum", "count"])
+        cumul = partiel if cumul is None else cumul.add(partiel, fill_value=0)
+    if cumul is None:
+        cumul = pd.DataFrame(columns=["sum", "count"],
+                             index=pd.MultiIndex.from_arrays([[], [], []], names=["Selection", "Metrique", "Annee"]))
+    agrege = cumul.rename(columns={"sum": "Somme", "count": "Nombre"}).reset_index()
+    agrege["Selection"] = agrege["Selection"].astype(str)
+    agrege["Metrique"] = agrege["Metrique"].astype(str)
+    agrege["Annee"] = agrege["Annee"].astype(np.int64)
+    return agrege, rapport
+
+
+def _cle_cache(chemin):
+    etat = os.stat(chemin)
+    schema = json.dumps([SCHEMA_VERSION, EVENT_SCHEMA, TYPE_ALIASES], sort_keys=True)
+    brut = f"{os.path.abspath(chemin)}|{etat.st_size}|{etat.st_mtime_ns}|{schema}"
+    return hashlib.sha256(brut.encode("utf-8")).hexdigest()[:20]
+
+
+def load_observed(chemin, root=CACHE_DIR, chunk_rows=CHUNK_ROWS):
+    """Agrégats du journal `chemin`, relus depuis le cache Parquet si le fichier n'a pas changé"""
+    base = os.path.join(root, "observed", _cle_cache(chemin))
+    try:
+        with open(f"{base}.json", "r", encoding="utf-8") as f:
+            rapport = json.load(f)
+        return pd.read_parquet(f"{base}.parquet"), dict(rapport, cache=True)
+    except (OSError, ValueError):
+        pass
+    agrege, rapport = aggregate_file(chemin, chunk_rows)
+    os.makedirs(os.path.dirname(base), exist_ok=True)
+    tmp = f"{base}.{os.getpid()}.tmp"
+    agrege.to_parquet(tmp, index=False)
+    os.replace(tmp, f"{base}.parquet")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(rapport, f, ensure_ascii=False)
+    os.replace(tmp, f"{base}.json")
+    return agrege, dict(rapport, cache=False)
+
+
+def to_year_grid(agrege, annees, selection):
+    """Métriques observées (Annee × métrique) sur la grille annuelle du dashboard.
+
+    Les événements sans sélection s'appliquent à toutes les sélections. Les comptages valent 0
+    les années sans événement à l'intérieur de la période observée, NaN en dehors.
+    """
+    annees = np.asarray(annees)
+    lignes = agrege[agrege["Selection"].isin([selection, ALL_SELECTIONS])]
+    grille = pd.DataFrame({"Annee": annees})
+    for schema in EVENT_SCHEMA.values():
+        metrique = schema["metrique"]
+        m = lignes[lignes["Metrique"] == metrique].groupby("Annee")[["Somme", "Nombre"]].sum()
+        if m.empty:
+            continue
+        m = m.reindex(annees)
+        if m["Somme"].first_valid_index() is None:
+            # Aucune année observée dans la grille du dashboard : métrique ignorée
+            continue
+        if schema["agregation"] == "moyenne":
+            valeurs = m["Somme"] / m["Nombre"]
+        else:
+            periode = (annees >= m["Somme"].first_valid_index()) & (annees <= m["Somme"].last_valid_index())
+            valeurs = m["Somme"].where(~periode | m["Somme"].notna(), 0.0)
+        grille[metrique] = valeurs.to_numpy(dtype=np.float64)
+    return grille
+
+
+def merge_observed(df, grille, suffixe="_Observe"):
+    """Colonnes simulées et observées côte à côte pour les métriques présentes dans les deux"""
+    communes = [c for c in grille.columns if c != "Annee" and c in df.columns]
+    observees = grille[["Annee"] + communes].rename(columns={c: f"{c}{suffixe}" for c in communes})
+    return df[["Annee"] + communes].merge(observees, on="Annee", how="left"), communes
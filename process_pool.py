@@ -0,0 +1,61 @@
+# process_pool.py
+"""Pool de processus partagé par les calculs lourds (sensibilité, figures, simulations).
+
+Le pool est créé une seule fois par processus serveur et réutilisé entre les reruns ; un pool
+cassé (worker mort) est arrêté et recréé à la demande suivante. Le démarrage "spawn" évite de
+forker un serveur Streamlit multi-threadé.
+"""
+import atexit
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from itertools import repeat
+
+_pools = {}
+_lock = threading.Lock()
+
+
+def default_workers():
+    """Nombre de workers par défaut (cœurs disponibles, au plus 8)"""
+    return max(1, min(8, os.cpu_count() or 1))
+
+
+def get_pool(workers=None):
+    """Pool de `workers` processus, créé au premier appel et recréé s'il est cassé"""
+    workers = workers or default_workers()
+    with _lock:
+        pool = _pools.get(workers)
+        if pool is not None and pool._broken:
+            pool.shutdown(wait=False, cancel_futures=True)
+            pool = None
+        if pool is None:
+            pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+            _pools[workers] = pool
+        return pool
+
+
+def _appliquer(fonction, arguments):
+    return fonction(*arguments)
+
+
+def parallel_map(fonction, *iterables, workers=1):
+    """`map` sur le pool si `workers` > 1 et plus d'une tâche, en série sinon ou si le pool est
+    indisponible ou cassé (les tâches sont alors rejouées dans le processus courant)"""
+    taches = list(zip(*iterables))
+    if workers > 1 and len(taches) > 1:
+        try:
+            return list(get_pool(workers).map(_appliquer, repeat(fonction), taches))
+        except (OSError, BrokenProcessPool):
+            pass
+    return [fonction(*arguments) for arguments in taches]
+
+
+@atexit.register
+def shutdown_pools():
+    """Arrête les pools à la sortie du serveur"""
+    with _lock:
+        for pool in _pools.values():
+            pool.shutdown(wait=False, cancel_futures=True)
+        _pools.clear()
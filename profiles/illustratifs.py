@@ -0,0 +1,21 @@
+# profiles/illustratifs.py
+"""Profils illustratifs (ordres de grandeur fictifs) montrant l'API de plugins de country_profiles"""
+from country_profiles import register_profile
+
+register_profile(
+    "Puissance régionale (illustratif)",
+    {"budget_base": 25.0, "personnel_base": 550, "exercices_base": 90,
+     "priorites": ["missiles", "cyber", "conventionnel"]},
+    {"budget_croissance": 0.045, "tech_base": 60.0, "tech_croissance": 1.5, "ad_base": 65.0,
+     "cyber_base": 55.0, "cyber_croissance": 2.5, "precision_base": 300.0, "precision_min": 5.0,
+     "mobilisation_base": 30.0, "mobilisation_min": 5.0},
+    description="Budget élevé, forces conventionnelles modernes, pas de programme nucléaire",
+)
+
+register_profile(
+    "Puissance moyenne (illustratif)",
+    {"budget_base": 8.0, "personnel_base": 150, "exercices_base": 40, "priorites": ["cyber"]},
+    {"budget_croissance": 0.02, "readiness_base": 70.0, "readiness_croissance": 0.8, "tech_base": 50.0,
+     "ad_base": 55.0, "ad_croissance": 1.5, "logistique_base": 65.0, "mobilisation_base": 20.0},
+    description="Armée professionnelle réduite, effort modéré et stable",
+)
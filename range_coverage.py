@@ -0,0 +1,142 @@
+# range_coverage.py
+"""Couverture géographique des portées missilières (calcul hors ligne, vectorisé).
+
+Les distances orthodromiques sont calculées une fois par jeu d'origines grâce à un KD-tree
+(vecteurs unitaires 3D : la distance de corde est monotone avec la distance sur le globe).
+Les distances triées et les poids cumulés permettent ensuite d'obtenir la fraction couverte
+pour n'importe quel tableau de portées par simple `searchsorted`.
+"""
+import numpy as np
+
+try:
+    from scipy.spatial import cKDTree
+except ImportError:  # repli numpy par blocs
+    cKDTree = None
+
+EARTH_RADIUS_KM = 6371.0
+
+# Sites de lancement de référence (lat, lon)
+LAUNCH_SITES = {
+    "Pyongyang (Sunan)": (39.03, 125.67),
+    "Sohae": (39.66, 124.71),
+    "Sinpo": (40.03, 128.18),
+    "Yongbyon": (39.80, 125.75),
+    "Wonsan": (39.15, 127.44),
+}
+
+# Lieux de référence embarqués (zones_cibles et capitales régionales)
+REFERENCE_PLACES = [
+    ("Séoul", "Corée du Sud", 37.57, 126.98),
+    ("Busan", "Corée du Sud", 35.18, 129.08),
+    ("Tokyo", "Japon", 35.68, 139.69),
+    ("Okinawa", "Japon", 26.33, 127.80),
+    ("Sapporo", "Japon", 43.06, 141.35),
+    ("Guam", "Guam", 13.44, 144.79),
+    ("Pékin", "Chine", 39.90, 116.41),
+    ("Shanghai", "Chine", 31.23, 121.47),
+    ("Vladivostok", "Russie", 43.12, 131.89),
+    ("Manille", "Philippines", 14.60, 120.98),
+    ("Darwin", "Australie", -12.46, 130.84),
+    ("Anchorage", "Continental US", 61.22, -149.90),
+    ("Honolulu", "Continental US", 21.31, -157.86),
+    ("Seattle", "Continental US", 47.61, -122.33),
+    ("San Francisco", "Continental US", 37.77, -122.42),
+    ("Los Angeles", "Continental US", 34.05, -118.24),
+    ("Denver", "Continental US", 39.74, -104.99),
+    ("Chicago", "Continental US", 41.88, -87.63),
+    ("Houston", "Continental US", 29.76, -95.37),
+    ("Washington", "Continental US", 38.91, -77.04),
+    ("New York", "Continental US", 40.71, -74.01),
+    ("Miami", "Continental US", 25.76, -80.19),
+    ("Londres", "Europe", 51.51, -0.13),
+    ("Paris", "Europe", 48.86, 2.35),
+    ("Sydney", "Australie", -33.87, 151.21),
+]
+
+
+def unit_vectors(lat, lon):
+    """Vecteurs unitaires 3D (n, 3) à partir de latitudes/longitudes en degrés"""
+    lat = np.radians(np.asarray(lat, dtype=np.float64))
+    lon = np.radians(np.asarray(lon, dtype=np.float64))
+    cos_lat = np.cos(lat)
+    return np.column_stack((cos_lat * np.cos(lon), cos_lat * np.sin(lon), np.sin(lat)))
+
+
+def chord_to_km(chord):
+    """Distance de corde (sphère unité) -> distance orthodromique en km"""
+    return 2.0 * EARTH_RADIUS_KM * np.arcsin(np.clip(chord / 2.0, 0.0, 1.0))
+
+
+def fibonacci_grid(n):
+    """Grille quasi uniforme de `n` points sur le globe (cellules d'aire égale)"""
+    i = np.arange(n, dtype=np.float64) + 0.5
+    lat = np.degrees(np.arcsin(1.0 - 2.0 * i / n))
+    lon = np.degrees((np.pi * (1.0 + 5 ** 0.5) * i) % (2.0 * np.pi)) - 180.0
+    return lat, lon
+
+
+def nearest_distance_km(origins_xyz, targets_xyz, chunk=262144):
+    """Distance orthodromique de chaque cible à l'origine la plus proche"""
+    if cKDTree is not None:
+        chord, _ = cKDTree(origins_xyz).query(targets_xyz, k=1)
+        return chord_to_km(chord)
+    distances = np.empty(len(targets_xyz))
+    for debut in range(0, len(targets_xyz), chunk):
+        bloc = targets_xyz[debut:debut + chunk]
+        cos_max = np.clip((bloc @ origins_xyz.T).max(axis=1), -1.0, 1.0)
+        distances[debut:debut + chunk] = EARTH_RADIUS_KM * np.arccos(cos_max)
+    return distances
+
+
+class CoverageIndex:
+    """Index de couverture pour un jeu d'origines et un ensemble de cibles pondérées"""
+
+    def __init__(self, origins, target_lat, target_lon, weights=None):
+        origines = np.asarray(list(origins), dtype=np.float64).reshape(-1, 2)
+        distances = nearest_distance_km(unit_vectors(origines[:, 0], origines[:, 1]),
+                                        unit_vectors(target_lat, target_lon))
+        self.distances = distances
+        ordre = np.argsort(distances)
+        self.sorted_km = distances[ordre]
+        poids = np.ones(len(distances)) if weights is None else np.asarray(weights, dtype=np.float64)
+        self.cumulative = np.concatenate(([0.0], np.cumsum(poids[ordre])))
+        self.total = self.cumulative[-1]
+
+    @classmethod
+    def global_grid(cls, origins, n_points):
+        """Couverture de la surface terrestre sur une grille de Fibonacci"""
+        lat, lon = fibonacci_grid(n_points)
+        return cls(origins, lat, lon)
+
+    def fraction(self, ranges_km):
+        """Fraction couverte pour un tableau de portées de forme quelconque"""
+        rangs = np.searchsorted(self.sorted_km, np.asarray(ranges_km, dtype=np.float64), side="right")
+        return self.cumulative[rangs] / self.total
+
+    def within(self, ranges_km):
+        """Matrice booléenne (portées × cibles) des cibles à portée"""
+        return np.asarray(ranges_km, dtype=np.float64)[..., None] >= self.distances
+
+
+def coverage_by_year(index, portees, deploiements, annees):
+    """Couverture (systèmes × années) : fraction couverte une fois le système déployé"""
+    couverture = index.fraction(portees)
+    deploye = np.asarray(deploiements)[:, None] <= np.asarray(annees)[None, :]
+    return np.where(deploye, couverture[:, None], 0.0)
+
+
+def max_range_by_year(portees, deploiements, groupes, n_groupes, annees):
+    """Portée maximale déployée (groupes × années) : plus grande portée des systèmes du groupe
+    déployés au plus tard l'année considérée (0 si aucun)"""
+    portees = np.asarray(portees, dtype=np.float64)
+    deploiements = np.asarray(deploiements)
+    groupes = np.asarray(groupes)
+    maximum = np.zeros((n_groupes, len(annees)))
+    for g in range(n_groupes):
+        membres = groupes == g
+        ordre = np.argsort(deploiements[membres], kind="stable")
+        cumul = np.concatenate(([0.0], np.maximum.accumulate(portees[membres][ordre])))
+        rangs = np.searchsorted(deploiements[membres][ordre], np.asarray(annees), side="right")
+        maximum[g] = cumul[rangs]
+    return maximum
+
@@ -0,0 +1,243 @@
+# rerun_profiler.py
+"""Profilage à la demande d'une réexécution Streamlit (session courante uniquement).
+
+Deux modes :
+- "cprofile" : un `cProfile.Profile` par section, activé/désactivé aux changements de section ;
+  les profils sont fusionnés pour le fichier pstats et gardent l'attribution par section.
+- "sample" : un thread échantillonne la pile du thread du script toutes les 5 ms ; chaque pile
+  repliée est préfixée par la section courante (format "collapsed stacks" des flame graphs).
+
+L'échantillonneur ne lit que la pile du thread du script : les autres sessions (threads) du
+serveur ne sont pas affectées. cProfile, lui, n'est pas isolé par thread à partir de Python 3.12
+(il s'appuie sur `sys.monitoring`, global à l'interpréteur) : un seul profil cProfile est actif à
+la fois dans le processus (verrou de module) et une session qui le demande pendant qu'une autre
+profile bascule sur l'échantillonneur. Même seul, un profil cProfile peut inclure sous 3.12 le
+travail des autres sessions exécutées au même moment.
+
+Le paramètre d'URL `?profile=` est retiré après la réexécution profilée, sauf si
+`?profile_sticky=1` demande de profiler toutes les réexécutions.
+"""
+import contextlib
+import cProfile
+import io
+import marshal
+import os
+import pstats
+import sys
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+
+import pandas as pd
+import streamlit as st
+
+PROFILE_MODES = {"cprofile": "cProfile (déterministe)", "sample": "Échantillonnage (5 ms)"}
+SAMPLE_INTERVAL = 0.005
+HORS_SECTION = "(hors section)"
+QUERY_PARAM = "profile"
+STICKY_PARAM = "profile_sticky"
+SESSION_KEY = "profil_demande"
+
+# Un seul cProfile actif par processus (sys.monitoring est global à l'interpréteur sous 3.12)
+_verrou_cprofile = threading.Lock()
+
+
+class RerunProfiler:
+    """Profil d'une réexécution avec attribution par section"""
+
+    def __init__(self, mode, interval=SAMPLE_INTERVAL):
+        if mode not in PROFILE_MODES:
+            raise ValueError(f"Mode de profilage inconnu: {mode}")
+        self.mode = mode
+        self.mode_demande = mode
+        self.interval = interval
+        self.durees = Counter()
+        self.profils = {}
+        self.piles = Counter()
+        self._sections = [HORS_SECTION]
+        self._enfants = [0.0]
+        self._thread_id = threading.get_ident()
+        self._racine = None
+        self._arret = threading.Event()
+        self._echantillonneur = None
+        self.total_ms = 0.0
+
+    # Sections ----------------------------------------------------------------
+
+    def _profil(self, nom):
+        profil = self.profils.get(nom)
+        if profil is None:
+            profil = self.profils[nom] = cProfile.Profile()
+        return profil
+
+    @contextmanager
+    def section(self, nom):
+        """Attribue à `nom` le temps passé dans le bloc (sections imbriquées : la plus interne)"""
+        parent = self._sections[-1]
+        if self.mode == "cprofile":
+            self._profil(parent).disable()
+            self._profil(nom).enable()
+        self._sections.append(nom)
+        self._enfants.append(0.0)
+        debut = time.perf_counter()
+        try:
+            yield
+        finally:
+            duree = (time.perf_counter() - debut) * 1000
+            self.durees[nom] += duree - self._enfants.pop()  # temps propre, hors sous-sections
+            self._enfants[-1] += duree
+            self._sections.pop()
+            if self.mode == "cprofile":
+                self._profil(nom).disable()
+                self._profil(parent).enable()
+
+    # Cycle de vie --------------------------------------------------------------
+
+    def __enter__(self):
+        self._debut = time.perf_counter()
+        # Racine des piles : le cadre qui exécute le bloc profilé (pas ceux de contextlib, déjà
+        # retournés quand l'entrée passe par ExitStack.enter_context)
+        racine = sys._getframe(1)
+        while racine is not None and racine.f_code.co_filename == contextlib.__file__:
+            racine = racine.f_back
+        self._racine = racine
+        if self.mode == "cprofile":
+            if not _verrou_cprofile.acquire(blocking=False):
+                self.mode = "sample"  # cProfile déjà actif dans une autre session
+            else:
+                try:
+                    self._profil(HORS_SECTION).enable()
+                except ValueError:  # outil sys.monitoring déjà installé (débogueur, autre profileur)
+                    _verrou_cprofile.release()
+                    self.profils.clear()
+                    self.mode = "sample"
+        if self.mode == "sample":
+            self._echantillonneur = threading.Thread(target=self._echantillonner, daemon=True)
+            self._echantillonneur.start()
+        return self
+
+    def __exit__(self, *exc):
+        if self.mode == "cprofile":
+            self._profil(self._sections[-1]).disable()
+            _verrou_cprofile.release()
+        else:
+            self._arret.set()
+            self._echantillonneur.join()
+        self.total_ms = (time.perf_counter() - self._debut) * 1000
+        self.durees[HORS_SECTION] = self.total_ms - self._enfants[0]
+        return False
+
+    def _echantillonner(self):
+        while not self._arret.wait(self.interval):
+            frame = sys._current_frames().get(self._thread_id)
+            pile = []
+            while frame is not None and frame is not self._racine:
+                code = frame.f_code
+                pile.append(f"{os.path.basename(code.co_filename)}:{code.co_name}")
+                frame = frame.f_back
+            if pile:
+                pile.append(self._sections[-1])
+                self.piles[";".join(reversed(pile))] += 1
+
+    # Rapports ----------------------------------------------------------------
+
+    def section_table(self):
+        """Temps par section (ms et part du total)"""
+        lignes = [{"Section": nom, "ms": ms, "Part (%)": ms / max(self.total_ms, 1e-9) * 100}
+                  for nom, ms in self.durees.items()]
+        if self.mode == "sample":
+            echantillons = Counter()
+            for pile, n in self.piles.items():
+                echantillons[pile.split(";", 1)[0]] += n
+            for ligne in lignes:
+                ligne["Échantillons"] = echantillons.get(ligne["Section"], 0)
+        return pd.DataFrame(lignes).sort_values("ms", ascending=False)
+
+    def _stats(self):
+        stats = None
+        for profil in self.profils.values():
+            if stats is None:
+                stats = pstats.Stats(profil)
+            else:
+                stats.add(profil)
+        return stats
+
+    def top_functions(self, n=20):
+        """Fonctions les plus coûteuses (temps propre) avec leur section"""
+        lignes = []
+        for section, profil in self.profils.items():
+            for (fichier, ligne, fonction), (cc, nc, tt, ct, _) in pstats.Stats(profil).stats.items():
+                lignes.append({"Section": section, "Fonction": f"{os.path.basename(fichier)}:{ligne}({fonction})",
+                               "Appels": nc, "Temps propre (ms)": tt * 1000, "Temps cumulé (ms)": ct * 1000})
+        if not lignes:
+            return pd.DataFrame()
+        return pd.DataFrame(lignes).sort_values("Temps propre (ms)", ascending=False).head(n)
+
+    def pstats_bytes(self):
+        """Profil fusionné au format pstats (lisible par `pstats.Stats`, snakeviz...)"""
+        stats = self._stats()
+        return marshal.dumps(stats.stats) if stats is not None else b""
+
+    def collapsed_stacks(self):
+        """Piles repliées "section;module:fonction;... poids" pour flamegraph.pl / speedscope"""
+        if self.mode == "sample":
+            lignes = [f"{pile} {n}" for pile, n in self.piles.most_common()]
+        else:
+            # cProfile ne garde pas les piles complètes : section;fonction pondéré par le temps propre (µs)
+            lignes = []
+            for section, profil in self.profils.items():
+                for (fichier, ligne, fonction), (_, _, tt, _, _) in pstats.Stats(profil).stats.items():
+                    if tt > 0:
+                        lignes.append(f"{section};{os.path.basename(fichier)}:{fonction} {int(tt * 1e6)}")
+        return "\n".join(lignes).encode("utf-8")
+
+    def text_report(self, n=40):
+        """Rapport pstats texte (tri par temps cumulé)"""
+        stats = self._stats()
+        if stats is None:
+            return ""
+        sortie = io.StringIO()
+        stats.stream = sortie
+        stats.sort_stats("cumulative").print_stats(n)
+        return sortie.getvalue()
+
+
+def requested_profiler():
+    """Profileur demandé pour cette réexécution (paramètre d'URL ?profile= ou bouton admin), sinon None ;
+    le paramètre d'URL ne vaut que pour une réexécution sauf ?profile_sticky=1"""
+    mode = st.session_state.pop(SESSION_KEY, None)
+    if mode is None and QUERY_PARAM in st.query_params:
+        mode = st.query_params[QUERY_PARAM]
+        if st.query_params.get(STICKY_PARAM) != "1":
+            del st.query_params[QUERY_PARAM]
+    return RerunProfiler(mode) if mode in PROFILE_MODES else None
+
+
+def render_profile_controls():
+    """Contrôle admin (RPDC_ADMIN=1) : profiler la prochaine réexécution de cette session"""
+    if os.environ.get("RPDC_ADMIN") != "1":
+        return
+    with st.sidebar.expander("🩺 ADMIN - PROFILAGE"):
+        mode = st.selectbox("Profileur:", list(PROFILE_MODES), format_func=PROFILE_MODES.get, key="profil_mode")
+        st.button("Profiler la prochaine réexécution", on_click=st.session_state.__setitem__,
+                  args=(SESSION_KEY, mode))
+
+
+def render_profile_report(profiler):
+    """Rapport du profil et téléchargements (pstats, piles repliées, sections)"""
+    with st.sidebar.expander(f"⏱️ PROFIL DE LA RÉEXÉCUTION ({profiler.total_ms:.0f} ms)", expanded=True):
+        if profiler.mode != profiler.mode_demande:
+            st.caption("cProfile déjà actif dans une autre session : profil par échantillonnage.")
+        sections = profiler.section_table()
+        st.dataframe(sections, hide_index=True, use_container_width=True)
+        if profiler.mode == "cprofile":
+            st.dataframe(profiler.top_functions(), hide_index=True, use_container_width=True)
+            st.download_button("📥 Profil pstats", profiler.pstats_bytes(), "rerun.pstats",
+                               mime="application/octet-stream", on_click="ignore")
+            st.download_button("📥 Rapport texte", profiler.text_report().encode("utf-8"), "rerun_pstats.txt",
+                               mime="text/plain", on_click="ignore")
+        st.download_button("📥 Piles repliées (flame graph)", profiler.collapsed_stacks(), "rerun.folded",
+                           mime="text/plain", on_click="ignore")
+        st.download_button("📥 Temps par section (CSV)", sections.to_csv(index=False).encode("utf-8"),
+                           "rerun_sections.csv", mime="text/csv", on_click="ignore")
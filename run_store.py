@@ -0,0 +1,160 @@
+# run_store.py
+"""Historique local des runs dans SQLite.
+
+Chaque run enregistre ses paramètres (JSON), la version du code de simulation et ses séries en
+colonnes compactes : une ligne par métrique, valeurs float32 dans un BLOB, axe des années réduit à
+(première année, nombre d'années). Un run identique (même application, sélection, scénario, code
+et contenu) n'est stocké qu'une fois.
+
+Les requêtes d'historique passent par l'index (app, selection, scenario, horodatage) ; les séries
+d'une métrique pour des centaines de runs sont lues en une requête par paquet d'identifiants et
+décodées directement en une matrice (runs × années).
+"""
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+
+from shared_store import CACHE_DIR
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    app TEXT NOT NULL,
+    selection TEXT NOT NULL,
+    scenario TEXT NOT NULL,
+    horodatage REAL NOT NULL,
+    code_version TEXT NOT NULL,
+    parametres TEXT NOT NULL,
+    annee_debut INTEGER NOT NULL,
+    n_annees INTEGER NOT NULL,
+    empreinte TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS series (
+    run_id INTEGER NOT NULL REFERENCES runs(id) ON DELETE CASCADE,
+    metrique TEXT NOT NULL,
+    valeurs BLOB NOT NULL,
+    PRIMARY KEY (metrique, run_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS runs_selection ON runs (app, selection, scenario, horodatage);
+CREATE INDEX IF NOT EXISTS runs_scenario ON runs (app, scenario, horodatage);
+CREATE INDEX IF NOT EXISTS runs_horodatage ON runs (horodatage);
+CREATE UNIQUE INDEX IF NOT EXISTS runs_unique ON runs (app, selection, scenario, code_version, empreinte);
+"""
+PAQUET_IDS = 900  # sous la limite de variables liées de SQLite
+
+
+def _colonnes(df):
+    """{métrique: octets float32} des colonnes numériques hors année"""
+    numeriques = df.select_dtypes("number").drop(columns="Annee", errors="ignore")
+    bloc = np.ascontiguousarray(numeriques.to_numpy(dtype=np.float32).T)
+    return {c: ligne.tobytes() for c, ligne in zip(numeriques.columns, bloc)}
+
+
+class RunStore:
+    """Runs enregistrés et requêtes d'historique (connexion partagée entre threads, sous verrou)"""
+
+    def __init__(self, chemin=None):
+        self.chemin = chemin or os.path.join(CACHE_DIR, "runs.sqlite")
+        os.makedirs(os.path.dirname(self.chemin), exist_ok=True)
+        self._conn = sqlite3.connect(self.chemin, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA foreign_keys=ON")
+        self._conn.executescript(SCHEMA)
+        self._lock = threading.Lock()
+
+    def record_many(self, runs):
+        """Insère en une transaction des runs (app, selection, scenario, code_version, parametres, df) ;
+        retourne le nombre de runs nouveaux"""
+        lignes = []
+        for app, selection, scenario, code_version, parametres, df in runs:
+            colonnes = _colonnes(df)
+            empreinte = hashlib.sha256(b"".join(k.encode("utf-8") + v for k, v in sorted(colonnes.items())))
+            annees = np.asarray(df["Annee"])
+            lignes.append(((app, selection, scenario or "", time.time(), code_version,
+                            json.dumps(parametres, ensure_ascii=False, sort_keys=True, default=str),
+                            int(annees[0]), len(annees), empreinte.hexdigest()[:32]), colonnes))
+        nouveaux = 0
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                series = []
+                for run, colonnes in lignes:
+                    curseur = self._conn.execute(
+                        "INSERT OR IGNORE INTO runs (app, selection, scenario, horodatage, code_version, parametres,"
+                        " annee_debut, n_annees, empreinte) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", run)
+                    if curseur.rowcount:
+                        nouveaux += 1
+                        series += [(curseur.lastrowid, m, v) for m, v in colonnes.items()]
+                self._conn.executemany("INSERT INTO series (run_id, metrique, valeurs) VALUES (?, ?, ?)", series)
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+        return nouveaux
+
+    def record(self, app, selection, scenario, code_version, parametres, df):
+        return self.record_many([(app, selection, scenario, code_version, parametres, df)])
+
+    def history(self, app, selection, scenario=None, depuis=None, limite=500):
+        """Runs les plus récents d'une sélection (et d'un scénario), du plus récent au plus ancien"""
+        requete = ("SELECT id, scenario, horodatage, code_version, parametres, annee_debut, n_annees FROM runs"
+                   " WHERE app = ? AND selection = ?")
+        args = [app, selection]
+        if scenario is not None:
+            requete += " AND scenario = ?"
+            args.append(scenario)
+        if depuis is not None:
+            requete += " AND horodatage >= ?"
+            args.append(depuis)
+        requete += " ORDER BY horodatage DESC LIMIT ?"
+        args.append(limite)
+        with self._lock:
+            runs = pd.read_sql_query(requete, self._conn, params=args)
+        runs["horodatage"] = pd.to_datetime(runs["horodatage"], unit="s")
+        return runs
+
+    def scenarios(self, app, selection):
+        with self._lock:
+            return [s for (s,) in self._conn.execute(
+                "SELECT DISTINCT scenario FROM runs WHERE app = ? AND selection = ? ORDER BY scenario",
+                (app, selection))]
+
+    def metrics(self, run_ids):
+        """Métriques disponibles pour au moins un des runs"""
+        noms = set()
+        with self._lock:
+            for debut in range(0, len(run_ids), PAQUET_IDS):
+                paquet = list(run_ids[debut:debut + PAQUET_IDS])
+                noms.update(m for (m,) in self._conn.execute(
+                    f"SELECT DISTINCT metrique FROM series WHERE run_id IN ({','.join('?' * len(paquet))})", paquet))
+        return sorted(noms)
+
+    def load_series(self, runs, metrique):
+        """(années, matrice runs × années) d'une métrique pour les runs de `history` (NaN hors couverture)"""
+        debut_min = int(runs["annee_debut"].min())
+        annees = np.arange(debut_min, int((runs["annee_debut"] + runs["n_annees"]).max()))
+        matrice = np.full((len(runs), len(annees)), np.nan, dtype=np.float32)
+        position = {int(r): i for i, r in enumerate(runs["id"])}
+        decalages = dict(zip(runs["id"].astype(int), runs["annee_debut"].astype(int) - debut_min))
+        ids = list(position)
+        with self._lock:
+            for debut in range(0, len(ids), PAQUET_IDS):
+                paquet = ids[debut:debut + PAQUET_IDS]
+                for run_id, valeurs in self._conn.execute(
+                        f"SELECT run_id, valeurs FROM series WHERE metrique = ? AND run_id IN "
+                        f"({','.join('?' * len(paquet))})", [metrique] + paquet):
+                    serie = np.frombuffer(valeurs, dtype=np.float32)
+                    d = decalages[run_id]
+                    matrice[position[run_id], d:d + len(serie)] = serie
+        return annees, matrice
+
+    def count(self):
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM runs").fetchone()[0]
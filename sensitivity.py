@@ -0,0 +1,92 @@
+# sensitivity.py
+"""Analyse de sensibilité des coefficients du modèle (defense_model).
+
+- tornado : variation un facteur à la fois (bas/haut) de chaque coefficient ;
+- indices de Sobol du premier ordre et totaux (estimateurs de Saltelli et Jansen).
+
+Le modèle est évalué par lots vectorisés : chaque lot est une matrice (lignes × coefficients)
+passée au modèle sous forme de colonnes (B, 1). Les lots peuvent être répartis sur un pool de processus.
+"""
+from itertools import repeat
+
+import numpy as np
+import pandas as pd
+
+import defense_model
+from process_pool import parallel_map
+
+DEFAULT_SPREAD = 0.2
+BATCH_SIZE = 16384
+STATISTICS = {"final": "Valeur finale", "moyenne": "Moyenne sur la période"}
+
+
+def parameter_ranges(config, spread=DEFAULT_SPREAD, noms=None):
+    """Intervalles ±`spread` autour des coefficients effectifs (coefficients non nuls)"""
+    base = defense_model.coefficients(config)
+    noms = noms or sorted(base)
+    return {nom: (base[nom] * (1 - spread), base[nom] * (1 + spread)) for nom in noms if base[nom] != 0}
+
+
+def evaluate_summary(matrice, noms, annees, config, statistique="final"):
+    """Sortie résumée (B,) de chaque métrique pour un lot (B × P) de coefficients"""
+    overrides = {nom: matrice[:, j:j + 1] for j, nom in enumerate(noms)}
+    sorties = defense_model.generate(annees, config, overrides)
+    if statistique == "moyenne":
+        return {m: np.asarray(v).mean(axis=-1) for m, v in sorties.items()}
+    return {m: np.array(v[..., -1]) for m, v in sorties.items()}
+
+
+def evaluate_batches(matrice, noms, annees, config, statistique="final", workers=1):
+    """Évalue toutes les lignes de `matrice` par lots, en série ou sur le pool de processus"""
+    lots = [matrice[i:i + BATCH_SIZE] for i in range(0, len(matrice), BATCH_SIZE)]
+    arguments = (repeat(list(noms)), repeat(list(annees)), repeat(config), repeat(statistique))
+    resultats = parallel_map(evaluate_summary, lots, *arguments, workers=workers)
+    return {m: np.concatenate([r[m] for r in resultats]) for m in resultats[0]}
+
+
+def tornado(config, annees, ranges, statistique="final"):
+    """Effet bas/haut de chaque coefficient sur chaque métrique (un facteur à la fois)"""
+    noms = list(ranges)
+    base = np.array([defense_model.coefficients(config)[n] for n in noms], dtype=np.float64)
+    matrice = np.tile(base, (1 + 2 * len(noms), 1))
+    for j, nom in enumerate(noms):
+        matrice[1 + 2 * j, j], matrice[2 + 2 * j, j] = ranges[nom]
+    sorties = evaluate_summary(matrice, noms, annees, config, statistique)
+    lignes = []
+    for metrique, y in sorties.items():
+        bas, haut = y[1::2] - y[0], y[2::2] - y[0]
+        lignes.append(pd.DataFrame({"Métrique": metrique, "Paramètre": noms, "Base": y[0],
+                                    "Bas": bas, "Haut": haut, "Amplitude": np.abs(haut - bas)}))
+    return pd.concat(lignes, ignore_index=True)
+
+
+def sobol(config, annees, ranges, n=1024, statistique="final", workers=1, seed=0):
+    """Indices de Sobol (S1, ST) : DataFrames métriques × coefficients.
+
+    Plan de Saltelli : matrices A, B (n × P) uniformes sur `ranges` et P matrices A_B^(i),
+    soit n (P + 2) évaluations du modèle.
+    """
+    noms = list(ranges)
+    p = len(noms)
+    rng = np.random.default_rng(seed)
+    bas = np.array([ranges[n_][0] for n_ in noms])
+    haut = np.array([ranges[n_][1] for n_ in noms])
+    a = bas + (haut - bas) * rng.random((n, p))
+    b = bas + (haut - bas) * rng.random((n, p))
+    ab = np.repeat(a[None, :, :], p, axis=0)
+    ab[np.arange(p), :, np.arange(p)] = b[:, np.arange(p)].T
+    plan = np.concatenate([a, b, ab.reshape(p * n, p)])
+
+    sorties = evaluate_batches(plan, noms, annees, config, statistique, workers)
+    premier, total = {}, {}
+    for metrique, y in sorties.items():
+        y_a, y_b, y_ab = y[:n], y[n:2 * n], y[2 * n:].reshape(p, n)
+        variance = np.var(np.concatenate([y_a, y_b]))
+        if variance <= 1e-12 * max(1.0, np.abs(y_a).mean()) ** 2:
+            premier[metrique] = np.zeros(p)
+            total[metrique] = np.zeros(p)
+            continue
+        premier[metrique] = np.mean(y_b * (y_ab - y_a), axis=1) / variance
+        total[metrique] = 0.5 * np.mean((y_a - y_ab) ** 2, axis=1) / variance
+    return (pd.DataFrame(premier, index=noms).T.clip(lower=0),
+            pd.DataFrame(total, index=noms).T.clip(lower=0))
@@ -0,0 +1,50 @@
+# shared_resources.py
+"""Ressources partagées par les vues de l'application multipage.
+
+Les deux vues (Analyse Stratégique Avancée, Analyse Militaire) tournent dans le même serveur :
+un seul store memmap, un seul historique SQLite et les mêmes lecteurs de journaux, ouverts une
+fois par processus. Les jeux de données d'une vue sont rangés sous `<profil>/<sélection>` et
+portent la version du code de cette vue, une vue peut donc évoluer sans invalider l'autre.
+"""
+import os
+
+import streamlit as st
+
+import defense_model
+import geopolitical_events
+from live_feed import LiveFeed
+from observed_ingest import load_observed
+from run_store import RunStore
+from shared_store import SharedDatasetStore, code_hash
+
+SHARED_NAMESPACE = "rpdc"
+
+
+@st.cache_resource
+def get_shared_store():
+    """Store memmap partagé entre vues et workers, ouvert une fois par processus
+    (versionné par le modèle et la table d'événements qui module ses séries)"""
+    return SharedDatasetStore(SHARED_NAMESPACE, code_hash(defense_model, geopolitical_events))
+
+
+@st.cache_resource(max_entries=4)
+def load_observed_events(chemin, mtime):
+    """Agrégats annuels d'un journal d'événements observés, réingéré quand le fichier change"""
+    return load_observed(chemin)
+
+
+@st.cache_resource(max_entries=4)
+def get_live_feed(chemin):
+    """Lecteur incrémental partagé par les sessions qui suivent le même journal"""
+    return LiveFeed(chemin)
+
+
+@st.cache_resource
+def get_run_store():
+    """Historique SQLite des runs, ouvert une fois par processus"""
+    return RunStore(os.environ.get("RPDC_RUN_STORE"))
+
+
+def dataset_key(profil, selection):
+    """Clé d'un jeu de données dans le store partagé"""
+    return f"{profil}/{selection}"
@@ -0,0 +1,176 @@
+# shared_store.py
+"""Store de données partagé entre les processus Streamlit d'un même hôte.
+
+Les jeux de données générés sont publiés une seule fois dans des fichiers
+memmap (une colonne contiguë par métrique) décrits par un petit index JSON.
+Chaque worker s'y attache en lecture seule, sans copie : les pages mémoire
+sont partagées par le cache du système d'exploitation.
+"""
+import hashlib
+import inspect
+import json
+import os
+import tempfile
+import threading
+from contextlib import contextmanager
+
+import numpy as np
+import pandas as pd
+
+try:
+    import fcntl
+except ImportError:  # Windows : pas de verrou inter-processus
+    fcntl = None
+
+CACHE_DIR = os.environ.get("RPDC_CACHE_DIR", os.path.join(tempfile.gettempdir(), "rpdc_army"))
+
+
+def code_hash(*objets):
+    """Empreinte du code source de simulation (invalide le store quand le code change)"""
+    h = hashlib.sha256()
+    for obj in objets:
+        try:
+            source = inspect.getsource(obj)
+        except (OSError, TypeError):
+            source = repr(obj)
+        h.update(source.encode("utf-8"))
+    return h.hexdigest()[:16]
+
+
+def simulation_hash(cls, *modules):
+    """Empreinte des méthodes de génération/simulation d'une classe de dashboard et des modules de modèle"""
+    noms = sorted(n for n in vars(cls) if n.startswith(("simulate_", "generate_", "get_")))
+    return code_hash(*(getattr(cls, n) for n in noms), *modules)
+
+
+class SharedDatasetStore:
+    """Jeux de données publiés en memmap avec compteur de génération par clé"""
+
+    def __init__(self, namespace, code_version, root=CACHE_DIR):
+        self.namespace = namespace
+        self.code_version = code_version
+        self.root = os.path.join(root, "shared", namespace)
+        os.makedirs(self.root, exist_ok=True)
+        self.index_path = os.path.join(self.root, "index.json")
+        self.lock_path = os.path.join(self.root, "index.lock")
+        self._attached = {}
+        self._local_lock = threading.Lock()
+        self.stats = {"hits": 0, "attaches": 0, "publications": 0}
+        self._stats_prefixes = {}
+
+    @contextmanager
+    def _verrou(self):
+        """Verrou exclusif inter-processus autour de l'index"""
+        with self._local_lock, open(self.lock_path, "a") as f:
+            if fcntl is not None:
+                fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(f, fcntl.LOCK_UN)
+
+    def _lire_index(self):
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _ecrire_index(self, index):
+        tmp = f"{self.index_path}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(index, f, ensure_ascii=False, indent=1)
+        os.replace(tmp, self.index_path)
+
+    def _fichier(self, key, generation):
+        nom = hashlib.sha1(key.encode("utf-8")).hexdigest()[:20]
+        return os.path.join(self.root, f"{nom}-g{generation}.bin")
+
+    def get_or_publish(self, key, builder, code_version=None):
+        """Retourne le DataFrame partagé pour `key`, en le publiant via `builder` si besoin
+        (`code_version` remplace celle du store pour cette clé)"""
+        version = code_version or self.code_version
+        entree = self._lire_index().get(key)
+        if entree is None or entree["code_version"] != version:
+            with self._verrou():
+                index = self._lire_index()
+                entree = index.get(key)
+                if entree is None or entree["code_version"] != version:
+                    entree = self._publier(index, key, builder(), version)
+        return self._attacher(key, entree)
+
+    def _publier(self, index, key, df, code_version):
+        """Écrit les colonnes dans un nouveau fichier de génération et met à jour l'index"""
+        ancienne = index.get(key)
+        generation = ancienne["generation"] + 1 if ancienne else 1
+        colonnes, offset = [], 0
+        for nom in df.columns:
+            valeurs = np.ascontiguousarray(df[nom].to_numpy())
+            if valeurs.dtype.kind not in "biuf":
+                raise ValueError(f"Colonne non numérique non publiable: {nom}")
+            colonnes.append({"name": nom, "dtype": valeurs.dtype.str, "offset": offset})
+            offset += valeurs.nbytes
+        chemin = self._fichier(key, generation)
+        tmp = f"{chemin}.{os.getpid()}.tmp"
+        mm = np.memmap(tmp, dtype=np.uint8, mode="w+", shape=(max(offset, 1),))
+        for col, nom in zip(colonnes, df.columns):
+            valeurs = np.ascontiguousarray(df[nom].to_numpy())
+            mm[col["offset"]:col["offset"] + valeurs.nbytes] = valeurs.view(np.uint8)
+        mm.flush()
+        del mm
+        os.replace(tmp, chemin)
+
+        entree = {
+            "file": os.path.basename(chemin),
+            "generation": generation,
+            "code_version": code_version,
+            "nrows": len(df),
+            "columns": colonnes,
+        }
+        index[key] = entree
+        self._ecrire_index(index)
+        # Les workers déjà attachés gardent leur mapping ; le fichier supprimé reste valide pour eux
+        if ancienne and ancienne["file"] != entree["file"]:
+            try:
+                os.remove(os.path.join(self.root, ancienne["file"]))
+            except OSError:
+                pass
+        self._compter("publications", key)
+        return entree
+
+    def _attacher(self, key, entree):
+        """Vue DataFrame zéro-copie en lecture seule sur le fichier publié"""
+        cache = self._attached.get(key)
+        if cache is not None and cache[0] == entree["generation"]:
+            self._compter("hits", key)
+            return cache[1]
+        chemin = os.path.join(self.root, entree["file"])
+        colonnes = {}
+        for col in entree["columns"]:
+            colonnes[col["name"]] = np.memmap(chemin, dtype=np.dtype(col["dtype"]), mode="r",
+                                              offset=col["offset"], shape=(entree["nrows"],))
+        df = pd.DataFrame(colonnes, copy=False)
+        self._attached[key] = (entree["generation"], df)
+        self._compter("attaches", key)
+        return df
+
+    def _compter(self, evenement, key):
+        """Compteur global et compteur du préfixe de la clé (`<profil>/...`)"""
+        self.stats[evenement] += 1
+        prefixe = self._stats_prefixes.setdefault(key.split("/", 1)[0], dict.fromkeys(self.stats, 0))
+        prefixe[evenement] += 1
+
+    def stats_for(self, prefixe=None):
+        """Compteurs de tout le store, ou des seules clés `<prefixe>/...`"""
+        if prefixe is None:
+            return dict(self.stats)
+        return dict(self._stats_prefixes.get(prefixe, dict.fromkeys(self.stats, 0)))
+
+    def attached_frames(self):
+        """DataFrames attachés par ce processus (pour la comptabilité mémoire)"""
+        return {key: df for key, (_, df) in self._attached.items()}
+
+    def generations(self):
+        """Génération publiée par clé (pour le diagnostic)"""
+        return {key: e["generation"] for key, e in self._lire_index().items()}
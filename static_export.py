@@ -0,0 +1,238 @@
+# static_export.py
+"""Export statique des vues par défaut des dashboards (site servi sans Python).
+
+Chaque sélection × scénario est rendue hors Streamlit : les figures passent par la même chaîne
+que `render_chart` (WebGL, compaction) puis sont écrites une seule fois sous un nom dérivé de
+leur contenu. Les pages ne sont que des listes d'empreintes ; le template Plotly et les données
+sont dédupliqués de la même façon. Seul `index.html` change d'un export à l'autre, tous les
+autres fichiers peuvent être servis avec un cache longue durée (`immutable`).
+
+    python static_export.py --out site
+    python -m http.server --directory site 8080
+"""
+import argparse
+import hashlib
+import json
+import os
+import sys
+import time
+
+import numpy as np
+import plotly
+import plotly.io as pio
+
+from figure_payload import optimize_figure
+from webgl_charts import WEBGL_POINT_THRESHOLD, apply_webgl
+
+# Vues rendues par application : (module, classe, chargement des données, vues par défaut)
+APPS = {
+    "dash": {
+        "titre": "Analyse Stratégique Avancée",
+        "module": "Dash", "classe": "DefenseCoreeNordDashboardAvance", "chargement": "load_advanced_data",
+        "selections": lambda d: d.branches_options + d.programmes_options + ["Scénarios Géopolitiques"],
+        "vues": (
+            lambda d, df, config, controls: d.create_comprehensive_analysis(df, config),
+            lambda d, df, config, controls: d.create_technical_analysis(df, config),
+            lambda d, df, config, controls: d.create_geopolitical_analysis(df, config),
+            lambda d, df, config, controls: d.create_threat_assessment(df, config),
+            lambda d, df, config, controls: d.create_strategic_synthesis(df, config, controls),
+        ),
+    },
+    "dashboard": {
+        "titre": "Analyse Militaire",
+        "module": "Dashboard", "classe": "DefenseCoreeNordDashboard", "chargement": "load_defense_data",
+        "selections": lambda d: d.branches_options + d.programmes_options,
+        "vues": (
+            lambda d, df, config, controls: d.create_budget_analysis(df, config),
+            lambda d, df, config, controls: d.create_military_activities_analysis(df, config),
+            lambda d, df, config, controls: d.create_capabilities_analysis(df, config),
+            lambda d, df, config, controls: d.create_strategic_programs_analysis(df, config),
+            lambda d, df, config, controls: d.create_juche_analysis(df, config),
+            lambda d, df, config, controls: d.create_comparative_analysis(df, config),
+        ),
+    },
+}
+
+
+def content_hash(octets):
+    return hashlib.sha256(octets).hexdigest()[:16]
+
+
+class ContentStore:
+    """Fichiers adressés par leur contenu : un contenu identique n'est écrit qu'une fois"""
+
+    def __init__(self, racine):
+        self.racine = racine
+        self.references = 0
+        self.octets_references = 0
+        self.octets_ecrits = 0
+        self._connus = set()
+
+    def put(self, dossier, octets, extension):
+        """Nom relatif du fichier contenant `octets`"""
+        nom = f"{dossier}/{content_hash(octets)}.{extension}"
+        self.references += 1
+        self.octets_references += len(octets)
+        if nom not in self._connus:
+            self._connus.add(nom)
+            chemin = os.path.join(self.racine, nom)
+            os.makedirs(os.path.dirname(chemin), exist_ok=True)
+            with open(chemin, "wb") as f:
+                f.write(octets)
+            self.octets_ecrits += len(octets)
+        return nom
+
+    @property
+    def fichiers(self):
+        return len(self._connus)
+
+
+def _json_bytes(obj):
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False, sort_keys=True).encode("utf-8")
+
+
+def figure_entry(fig, store, webgl_threshold=WEBGL_POINT_THRESHOLD):
+    """Figure compactée comme dans `render_chart`, template et figure stockés séparément"""
+    apply_webgl(fig, webgl_threshold)
+    optimize_figure(fig)
+    figure = json.loads(pio.to_json(fig, validate=False))
+    template = figure.get("layout", {}).pop("template", None)
+    if template is not None:
+        figure["template"] = store.put("templates", _json_bytes(template), "json")
+    return {"titre": fig.layout.title.text or "", "figure": store.put("figures", _json_bytes(figure), "json")}
+
+
+def data_entry(df, store):
+    """Données de la page en colonnes JSON (dernière année mise en avant côté client)"""
+    colonnes = {c: np.asarray(df[c]).tolist() for c in df.columns}
+    return store.put("data", _json_bytes(colonnes), "json")
+
+
+def render_app(spec, store, webgl_threshold=WEBGL_POINT_THRESHOLD):
+    """Manifeste d'une application : figures et données de chaque sélection × scénario"""
+    module = __import__(spec["module"])
+    dashboard = getattr(module, spec["classe"])()
+    figures = []
+    dashboard.render_chart = figures.append  # capture au lieu de st.plotly_chart
+    selections = spec["selections"](dashboard)
+    scenarios = getattr(dashboard, "scenarios_options", [None])
+    pages = {}
+    for selection in selections:
+        df, config = getattr(dashboard, spec["chargement"])(selection)
+        donnees = data_entry(df, store)
+        for scenario in scenarios:
+            controls = {"selection": selection, "scenario": scenario}
+            figures.clear()
+            for vue in spec["vues"]:
+                vue(dashboard, df, config, controls)
+            pages[page_key(selection, scenario)] = {
+                "figures": [figure_entry(fig, store, webgl_threshold) for fig in figures],
+                "donnees": donnees,
+            }
+    return {"titre": spec["titre"], "selections": selections,
+            "scenarios": [s for s in scenarios if s is not None], "pages": pages}
+
+
+def page_key(selection, scenario):
+    return selection if scenario is None else f"{selection}|{scenario}"
+
+
+INDEX_HTML = """<!DOCTYPE html>
+<html lang="fr">
+<head>
+<meta charset="utf-8">
+<title>RPDC - Export statique</title>
+<style>
+body{font-family:sans-serif;margin:0 2rem}h1{color:#ED1C27;border-bottom:3px solid #024FA2}
+nav{display:flex;gap:1rem;margin-bottom:1rem}select{padding:.3rem}
+#kpis{display:flex;flex-wrap:wrap;gap:.5rem;margin-bottom:1rem}
+.kpi{background:linear-gradient(135deg,#1e3c72,#2a5298);color:#fff;padding:.6rem 1rem;border-radius:10px;font-size:.85rem}
+.kpi b{display:block;font-size:1.2rem}#figures{display:grid;grid-template-columns:repeat(auto-fill,minmax(560px,1fr));gap:1rem}
+</style>
+<script src="__PLOTLY__"></script>
+</head>
+<body>
+<h1>⭐ RPDC - Analyse stratégique (export statique)</h1>
+<nav><select id="app"></select><select id="selection"></select><select id="scenario"></select></nav>
+<div id="kpis"></div>
+<div id="figures"></div>
+<script>
+const MANIFEST = "__MANIFEST__";
+const cache = {};
+const charger = url => cache[url] || (cache[url] = fetch(url).then(r => r.json()));
+const $ = id => document.getElementById(id);
+let affichage = 0;
+const remplir = (el, valeurs, choix) => {
+  el.innerHTML = valeurs.map(v => `<option${v === choix ? " selected" : ""}>${v}</option>`).join("");
+  el.hidden = valeurs.length === 0;
+};
+charger(MANIFEST).then(manifeste => {
+  const etat = decodeURIComponent(location.hash.slice(1)).split("/");
+  remplir($("app"), Object.keys(manifeste.apps), etat[0]);
+  const afficher = async () => {
+    const app = manifeste.apps[$("app").value];
+    const cle = app.scenarios.length ? `${$("selection").value}|${$("scenario").value}` : $("selection").value;
+    const page = app.pages[cle];
+    history.replaceState(null, "", "#" + encodeURIComponent([$("app").value, $("selection").value, $("scenario").value].join("/")));
+    const jeton = ++affichage;  // une page plus récente a pu être demandée entre-temps
+    const donnees = await charger(page.donnees);
+    if (jeton !== affichage) return;
+    const derniere = donnees.Annee.length - 1;
+    $("kpis").innerHTML = Object.keys(donnees).filter(c => c !== "Annee").map(c =>
+      `<div class="kpi">${c.replaceAll("_", " ")}<b>${(+donnees[c][derniere]).toLocaleString("fr", {maximumFractionDigits: 1})}</b></div>`).join("");
+    const conteneur = $("figures");
+    conteneur.innerHTML = page.figures.map((_, i) => `<div id="fig${i}"></div>`).join("");
+    page.figures.forEach(async (entree, i) => {
+      const fig = await charger(entree.figure);
+      if (fig.template) fig.layout.template = await charger(fig.template);
+      if (jeton !== affichage) return;
+      Plotly.newPlot(`fig${i}`, fig.data, fig.layout, {responsive: true, displaylogo: false});
+    });
+  };
+  const choisirApp = () => {
+    const app = manifeste.apps[$("app").value];
+    remplir($("selection"), app.selections, etat[1]);
+    remplir($("scenario"), app.scenarios, etat[2]);
+    afficher();
+  };
+  $("app").onchange = choisirApp;
+  $("selection").onchange = $("scenario").onchange = afficher;
+  choisirApp();
+});
+</script>
+</body>
+</html>
+"""
+
+
+def export_site(racine, apps=tuple(APPS), webgl_threshold=WEBGL_POINT_THRESHOLD):
+    """Écrit le site statique dans `racine` ; retourne les statistiques de déduplication (figures, templates, données)"""
+    debut = time.perf_counter()
+    store = ContentStore(racine)
+    manifeste = {"apps": {nom: render_app(APPS[nom], store, webgl_threshold) for nom in apps}}
+    stats = {"references": store.references, "octets_sans_dedup": store.octets_references,
+             "octets_ecrits": store.octets_ecrits, "fichiers": store.fichiers}
+    plotly_js = store.put("assets", plotly.offline.get_plotlyjs().encode("utf-8"), "js")
+    manifeste_nom = store.put("manifests", _json_bytes(manifeste), "json")
+    index = INDEX_HTML.replace("__PLOTLY__", plotly_js).replace("__MANIFEST__", manifeste_nom)
+    with open(os.path.join(racine, "index.html"), "w", encoding="utf-8") as f:
+        f.write(index)
+    stats.update(pages=sum(len(a["pages"]) for a in manifeste["apps"].values()),
+                 secondes=time.perf_counter() - debut)
+    return stats
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Export statique des dashboards RPDC")
+    parser.add_argument("--out", default="site", help="dossier de sortie")
+    parser.add_argument("--apps", nargs="+", choices=sorted(APPS), default=list(APPS))
+    parser.add_argument("--webgl-threshold", type=int, default=WEBGL_POINT_THRESHOLD)
+    args = parser.parse_args(argv)
+    stats = export_site(args.out, args.apps, args.webgl_threshold)
+    print(f"{stats['pages']} pages, {stats['references']} références -> {stats['fichiers']} fichiers, "
+          f"{stats['octets_ecrits'] / 1024:.0f} Ko écrits ({stats['octets_sans_dedup'] / 1024:.0f} Ko sans "
+          f"déduplication) en {stats['secondes']:.1f} s")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
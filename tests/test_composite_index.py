@@ -0,0 +1,72 @@
+"""Indice composite : mises à jour de rang 1 comparées à une évaluation directe W @ F"""
+import numpy as np
+import pandas as pd
+
+from composite_index import REBUILD_EVERY, CompositeIndexEngine, normalize_metrics
+
+
+def _features(rng, m=4, e=5, t=7):
+    return rng.uniform(0, 100, size=(m, e, t))
+
+
+def _direct(features, poids, bruit):
+    """Indice (K × E × T) recalculé sans état : (w ∘ ε) @ F normalisé par la somme des poids"""
+    w = poids * bruit
+    return np.einsum("km,met->ket", w, features) / w.sum(axis=1)[:, None, None]
+
+
+def test_mises_a_jour_rang_un():
+    rng = np.random.default_rng(0)
+    features = _features(rng)
+    moteur = CompositeIndexEngine(features, [1.0, 1.0, 1.0, 1.0], n_tirages=200, dispersion=0.3)
+    poids = np.ones(4)
+    for _ in range(REBUILD_EVERY - 1):  # aucune reconstruction intermédiaire
+        j = rng.integers(4)
+        poids[j] = rng.uniform(0.1, 5.0)
+        assert moteur.update(poids.copy()) == 1
+    assert moteur.reconstructions == 1
+    np.testing.assert_allclose(moteur.scores(), _direct(features, poids, moteur.bruit), rtol=1e-10)
+    np.testing.assert_allclose(moteur.reference(), np.einsum("m,met->et", poids, features) / poids.sum(),
+                               rtol=1e-10)
+
+
+def test_reconstruction_periodique_et_changements_multiples():
+    rng = np.random.default_rng(1)
+    features = _features(rng)
+    moteur = CompositeIndexEngine(features, [1.0, 2.0, 3.0, 4.0], n_tirages=100)
+    poids = np.array([1.0, 2.0, 3.0, 4.0])
+    for i in range(REBUILD_EVERY):
+        poids[i % 4] += 0.5
+        moteur.update(poids.copy())
+    assert moteur.reconstructions == 2
+    # Plus de la moitié des poids changés : reconstruction complète
+    poids = np.array([4.0, 3.0, 2.0, 1.0])
+    assert moteur.update(poids) == 4
+    assert moteur.reconstructions == 3
+    np.testing.assert_allclose(moteur.scores(), _direct(features, poids, moteur.bruit), rtol=1e-12)
+
+
+def test_poids_inchanges():
+    rng = np.random.default_rng(2)
+    moteur = CompositeIndexEngine(_features(rng), [1.0, 1.0, 1.0, 1.0], n_tirages=50)
+    assert moteur.update([1.0, 1.0, 1.0, 1.0]) == 0
+    assert moteur.mises_a_jour == 0
+
+
+def test_stabilite_des_rangs():
+    rng = np.random.default_rng(3)
+    moteur = CompositeIndexEngine(_features(rng), [1.0, 2.0, 1.0, 0.5], n_tirages=300)
+    stabilite = moteur.rank_stability()
+    np.testing.assert_allclose(stabilite["frequence"].sum(axis=1), 1.0)
+    np.testing.assert_allclose(stabilite["frequence"].sum(axis=0), 1.0)
+    assert 0.0 <= stabilite["part_modifiee"] <= 1.0
+
+
+def test_normalisation():
+    frames = {
+        "A": pd.DataFrame({"Budget_Defense_Mds": [1.0, 2.0], "Temps_Mobilisation_Jours": [10.0, 20.0]}),
+        "B": pd.DataFrame({"Budget_Defense_Mds": [3.0, 5.0], "Temps_Mobilisation_Jours": [30.0, 50.0]}),
+    }
+    f = normalize_metrics(frames, ["Budget_Defense_Mds", "Temps_Mobilisation_Jours"])
+    np.testing.assert_allclose(f[0], [[0.0, 25.0], [50.0, 100.0]])
+    np.testing.assert_allclose(f[1], [[100.0, 75.0], [50.0, 0.0]])  # métrique inversée
@@ -0,0 +1,107 @@
+"""Modèle vectorisé : égalité avec les boucles par année d'origine et évaluation par lots"""
+import math
+
+import numpy as np
+import pytest
+
+import defense_model
+
+ANNEES = list(range(2000, 2028))
+CONFIG = {"budget_base": 2.5, "personnel_base": 1100, "exercices_base": 70,
+          "priorites": ["nucleaire", "missiles", "cyber"]}
+
+
+def _budget(a):
+    base = 2.5 * (1 + 0.035 * (a - 2000))
+    if 2006 <= a <= 2009:
+        base *= 1.1
+    elif 2013 <= a <= 2017:
+        base *= 1.15
+    elif a >= 2022:
+        base *= 1.2
+    return base
+
+
+def _readiness(a):
+    return min(65 + 1.5 * (a - 2000) + 5 * (a >= 2010) + 8 * (a >= 2020), 95)
+
+
+def _palier(a, valeurs):
+    """Valeur du régime de l'année : [(première année, f(a)), ...] trié"""
+    return [f for debut, f in valeurs if a >= debut][-1](a)
+
+
+# Implémentation de référence : simulate_* du dashboard d'origine, une année à la fois
+REFERENCE = {
+    "Budget_Defense_Mds": _budget,
+    "Personnel_Milliers": lambda a: 1100 * (1 + 0.008 * (a - 2000)),
+    "PIB_Militaire_Pourcent": lambda a: 22 + 0.2 * (a - 2000),
+    "Exercices_Militaires": lambda a: 70 + 3 * (a - 2000) + 5 * math.sin(2 * math.pi * (a - 2000) / 4),
+    "Readiness_Operative": _readiness,
+    "Capacite_Dissuasion": lambda a: min(_palier(a, [(0, lambda a: 30), (2006, lambda a: 45), (2013, lambda a: 65),
+                                                     (2017, lambda a: 80 + 2 * (a - 2017))]), 95),
+    "Temps_Mobilisation_Jours": lambda a: max(72 - 2 * (a - 2000), 12),
+    "Tests_Missiles": lambda a: _palier(a, [(0, lambda a: 1), (2006, lambda a: 2 + (a - 2006)),
+                                            (2012, lambda a: 8 + 2 * (a - 2012)), (2017, lambda a: 20 + 4 * (a - 2017))]),
+    "Developpement_Technologique": lambda a: min(30 + 3 * (a - 2000), 85),
+    "Capacite_Artillerie": lambda a: min(70 + 2 * (a - 2000), 95),
+    "Couverture_AD": lambda a: min(40 + 3 * (a - 2000), 85),
+    "Resilience_Logistique": lambda a: min(50 + 2.5 * (a - 2000), 90),
+    "Cyber_Capabilities": lambda a: min(30 + 4 * (a - 2000), 88),
+    "Production_Munitions": lambda a: min(60 + 2 * (a - 2000), 95),
+    "Stock_Ogives_Nucleaires": lambda a: _palier(a, [(0, lambda a: 0), (2006, lambda a: max(5 + (a - 2006), 10)),
+                                                     (2013, lambda a: 15 + 3 * (a - 2013)),
+                                                     (2017, lambda a: 30 + 4 * (a - 2017))]),
+    "Portee_Max_Missiles_Km": lambda a: _palier(a, [(0, lambda a: 500), (2006, lambda a: 1000 + 200 * (a - 2006)),
+                                                    (2012, lambda a: 3000 + 1000 * (a - 2012)),
+                                                    (2017, lambda a: 15000)]),
+    "Tetes_Multiples": lambda a: max(0, min(3 * (a - 2017), 8)),
+    "Essais_Souterrains": lambda a: min(20 + 2 * (a - 2000), 80),
+    "Precision_Missiles_Metres": lambda a: max(2000 - 80 * (a - 2000), 50),
+    "Taux_Success_Lancement": lambda a: min(40 + 3 * (a - 2000), 92),
+    "Diversification_Plateformes": lambda a: min(20 + 4 * (a - 2000), 85),
+    "Attaques_Cyber_Reussies": lambda a: max(5 + 2 * (a - 2010), 0),
+    "Reseau_Commandement_Cyber": lambda a: min(25 + 5 * (a - 2010), 90),
+    "Cyber_Defense_Niveau": lambda a: min(35 + 4 * (a - 2010), 85),
+}
+
+
+def test_generation_identique_a_la_reference():
+    series = defense_model.generate(ANNEES, CONFIG)
+    assert set(series) == set(REFERENCE)
+    for metrique, reference in REFERENCE.items():
+        np.testing.assert_allclose(series[metrique], [reference(a) for a in ANNEES], rtol=1e-12,
+                                   err_msg=metrique)
+
+
+def test_lot_egal_evaluations_individuelles():
+    """Des coefficients en colonnes (B, 1) donnent, ligne par ligne, les séries des coefficients scalaires"""
+    rng = np.random.default_rng(0)
+    noms = ["budget_croissance", "budget_mult_modernisation", "dissuasion_croissance", "tech_max"]
+    base = defense_model.coefficients(CONFIG)
+    lots = {n: base[n] * rng.uniform(0.5, 1.5, size=(6, 1)) for n in noms}
+    series = defense_model.generate(ANNEES, CONFIG, lots)
+    for b in range(6):
+        individuelles = defense_model.generate(ANNEES, CONFIG, {n: float(v[b, 0]) for n, v in lots.items()})
+        for metrique, valeurs in individuelles.items():
+            assert series[metrique].shape == (6, len(ANNEES))
+            np.testing.assert_allclose(series[metrique][b], valeurs, rtol=1e-12, err_msg=metrique)
+
+
+@pytest.mark.parametrize("annee, attendu", [(2005.5, 30.0), (2012.5, 45.0), (2016.5, 65.0), (2017.5, 81.0)])
+def test_annees_fractionnaires_entre_regimes(annee, attendu):
+    """Une année entre deux intervalles de régime relève du régime commencé avant elle"""
+    c = defense_model.coefficients(CONFIG)
+    assert defense_model.deterrence([annee], c)[0] == pytest.approx(attendu)
+
+
+def test_scenarios_en_un_lot():
+    scenarios = list(defense_model.SCENARIO_MODIFIERS)
+    metriques, cube, ecarts, _ = defense_model.compare_scenarios(ANNEES, CONFIG, scenarios)
+    for s, scenario in enumerate(scenarios):
+        c = defense_model.coefficients(CONFIG)
+        surcharges = {n: c[n] * f for n, f in defense_model.SCENARIO_MODIFIERS[scenario].items()}
+        seule = defense_model.generate(ANNEES, CONFIG, surcharges)
+        for m, metrique in enumerate(metriques):
+            np.testing.assert_allclose(cube[m, s], seule[metrique], rtol=1e-12)
+    np.testing.assert_array_equal(ecarts[:, 0], 0.0)
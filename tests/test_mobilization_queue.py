@@ -0,0 +1,85 @@
+"""Mobilisation par événements discrets : invariants et ordonnanceur global de référence"""
+import heapq
+
+import numpy as np
+import pytest
+
+from mobilization_queue import (FRACTIONS, NETWORK, SCENARIO_DISRUPTIONS, mobilization_distributions,
+                                network_parameters, simulate)
+
+
+def _tirages(n_unites, durees, cv, rappel_j, seed):
+    """Mêmes tirages que `simulate` : services (S, N) puis arrivées triées"""
+    rng = np.random.default_rng(seed)
+    sigma2 = np.log1p(np.square(cv))
+    services = np.exp(np.log(durees)[:, None] - sigma2[:, None] / 2
+                      + np.sqrt(sigma2)[:, None] * rng.standard_normal((len(durees), n_unites)))
+    return services, np.sort(rng.uniform(0.0, rappel_j, n_unites))
+
+
+def _reference(n_unites, postes, durees, cv, rappel_j, seed):
+    """Ordonnanceur global : tas d'événements (instant, unité, étape terminée), files FIFO par étape"""
+    services, arrivees = _tirages(n_unites, durees, cv, rappel_j, seed)
+    tas = [(a, u, -1) for u, a in enumerate(arrivees)]
+    heapq.heapify(tas)
+    libres, files = list(postes), [[] for _ in postes]
+    attentes, rassembles = np.zeros(len(postes)), []
+    while tas:
+        t, u, s = heapq.heappop(tas)
+        if s >= 0:
+            if files[s]:
+                v, arrivee = files[s].pop(0)
+                attentes[s] += t - arrivee
+                heapq.heappush(tas, (t + services[s, v], v, s))
+            else:
+                libres[s] += 1
+        if s + 1 == len(postes):
+            rassembles.append(t)
+        elif libres[s + 1]:
+            libres[s + 1] -= 1
+            heapq.heappush(tas, (t + services[s + 1, u], u, s + 1))
+        else:
+            files[s + 1].append((u, t))
+    return attentes / n_unites, np.array(rassembles)
+
+
+@pytest.mark.parametrize("n_unites, resilience, scenario", [
+    (300, 80, "Statut Quo"), (1000, 40, "Crise Majeure"), (2000, 100, "Modernisation Accélérée")])
+def test_egal_ordonnanceur_global(n_unites, resilience, scenario):
+    parametres = network_parameters(n_unites, resilience, 10, SCENARIO_DISRUPTIONS[scenario])
+    resultat = simulate(n_unites, seed=7, **parametres)
+    attentes, rassembles = _reference(n_unites, seed=7, **parametres)
+    rangs = np.ceil(FRACTIONS * n_unites).astype(int) - 1
+    np.testing.assert_allclose(resultat["attentes"], attentes, rtol=1e-9, atol=1e-12)
+    np.testing.assert_allclose(resultat["rassemblement"], rassembles[rangs], rtol=1e-12)
+    assert resultat["evenements"] == n_unites * (len(NETWORK) + 1)
+
+
+def test_sans_attente_avec_postes_suffisants():
+    """Autant de postes que d'unités : aucune attente, rassemblement = arrivée + somme des services"""
+    n = 200
+    durees, cv = np.array([0.5, 0.2, 0.3]), np.array([0.5, 0.8, 0.3])
+    resultat = simulate(n, [n] * 3, durees, cv, 5.0, seed=1)
+    services, arrivees = _tirages(n, durees, cv, 5.0, 1)
+    np.testing.assert_array_equal(resultat["attentes"], 0.0)
+    fins = np.sort(arrivees + services.sum(axis=0))
+    np.testing.assert_allclose(resultat["rassemblement"], fins[np.ceil(FRACTIONS * n).astype(int) - 1])
+
+
+def test_rassemblement_croissant():
+    resultat = simulate(1000, seed=3, **network_parameters(1000, 50, 10))
+    assert np.all(np.diff(resultat["rassemblement"]) >= 0)
+    assert resultat["rassemblement"][0] <= resultat["temps"] <= resultat["rassemblement"][-1]
+
+
+def test_distributions_par_scenario():
+    etats = {"Statut Quo": (80.0, 10.0), "Crise Majeure": (50.0, 10.0)}
+    resultat = mobilization_distributions(etats, n_unites=500, n_replications=10, seed=2)
+    replications = resultat["replications"]
+    assert len(replications) == 20
+    assert resultat["rassemblement"].shape == (2, 10, len(FRACTIONS))
+    assert resultat["evenements"] == 2 * 10 * 500 * (len(NETWORK) + 1)
+    moyennes = replications.groupby("Scénario")["Temps de mobilisation (j)"].mean()
+    assert moyennes["Crise Majeure"] > moyennes["Statut Quo"]
+    encore = mobilization_distributions(etats, n_unites=500, n_replications=10, seed=2)
+    np.testing.assert_array_equal(encore["rassemblement"], resultat["rassemblement"])
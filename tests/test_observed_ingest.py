@@ -0,0 +1,27 @@
+# tests/test_observed_ingest.py
+"""Grille annuelle des métriques observées"""
+import numpy as np
+
+from observed_ingest import aggregate_file, to_year_grid
+
+
+def _journal(tmp_path, lignes):
+    chemin = tmp_path / "journal.csv"
+    chemin.write_text("Annee,type,valeur\n" + "\n".join(lignes) + "\n", encoding="utf-8")
+    agrege, _ = aggregate_file(str(chemin))
+    return agrege
+
+
+def test_journal_hors_grille(tmp_path):
+    """Un journal sans année commune avec la grille ne lève pas d'erreur et n'ajoute aucune métrique"""
+    agrege = _journal(tmp_path, ["2005,test_missile,2", "2006,exercice,3", "2006,budget,4.5"])
+    grille = to_year_grid(agrege, range(2012, 2028), "Armée Populaire de Corée")
+    assert list(grille.columns) == ["Annee"]
+    assert grille["Annee"].tolist() == list(range(2012, 2028))
+
+
+def test_journal_partiel(tmp_path):
+    """Comptages à 0 dans la période observée, NaN en dehors"""
+    agrege = _journal(tmp_path, ["2013,test_missile,2", "2015,test_missile,1"])
+    grille = to_year_grid(agrege, range(2012, 2017), "Armée Populaire de Corée")
+    np.testing.assert_array_equal(grille["Tests_Missiles"].to_numpy(), [np.nan, 2, 0, 1, np.nan])
@@ -0,0 +1,46 @@
+"""Historique SQLite : déduplication des runs et relecture des séries"""
+import numpy as np
+import pandas as pd
+
+from run_store import RunStore
+
+
+def _run(debut=2000, n=28, decalage=0.0):
+    annees = np.arange(debut, debut + n)
+    return pd.DataFrame({"Annee": annees, "Budget": 1.0 + 0.1 * (annees - 2000) + decalage,
+                         "Tests": (annees - 2000).astype(float)})
+
+
+def test_runs_identiques_stockes_une_fois(tmp_path):
+    store = RunStore(str(tmp_path / "runs.sqlite"))
+    assert store.record("dash", "A", "", "v1", {"config": {"x": 1}}, _run()) == 1
+    assert store.record("dash", "A", "", "v1", {"config": {"x": 1}}, _run()) == 0
+    assert store.count() == 1
+    # Contenu, version du code, scénario ou sélection différents : nouveaux runs
+    assert store.record_many([
+        ("dash", "A", "", "v1", {}, _run(decalage=1.0)),
+        ("dash", "A", "", "v2", {}, _run()),
+        ("dash", "A", "Crise Majeure", "v1", {}, _run()),
+        ("dash", "B", "", "v1", {}, _run()),
+        ("dash", "B", "", "v1", {}, _run()),
+    ]) == 4
+    assert store.count() == 5
+
+
+def test_historique_et_series(tmp_path):
+    store = RunStore(str(tmp_path / "runs.sqlite"))
+    store.record("dash", "A", "", "v1", {}, _run())
+    store.record("dash", "A", "", "v1", {}, _run(debut=2010, n=10, decalage=2.0))
+    store.record("dash", "A", "Crise Majeure", "v1", {}, _run())
+    runs = store.history("dash", "A", "")
+    assert len(runs) == 2
+    assert runs["horodatage"].is_monotonic_decreasing
+    annees, matrice = store.load_series(runs, "Budget")
+    np.testing.assert_array_equal(annees, np.arange(2000, 2028))
+    attendu = {2000: _run()["Budget"].to_numpy(), 2010: _run(2010, 10, 2.0)["Budget"].to_numpy()}
+    for ligne, debut in zip(matrice, runs["annee_debut"]):
+        d = debut - 2000
+        np.testing.assert_allclose(ligne[d:d + len(attendu[debut])], attendu[debut], rtol=1e-6)
+        assert np.isnan(ligne[:d]).all()
+    assert store.metrics(runs["id"].tolist()) == ["Budget", "Tests"]
+    assert store.scenarios("dash", "A") == ["", "Crise Majeure"]
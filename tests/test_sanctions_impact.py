@@ -0,0 +1,68 @@
+"""Impact des sanctions : convolution FFT comparée à la convolution directe"""
+import numpy as np
+import pytest
+from scipy.stats import gamma
+
+from sanctions_impact import (QUANTILES, SANCTION_RESPONSES, lag_kernels, lag_parameters, sanctions_response,
+                              scenario_intensities, unit_impulses)
+
+ANNEES = np.arange(2000, 2028)
+SERIES = {m: 10 + 0.5 * (ANNEES - 2000) for m in SANCTION_RESPONSES}
+SCENARIOS = ["Statut Quo", "Escalation Modérée", "Crise Majeure"]
+
+
+def _direct(temps, parametres, pas_par_an):
+    """Effets relatifs (M, D, N) par convolution directe en float64 d'impulsions d'intensité 1"""
+    impulsions = unit_impulses(temps)
+    t = np.arange(len(temps)) / pas_par_an
+    effets = np.empty(parametres["forme"].shape + (len(temps),))
+    for i, j in np.ndindex(parametres["forme"].shape):
+        forme, delai = parametres["forme"][i, j], parametres["delai_ans"][i, j]
+        noyau = gamma.cdf(t, forme, scale=delai / forme) * 2.0 ** (-t / parametres["demi_vie_ans"][i, j])
+        effets[i, j] = parametres["elasticite"][i, j] * np.convolve(impulsions, noyau)[:len(temps)]
+    return effets
+
+
+def test_noyaux_loi_gamma():
+    parametres = lag_parameters(list(SANCTION_RESPONSES), n_tirages=20)
+    noyaux = lag_kernels(parametres, 600, 12)
+    t = np.arange(600) / 12
+    for i, j in np.ndindex(parametres["forme"].shape):
+        forme = parametres["forme"][i, j]
+        attendu = gamma.cdf(t, forme, scale=parametres["delai_ans"][i, j] / forme) \
+            * 2.0 ** (-t / parametres["demi_vie_ans"][i, j])
+        np.testing.assert_allclose(noyaux[i, j], attendu, atol=2e-6)
+
+
+@pytest.mark.parametrize("pas_par_an, horizon", [(1, None), (12, 2060)])
+def test_nominal_fft_egal_convolution_directe(pas_par_an, horizon):
+    resultat = sanctions_response(ANNEES, SERIES, SCENARIOS, pas_par_an, horizon, n_tirages=0)
+    temps = resultat["temps"]
+    effets = _direct(temps, lag_parameters(resultat["metriques"]), pas_par_an)[:, 0]
+    attendu = resultat["base"][:, None] * (1 + scenario_intensities(SCENARIOS)[None, :, None] * effets[:, None])
+    np.testing.assert_allclose(resultat["nominal"], attendu, rtol=1e-5)
+
+
+def test_quantiles_par_scenario():
+    """Quantiles des tirages calculés une fois à intensité 1 puis mis à l'échelle = quantiles directs"""
+    resultat = sanctions_response(ANNEES, SERIES, SCENARIOS, 4, 2040, n_tirages=64)
+    effets = _direct(resultat["temps"], lag_parameters(resultat["metriques"], n_tirages=64), 4)[:, 1:]
+    intensites = scenario_intensities(SCENARIOS)
+    series = resultat["base"][:, None, None] * (1 + intensites[None, :, None, None] * effets[:, None])
+    attendu = np.quantile(series, QUANTILES, axis=2)
+    np.testing.assert_allclose(resultat["quantiles"], attendu, rtol=1e-5)
+
+
+def test_impulsions_sur_la_grille():
+    temps = 2000 + np.arange(28 * 12) / 12
+    impulsions = unit_impulses(temps)
+    assert np.count_nonzero(impulsions) == 6
+    assert impulsions[np.searchsorted(temps, 2006.0)] == pytest.approx(0.3)
+
+
+@pytest.mark.parametrize("parametre, valeur", [("forme", 0.0), ("delai_ans", -1.0), ("demi_vie_ans", np.nan)])
+def test_noyaux_invalides(parametre, valeur):
+    reponses = {m: dict(p) for m, p in SANCTION_RESPONSES.items()}
+    reponses["Budget_Defense_Mds"][parametre] = valeur
+    with pytest.raises(ValueError):
+        sanctions_response(ANNEES, SERIES, SCENARIOS, 1, n_tirages=0, reponses=reponses)
@@ -0,0 +1,101 @@
+"""Store memmap partagé : publication unique sous verrou, générations et lecture zéro-copie"""
+import multiprocessing
+import os
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from shared_store import SharedDatasetStore, fcntl
+
+
+def _jeu(decalage=0.0):
+    return pd.DataFrame({"Annee": np.arange(2000, 2028), "Budget": np.linspace(1, 2, 28) + decalage,
+                         "Tests": np.arange(28, dtype=np.int32)})
+
+
+def _verifier(df, attendu):
+    assert list(df.columns) == list(attendu.columns)
+    for nom in attendu.columns:
+        assert df[nom].dtype == attendu[nom].dtype
+        np.testing.assert_array_equal(np.asarray(df[nom]), attendu[nom].to_numpy())
+
+
+def test_publication_et_lecture(tmp_path):
+    store = SharedDatasetStore("t", "v1", root=str(tmp_path))
+    df = store.get_or_publish("avance/A", _jeu)
+    _verifier(df, _jeu())
+    assert not df["Budget"].to_numpy().flags.writeable
+    assert store.get_or_publish("avance/A", _jeu) is df
+    assert store.stats_for("avance") == {"hits": 1, "attaches": 1, "publications": 1}
+
+
+def test_nouvelle_version_de_code(tmp_path):
+    store = SharedDatasetStore("t", "v1", root=str(tmp_path))
+    store.get_or_publish("avance/A", _jeu)
+    ancien = set(os.listdir(store.root))
+    df = store.get_or_publish("avance/A", lambda: _jeu(1.0), code_version="v2")
+    np.testing.assert_allclose(df["Budget"], _jeu(1.0)["Budget"])
+    assert store.generations() == {"avance/A": 2}
+    assert not any(f.endswith("-g1.bin") for f in os.listdir(store.root))
+    assert ancien != set(os.listdir(store.root))
+
+
+def test_colonne_non_numerique(tmp_path):
+    store = SharedDatasetStore("t", "v1", root=str(tmp_path))
+    with pytest.raises(ValueError):
+        store.get_or_publish("avance/A", lambda: pd.DataFrame({"Annee": [2000], "Nom": ["x"]}))
+
+
+def test_threads_concurrents_une_seule_generation(tmp_path):
+    store = SharedDatasetStore("t", "v1", root=str(tmp_path))
+    appels = []
+
+    def builder():
+        appels.append(1)
+        time.sleep(0.05)
+        return _jeu()
+
+    resultats = []
+    threads = [threading.Thread(target=lambda: resultats.append(store.get_or_publish("avance/A", builder)))
+               for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert len(appels) == 1
+    assert len(resultats) == 8
+    for df in resultats:
+        _verifier(df, _jeu())
+
+
+def _publier_depuis_un_processus(root, journal):
+    store = SharedDatasetStore("t", "v1", root=root)
+
+    def builder():
+        with open(journal, "a") as f:
+            f.write("x")
+        time.sleep(0.05)
+        return _jeu()
+
+    store.get_or_publish("avance/A", builder)
+
+
+@pytest.mark.skipif(fcntl is None or "fork" not in multiprocessing.get_all_start_methods(),
+                    reason="verrou inter-processus indisponible")
+def test_processus_concurrents_une_seule_generation(tmp_path):
+    journal = str(tmp_path / "appels")
+    contexte = multiprocessing.get_context("fork")
+    processus = [contexte.Process(target=_publier_depuis_un_processus, args=(str(tmp_path), journal))
+                 for _ in range(4)]
+    for p in processus:
+        p.start()
+    for p in processus:
+        p.join(30)
+        assert p.exitcode == 0
+    with open(journal) as f:
+        assert f.read() == "x"
+    store = SharedDatasetStore("t", "v1", root=str(tmp_path))
+    assert store.generations() == {"avance/A": 1}
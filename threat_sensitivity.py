@@ -0,0 +1,85 @@
+# threat_sensitivity.py
+"""Balayages de sensibilité de la matrice des menaces.
+
+Score de risque d'une menace pour un vecteur de poids (w_p, w_i, w_r) :
+    w_p * Probabilité + w_i * Impact + w_r * (1 - Niveau Préparation)
+Tous les vecteurs de poids sont évalués en un produit matriciel (K × 3) @ (3 × N),
+par blocs pour borner la mémoire, et les rangs sont agrégés sans boucle Python par combinaison.
+"""
+import numpy as np
+
+CHUNK_SIZE = 250_000
+WEIGHT_NAMES = ("Probabilité", "Impact", "Vulnérabilité (1 - Préparation)")
+
+
+def threat_features(probabilite, impact, preparation):
+    """Matrice (3 × N) des critères pondérés"""
+    return np.vstack((np.asarray(probabilite, dtype=np.float64),
+                      np.asarray(impact, dtype=np.float64),
+                      1.0 - np.asarray(preparation, dtype=np.float64)))
+
+
+def grid_weights(n_par_axe, bornes=(0.0, 1.0)):
+    """Grille dense (n³ × 3) des poids"""
+    axe = np.linspace(bornes[0], bornes[1], n_par_axe)
+    return np.stack(np.meshgrid(axe, axe, axe, indexing="ij"), axis=-1).reshape(-1, 3)
+
+
+def sample_weights(n, distribution="dirichlet", base=(1.0, 1.0, 1.0), dispersion=0.3, seed=0):
+    """Échantillon (n × 3) de poids tirés d'une loi"""
+    rng = np.random.default_rng(seed)
+    base = np.asarray(base, dtype=np.float64)
+    if distribution == "dirichlet":
+        return rng.dirichlet(base / max(dispersion, 1e-3), size=n)
+    if distribution == "uniforme":
+        return rng.uniform(0.0, 1.0, size=(n, 3))
+    if distribution == "normale":
+        return np.clip(rng.normal(base, dispersion, size=(n, 3)), 0.0, None)
+    raise ValueError(f"Distribution inconnue: {distribution}")
+
+
+def ranks(scores):
+    """Rang (0 = risque le plus élevé) de chaque menace, ligne par ligne"""
+    ordre = np.argsort(-scores, axis=1, kind="stable")
+    rangs = np.empty_like(ordre)
+    np.put_along_axis(rangs, ordre, np.arange(scores.shape[1])[None, :], axis=1)
+    return rangs
+
+
+def sweep(weights, features, base_weights=(1.0, 1.0, 1.0), chunk=CHUNK_SIZE):
+    """Statistiques de stabilité des rangs sur tous les vecteurs de poids.
+
+    Retourne la fréquence (N × N) menace × rang, le décalage moyen de rang par menace
+    par rapport au classement de référence, la part des combinaisons qui modifient le classement
+    et celle qui conserve la menace classée première.
+    """
+    n = features.shape[1]
+    rang_reference = ranks(np.asarray(base_weights, dtype=np.float64)[None, :] @ features)[0]
+    frequence = np.zeros(n * n, dtype=np.int64)
+    decalage = np.zeros(n)
+    modifies = 0
+    top_stable = 0
+    menace_top = int(np.argmin(rang_reference))
+    for debut in range(0, len(weights), chunk):
+        rangs = ranks(weights[debut:debut + chunk] @ features)
+        frequence += np.bincount((np.arange(n) * n + rangs).ravel(), minlength=n * n)
+        ecart = np.abs(rangs - rang_reference)
+        decalage += ecart.sum(axis=0)
+        modifies += int(np.count_nonzero(ecart.any(axis=1)))
+        top_stable += int(np.count_nonzero(rangs[:, menace_top] == 0))
+    total = max(len(weights), 1)
+    return {
+        "frequence": frequence.reshape(n, n) / total,
+        "rang_reference": rang_reference,
+        "decalage_moyen": decalage / total,
+        "part_modifiee": modifies / total,
+        "part_top_stable": top_stable / total,
+    }
+
+
+def dominant_threat_plane(features, n_par_axe, poids_vulnerabilite):
+    """Menace classée première sur le plan (w_p, w_i) pour un poids de vulnérabilité fixé"""
+    axe = np.linspace(0.0, 1.0, n_par_axe)
+    wp, wi = np.meshgrid(axe, axe, indexing="ij")
+    poids = np.column_stack((wp.ravel(), wi.ravel(), np.full(wp.size, poids_vulnerabilite)))
+    return axe, np.argmax(poids @ features, axis=1).reshape(n_par_axe, n_par_axe)
@@ -0,0 +1,157 @@
+# webgl_charts.py
+"""Bascule automatique des traces Scatter (SVG) vers Scattergl (WebGL) au-delà d'un seuil de points,
+et page de benchmark du temps de rendu navigateur par nombre de points.
+
+Scattergl n'empile pas les aires : les traces d'un `stackgroup` restent en SVG.
+"""
+import json
+import time
+
+import numpy as np
+import plotly.graph_objects as go
+import plotly.io as pio
+
+WEBGL_POINT_THRESHOLD = 5000
+BENCHMARK_POINTS = [1000, 5000, 20000, 50000, 100000, 300000]
+
+# Propriétés de go.Scatter sans équivalent dans go.Scattergl
+_SVG_ONLY_PROPS = ("stackgaps", "groupnorm", "orientation", "cliponaxis", "alignmentgroup",
+                   "offsetgroup", "fillpattern", "fillgradient")
+
+
+def trace_points(trace):
+    """Nombre de points d'une trace (x ou y)"""
+    for prop in ("y", "x"):
+        valeurs = trace[prop] if prop in trace else None
+        if valeurs is not None:
+            return len(valeurs)
+    return 0
+
+
+def to_scattergl(trace):
+    """Trace Scattergl équivalente (style, hovertemplate et axes conservés)"""
+    props = trace.to_plotly_json()
+    props.pop("type", None)
+    for prop in _SVG_ONLY_PROPS:
+        props.pop(prop, None)
+    line = props.get("line")
+    if line:
+        line.pop("smoothing", None)
+        line.pop("simplify", None)
+        if line.get("shape") == "spline":
+            line["shape"] = "linear"
+    return go.Scattergl(props, skip_invalid=True)
+
+
+def convertible(trace):
+    """Trace Scatter convertible sans perte (les aires empilées restent en SVG)"""
+    return trace.type == "scatter" and not trace.stackgroup
+
+
+def apply_webgl(fig, threshold=WEBGL_POINT_THRESHOLD):
+    """Convertit en WebGL les traces Scatter si la figure dépasse `threshold` points ; retourne le nombre converti"""
+    scatters = [t for t in fig.data if convertible(t)]
+    # Les images d'une animation ciblent des traces Scatter : la figure animée reste en SVG
+    if not scatters or fig.frames or sum(trace_points(t) for t in fig.data) <= threshold:
+        return 0
+    traces = [to_scattergl(t) if convertible(t) else t for t in fig.data]
+    fig.data = []
+    fig.add_traces(traces)
+    return len(scatters)
+
+
+def benchmark_server(points=BENCHMARK_POINTS, series=4):
+    """Temps de construction + sérialisation côté serveur, SVG vs WebGL"""
+    rng = np.random.default_rng(0)
+    lignes = []
+    for n in points:
+        y = np.cumsum(rng.standard_normal((series, n)), axis=1)
+        for nom, classe in (("SVG", go.Scatter), ("WebGL", go.Scattergl)):
+            debut = time.perf_counter()
+            fig = go.Figure([classe(y=y[i], mode="lines", hovertemplate="%{y:.1f}<extra></extra>")
+                             for i in range(series)])
+            taille = len(pio.to_json(fig, validate=False))
+            lignes.append({"Points/série": n, "Séries": series, "Rendu": nom,
+                           "Serveur (ms)": (time.perf_counter() - debut) * 1000,
+                           "JSON (Ko)": taille / 1024})
+    return lignes
+
+
+def benchmark_html(points=BENCHMARK_POINTS, series=4, repetitions=3):
+    """Page autonome mesurant dans le navigateur le temps de rendu Plotly.js (SVG vs WebGL)"""
+    from plotly.offline import get_plotlyjs
+
+    return """
+<div id="bench-plot" style="width:100%;height:320px;"></div>
+<div id="bench-result" style="font-family:sans-serif;font-size:0.9rem;"></div>
+<script type="text/javascript">{plotlyjs}</script>
+<script type="text/javascript">
+const POINTS = {points}, SERIES = {series}, REPS = {reps};
+function walk(n) {{
+    const y = new Float32Array(n); let v = 0;
+    for (let i = 0; i < n; i++) {{ v += Math.random() - 0.5; y[i] = v; }}
+    return y;
+}}
+function frame() {{ return new Promise(r => requestAnimationFrame(() => requestAnimationFrame(r))); }}
+async function mesure(type, n) {{
+    const div = document.getElementById('bench-plot');
+    const data = [];
+    for (let s = 0; s < SERIES; s++) data.push({{type: type, mode: 'lines', y: walk(n),
+        hovertemplate: '%{{y:.1f}}<extra></extra>'}});
+    const t0 = performance.now();
+    await Plotly.newPlot(div, data, {{margin: {{t: 10}}, showlegend: false}});
+    await frame();
+    const dt = performance.now() - t0;
+    Plotly.purge(div);
+    return dt;
+}}
+(async () => {{
+    const lignes = [];
+    for (const n of POINTS) {{
+        const res = {{}};
+        for (const type of ['scatter', 'scattergl']) {{
+            const temps = [];
+            for (let r = 0; r < REPS; r++) temps.push(await mesure(type, n));
+            temps.sort((a, b) => a - b);
+            res[type] = temps[Math.floor(temps.length / 2)];
+        }}
+        lignes.push([n, res.scatter, res.scattergl]);
+    }}
+    let html = '<table><tr><th>Points/série</th><th>SVG (ms)</th><th>WebGL (ms)</th><th>Ratio</th></tr>';
+    for (const [n, svg, gl] of lignes)
+        html += `<tr><td>${{n.toLocaleString()}}</td><td>${{svg.toFixed(0)}}</td><td>${{gl.toFixed(0)}}</td>`
+              + `<td>${{(svg / gl).toFixed(1)}}×</td></tr>`;
+    document.getElementById('bench-result').innerHTML = html + '</table>';
+    Plotly.newPlot('bench-plot', [
+        {{x: lignes.map(l => l[0]), y: lignes.map(l => l[1]), name: 'SVG', mode: 'lines+markers'}},
+        {{x: lignes.map(l => l[0]), y: lignes.map(l => l[2]), name: 'WebGL', mode: 'lines+markers'}}
+    ], {{xaxis: {{type: 'log', title: 'Points par série'}}, yaxis: {{type: 'log', title: 'Rendu (ms)'}},
+        margin: {{t: 10}}}});
+}})();
+</script>
+""".format(plotlyjs=get_plotlyjs(), points=json.dumps(list(points)), series=int(series),
+           reps=int(repetitions))
+
+
+def render_benchmark_page():
+    """Page Streamlit du benchmark de rendu par nombre de points"""
+    import pandas as pd
+    import streamlit as st
+    import streamlit.components.v1 as components
+
+    st.markdown('<h3 class="section-header">⚡ BENCHMARK RENDU SVG / WEBGL</h3>', unsafe_allow_html=True)
+    col1, col2 = st.columns([3, 1])
+    with col1:
+        points = st.multiselect("Points par série:", [500, 1000, 5000, 10000, 20000, 50000, 100000, 300000, 1000000],
+                                default=BENCHMARK_POINTS)
+    with col2:
+        series = st.slider("Séries:", 1, 10, 4)
+    points = sorted(points)
+    if not points:
+        return
+
+    st.markdown("#### 🖥️ Construction et sérialisation (serveur)")
+    st.dataframe(pd.DataFrame(benchmark_server(points, series)), hide_index=True, use_container_width=True)
+
+    st.markdown("#### 🌐 Rendu Plotly.js (navigateur, médiane de 3 essais)")
+    components.html(benchmark_html(points, series), height=520 + 30 * len(points), scrolling=True)